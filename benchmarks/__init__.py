@@ -0,0 +1,6 @@
+# coding: utf-8
+
+"""Benchmarks for the IBM Cloud Schematics Python SDK"""
+
+# Run a benchmark from the repository root, for example:
+#   python -m benchmarks.bench_model_memory
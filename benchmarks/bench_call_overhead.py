@@ -0,0 +1,133 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Client-side time of a tiny call, get_schematics_version, with and without the header templates.
+
+    python -m benchmarks.bench_call_overhead --number 20000
+
+The operations build their requests with `ibm_schematics.operations.prepare_operation`;
+the generic path builds the same request the way they used to, from `get_sdk_headers`
+and `BaseService.prepare_request`. Without a transport, `send` returns a canned
+response, so that only the work of the client is timed; with `--transport responses`
+the request also goes through `requests`, to a `responses` mock.
+"""
+
+import argparse
+import timeit
+
+from ibm_cloud_sdk_core import DetailedResponse
+from ibm_cloud_sdk_core.authenticators import NoAuthAuthenticator
+import responses
+
+from ibm_schematics.common import get_sdk_headers
+from ibm_schematics.schematics_v1 import SchematicsV1
+
+_URL = 'https://schematics.cloud.ibm.com'
+_VERSION = {'commitsha': '1a2b3c4d', 'builddate': '2024-03-05', 'buildno': '1234', 'terraform_version': '1.5.7'}
+
+
+def generic_get_schematics_version(service: SchematicsV1, **kwargs) -> DetailedResponse:
+    """Call get_schematics_version the way the operations used to build their requests."""
+    headers = {}
+    sdk_headers = get_sdk_headers(
+        service_name=service.DEFAULT_SERVICE_NAME,
+        service_version='V1',
+        operation_id='get_schematics_version',
+    )
+    headers.update(sdk_headers)
+
+    if 'headers' in kwargs:
+        headers.update(kwargs.get('headers'))
+        del kwargs['headers']
+    headers['Accept'] = 'application/json'
+
+    url = '/v1/version'
+    request = service.prepare_request(
+        method='GET',
+        url=url,
+        headers=headers,
+    )
+
+    response = service.send(request, **kwargs)
+    return response
+
+
+def best(functions, number: int, repeat: int) -> list:
+    """
+    Return the best time of one call of each function, in microseconds; the
+    functions are timed in turn, so that they run under the same conditions.
+    """
+    timers = [timeit.Timer(function) for function in functions]
+    times = [[] for _ in timers]
+    for _ in range(repeat):
+        for index, timer in enumerate(timers):
+            times[index].append(timer.timeit(number))
+    return [min(measured) / number * 1e6 for measured in times]
+
+
+def main() -> None:
+    """Print the time of each call on the generic and the templated path."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--number', type=int, default=20000, help='the number of calls per measurement')
+    parser.add_argument('--repeat', type=int, default=9, help='the number of measurements')
+    parser.add_argument(
+        '--transport', default='none', help='none, to time the client alone, or responses, to add requests'
+    )
+    args = parser.parse_args()
+    if args.transport not in ('none', 'responses'):
+        parser.error('--transport must be none or responses')
+
+    service = SchematicsV1(authenticator=NoAuthAuthenticator())
+    service.set_service_url(_URL)
+    mock = responses.RequestsMock()
+    if args.transport == 'none':
+        canned = DetailedResponse(response=_VERSION, headers={'Content-Type': 'application/json'}, status_code=200)
+        service.send = lambda request, **kwargs: canned
+    else:
+        mock.start()
+        mock.add(responses.GET, _URL + '/v1/version', json=_VERSION)
+        args.number = max(1, args.number // 20)
+
+    caller_headers = {'X-Request-Id': 'bench'}
+    rows = [
+        (
+            'get_schematics_version',
+            lambda: generic_get_schematics_version(service),
+            service.get_schematics_version,
+        ),
+        (
+            'get_schematics_version, headers',
+            lambda: generic_get_schematics_version(service, headers=caller_headers),
+            lambda: service.get_schematics_version(headers=caller_headers),
+        ),
+    ]
+    try:
+        print('{0:<40}{1:>14}{2:>14}{3:>10}'.format('call (microseconds)', 'generic', 'templated', 'speedup'))
+        for name, generic, templated in rows:
+            generic_time, templated_time = best([generic, templated], args.number, args.repeat)
+            print(
+                '{0:<40}{1:>14.2f}{2:>14.2f}{3:>9.2f}x'.format(
+                    name, generic_time, templated_time, generic_time / templated_time
+                )
+            )
+    finally:
+        if args.transport == 'responses':
+            mock.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Cold import time of the package, the service and the models, in fresh interpreters.
+
+    python -m benchmarks.bench_import_time --runs 10 --max-service-ms 400
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = [
+    ('ibm_cloud_sdk_core', 'import ibm_cloud_sdk_core'),
+    ('ibm_schematics', 'import ibm_schematics'),
+    ('SchematicsV1', 'from ibm_schematics import SchematicsV1'),
+    ('SchematicsV1 + models', 'from ibm_schematics.schematics_v1 import SchematicsV1, Job'),
+]
+
+_SCRIPT = '''
+import time
+start = time.perf_counter()
+{0}
+print(time.perf_counter() - start)
+'''
+
+
+def import_time(statement: str, runs: int) -> float:
+    """Return the median time of `statement` in a new interpreter, in milliseconds."""
+    times = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', _SCRIPT.format(statement)], check=True, capture_output=True, text=True
+        ).stdout
+        times.append(float(output) * 1000)
+    return statistics.median(times)
+
+
+def main() -> int:
+    """Print the import times; fail when the service takes longer than allowed."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10, help='the number of interpreters per statement')
+    parser.add_argument(
+        '--max-service-ms', type=float, default=None, help='fail when importing SchematicsV1 takes longer'
+    )
+    args = parser.parse_args()
+
+    results = {}
+    print('{0:<26}{1:>12}'.format('import', 'median ms'))
+    for name, statement in STATEMENTS:
+        results[name] = import_time(statement, args.runs)
+        print('{0:<26}{1:>12.1f}'.format(name, results[name]))
+
+    if args.max_service_ms is not None and results['SchematicsV1'] > args.max_service_ms:
+        print('Importing SchematicsV1 took more than {0} ms'.format(args.max_service_ms))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
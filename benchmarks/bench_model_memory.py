@@ -0,0 +1,68 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Memory held by many models, with the generated classes and their compact variants.
+
+    python -m benchmarks.bench_model_memory --count 10000
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from ibm_schematics.compact import compact_class
+from ibm_schematics.schematics_v1 import InventoryResourceRecord, WorkspaceResponse
+
+from .payloads import INVENTORY, WORKSPACE, copies
+
+MODELS = [(WorkspaceResponse, WORKSPACE), (InventoryResourceRecord, INVENTORY)]
+
+
+def measure(cls: type, payloads: list) -> int:
+    """Return the bytes allocated, and still held, by the models built from `payloads`."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        models = [cls.from_dict(payload) for payload in payloads]
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del models
+    return current
+
+
+def main() -> None:
+    """Print the memory used per model."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=10000, help='the number of models to build')
+    args = parser.parse_args()
+
+    print('{0:<26}{1:>16}{2:>16}{3:>12}'.format('model', 'dict bytes', 'slots bytes', 'reduction'))
+    for cls, payload in MODELS:
+        payloads = copies(payload, args.count)
+        compact_class(cls).from_dict(payload)  # build the compact classes outside the measurement
+        regular = measure(cls, payloads)
+        compact = measure(compact_class(cls), payloads)
+        print(
+            '{0:<26}{1:>16,}{2:>16,}{3:>11.0%}'.format(
+                cls.__name__, regular // args.count, compact // args.count, 1 - compact / regular
+            )
+        )
+
+
+if __name__ == '__main__':
+    main()
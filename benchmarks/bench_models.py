@@ -0,0 +1,204 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Time and allocations of from_dict and to_dict for every model, with a regression check for CI.
+
+    python -m benchmarks.bench_models --output results.json
+    python -m benchmarks.bench_models --baseline results.json --max-slowdown 1.5 --max-alloc-growth 1.1
+
+Every model of both service modules is converted from a payload synthesized from
+its annotations, and the large responses that dominate real workloads, a deep
+`Job`, a `WorkspaceResponseList` and an `InventoryResourceRecordList`, from the
+payloads of `benchmarks.payloads`. Each round trip is checked to be stable
+before it is timed. Times are compared with the baseline relative to a
+calibration workload timed in the same run, so that baselines can be reused on
+machines of different speeds; allocations are measured with tracemalloc and do
+not depend on the machine, which makes them the more reliable signal in CI.
+"""
+
+from typing import Callable, Dict, List, NamedTuple, Tuple
+import argparse
+import copy
+import fnmatch
+import gc
+import json
+import sys
+import timeit
+import tracemalloc
+
+from ibm_schematics.schematics_v1 import InventoryResourceRecordList, Job, WorkspaceResponseList
+
+from .payloads import INVENTORY, WORKSPACE, copies
+from .synthesize import all_models, synthesize
+
+# Below this round trip time, in microseconds, slowdowns are not reported: they are noise.
+_MIN_TIME_US = 5.0
+
+
+class Result(NamedTuple):
+    """The measurements of one payload."""
+
+    name: str
+    from_dict_us: float
+    to_dict_us: float
+    peak_bytes: int
+    retained_bytes: int
+
+    @property
+    def round_trip_us(self) -> float:
+        """The time of `from_dict` and `to_dict`, in microseconds."""
+        return self.from_dict_us + self.to_dict_us
+
+
+def workloads(count: int) -> List[Tuple[str, type, dict]]:
+    """Return the large payloads measured besides the synthesized ones."""
+    return [
+        ('V1.Job (deep)', Job, synthesize(Job, list_size=4, depth=5)),
+        (
+            'V1.WorkspaceResponseList ({0})'.format(count),
+            WorkspaceResponseList,
+            {'count': count, 'limit': count, 'offset': 0, 'workspaces': copies(WORKSPACE, count)},
+        ),
+        (
+            'V1.InventoryResourceRecordList ({0})'.format(count),
+            InventoryResourceRecordList,
+            {'total_count': count, 'limit': count, 'offset': 0, 'inventories': copies(INVENTORY, count)},
+        ),
+    ]
+
+
+def best(function: Callable, min_time: float, repeat: int) -> float:
+    """Return the best time of one call, in microseconds, timing batches of at least `min_time` seconds."""
+    timer = timeit.Timer(function)
+    once = timer.timeit(number=1)
+    number = max(1, int(min_time / once)) if once > 0 else 1000
+    return min(timer.repeat(number=number, repeat=repeat)) / number * 1e6
+
+
+def calibration(min_time: float, repeat: int) -> float:
+    """Return the time of a pure Python workload similar to a conversion, in microseconds."""
+    return best(lambda: copy.deepcopy(WORKSPACE), min_time, repeat)
+
+
+def allocations(cls: type, payload: dict) -> Tuple[int, int]:
+    """Return the peak bytes allocated by a round trip, and the bytes held by the model."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        model = cls.from_dict(payload)
+        retained, _ = tracemalloc.get_traced_memory()
+        model.to_dict()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del model
+    return peak, retained
+
+
+def measure(name: str, cls: type, payload: dict, min_time: float, repeat: int) -> Result:
+    """Measure the round trip of a payload, after checking that it is stable."""
+    model = cls.from_dict(payload)
+    serialized = model.to_dict()
+    if cls.from_dict(serialized).to_dict() != serialized:
+        raise AssertionError('The round trip of {0} is not stable'.format(name))
+    return Result(
+        name,
+        best(lambda: cls.from_dict(payload), min_time, repeat),
+        best(model.to_dict, min_time, repeat),
+        *allocations(cls, payload),
+    )
+
+
+def regressions(
+    results: List[Result], speed: float, baseline: Dict, max_slowdown: float, max_alloc_growth: float
+) -> List[str]:
+    """
+    Return a description of each result that regressed against the baseline; `speed`
+    is the ratio of the calibration time of this run to that of the baseline.
+    """
+    found = []
+    for result in results:
+        previous = baseline['results'].get(result.name)
+        if previous is None:
+            continue
+        previous_time = (previous['from_dict_us'] + previous['to_dict_us']) * speed
+        if result.round_trip_us > max(previous_time * max_slowdown, previous_time + _MIN_TIME_US):
+            found.append('{0}: {1:.1f} us, was {2:.1f} us'.format(result.name, result.round_trip_us, previous_time))
+        if result.peak_bytes > previous['peak_bytes'] * max_alloc_growth + 1024:
+            found.append(
+                '{0}: {1:,} bytes allocated, was {2:,}'.format(result.name, result.peak_bytes, previous['peak_bytes'])
+            )
+    return found
+
+
+def main() -> int:
+    """Print the measurements of each model; fail when they regressed against a baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--models', default='*', help='a glob pattern of the model names to measure')
+    parser.add_argument('--count', type=int, default=500, help='the number of records of the list payloads')
+    parser.add_argument('--min-time', type=float, default=0.01, help='the seconds of each timed batch')
+    parser.add_argument('--repeat', type=int, default=3, help='the number of timed batches')
+    parser.add_argument('--top', type=int, default=None, help='print only the slowest payloads')
+    parser.add_argument('--output', default=None, help='write the measurements to a JSON file')
+    parser.add_argument('--baseline', default=None, help='a JSON file written by --output to compare with')
+    parser.add_argument('--max-slowdown', type=float, default=1.5, help='the largest allowed time ratio')
+    parser.add_argument('--max-alloc-growth', type=float, default=1.1, help='the largest allowed allocation ratio')
+    args = parser.parse_args()
+
+    calibration_us = calibration(args.min_time, args.repeat)
+    payloads = workloads(args.count) + [(name, cls, synthesize(cls)) for name, cls in all_models()]
+    results = [
+        measure(name, cls, payload, args.min_time, args.repeat)
+        for name, cls, payload in payloads
+        if fnmatch.fnmatchcase(name, args.models)
+    ]
+    results.sort(key=lambda result: result.round_trip_us, reverse=True)
+
+    print('{0:<42}{1:>14}{2:>14}{3:>14}{4:>14}'.format('model', 'from_dict us', 'to_dict us', 'peak KiB', 'held KiB'))
+    for result in results[: args.top]:
+        print(
+            '{0:<42}{1:>14.1f}{2:>14.1f}{3:>14.1f}{4:>14.1f}'.format(
+                result.name,
+                result.from_dict_us,
+                result.to_dict_us,
+                result.peak_bytes / 1024,
+                result.retained_bytes / 1024,
+            )
+        )
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(
+                {'calibration_us': calibration_us, 'results': {result.name: result._asdict() for result in results}},
+                file,
+                indent=2,
+                sort_keys=True,
+            )
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as file:
+            baseline = json.load(file)
+        speed = calibration_us / baseline['calibration_us']
+        found = regressions(results, speed, baseline, args.max_slowdown, args.max_alloc_growth)
+        if found:
+            print('\n{0} regressions against {1}:'.format(len(found), args.baseline))
+            print('\n'.join(found))
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
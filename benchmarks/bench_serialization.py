@@ -0,0 +1,82 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Time of the generated from_dict/to_dict methods against the serialization module.
+
+    python -m benchmarks.bench_serialization --number 2000
+"""
+
+import argparse
+import timeit
+
+from ibm_schematics.schematics_v1 import Action, Job, WorkspaceResponse
+from ibm_schematics.serialization import fast_from_dict, fast_to_dict, lazy_from_dict
+
+from .payloads import ACTION, JOB, WORKSPACE
+
+MODELS = [(Job, JOB), (Action, ACTION), (WorkspaceResponse, WORKSPACE)]
+
+
+def without_timestamps(payload):
+    """Return a copy of a payload without its timestamps, to time the rest of the conversion."""
+    if isinstance(payload, dict):
+        return {
+            key: without_timestamps(value)
+            for key, value in payload.items()
+            if not (key.endswith(('_at', '_time', '_till')) and isinstance(value, str))
+        }
+    if isinstance(payload, list):
+        return [without_timestamps(item) for item in payload]
+    return payload
+
+
+def best(function, number: int, repeat: int) -> float:
+    """Return the best time of one call, in microseconds."""
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number * 1e6
+
+
+def main() -> None:
+    """Print the time of each conversion."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--number', type=int, default=2000, help='the number of calls per measurement')
+    parser.add_argument('--repeat', type=int, default=5, help='the number of measurements')
+    args = parser.parse_args()
+
+    print('{0:<50}{1:>14}{2:>14}{3:>10}'.format('conversion (microseconds)', 'generated', 'fast', 'speedup'))
+    for cls, full_payload in MODELS:
+        for label, payload in (('', full_payload), (', no timestamps', without_timestamps(full_payload))):
+            model = cls.from_dict(payload)
+            rows = [
+                ('from_dict', lambda: cls.from_dict(payload), lambda: fast_from_dict(cls, payload)),
+                ('to_dict', model.to_dict, lambda: fast_to_dict(model)),
+                ('lazy_from_dict', lambda: cls.from_dict(payload), lambda: lazy_from_dict(cls, payload)),
+            ]
+            for name, generated, fast in rows:
+                generated_time = best(generated, args.number, args.repeat)
+                fast_time = best(fast, args.number, args.repeat)
+                print(
+                    '{0:<50}{1:>14.2f}{2:>14.2f}{3:>9.1f}x'.format(
+                        '{0}.{1}{2}'.format(cls.__name__, name, label),
+                        generated_time,
+                        fast_time,
+                        generated_time / fast_time,
+                    )
+                )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Requests per second, latency and memory of SchematicsV1 calls against a local stand-in server.
+
+    python -m benchmarks.bench_throughput --requests 500 --concurrency 4 --latency-ms 5
+
+The stand-in server of `benchmarks.mock_server` is started in another process, so
+that it does not compete with the client for the interpreter, unless `--url`
+points to a server that is already running.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+import argparse
+import contextlib
+import gc
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from ibm_cloud_sdk_core.authenticators import NoAuthAuthenticator
+
+from ibm_schematics.schematics_v1 import SchematicsV1
+
+_INFRASTRUCTURE = {'infra_type': 'ibm_kubernetes', 'cluster_id': 'cl1a2b3c4d5e6f7a8b9c'}
+
+# The calls measured, by name; each is called with the service, the number of the call and the list limit.
+SCENARIOS = {
+    'list_workspaces': lambda service, index, limit: service.list_workspaces(limit=limit),
+    'get_workspace': lambda service, index, limit: service.get_workspace(w_id='ws-{0}'.format(index)),
+    'create_workspace': lambda service, index, limit: service.create_workspace(
+        name='bench-{0}'.format(index), location='us-south', resource_group='Default', type=['terraform_v1.5']
+    ),
+    'list_jobs': lambda service, index, limit: service.list_jobs(limit=limit),
+    'get_job': lambda service, index, limit: service.get_job(job_id='job-{0}'.format(index)),
+    'create_job': lambda service, index, limit: service.create_job(
+        refresh_token='token', command_object='workspace', command_object_id='ws-1', command_name='workspace_plan'
+    ),
+    'list_actions': lambda service, index, limit: service.list_actions(limit=limit),
+    'get_action': lambda service, index, limit: service.get_action(action_id='action-{0}'.format(index)),
+    'create_action': lambda service, index, limit: service.create_action(
+        name='bench-{0}'.format(index), location='us-south', resource_group='Default'
+    ),
+    'list_agent_data': lambda service, index, limit: service.list_agent_data(limit=limit),
+    'get_agent_data': lambda service, index, limit: service.get_agent_data(agent_id='agent-{0}'.format(index)),
+    'create_agent_data': lambda service, index, limit: service.create_agent_data(
+        'bench-{0}'.format(index), 'Default', 'v1.0.0', 'us-south', 'us-south', _INFRASTRUCTURE
+    ),
+}
+
+
+@contextlib.contextmanager
+def mock_server(args: argparse.Namespace):
+    """Start the stand-in server in another process and yield its URL."""
+    command = [sys.executable, '-m', 'benchmarks.mock_server', '--port', '0']
+    command += ['--latency-ms', str(args.latency_ms), '--items', str(args.limit)]
+    if args.item_bytes is not None:
+        command += ['--item-bytes', str(args.item_bytes)]
+    with subprocess.Popen(command, stdout=subprocess.PIPE, text=True) as process:
+        try:
+            yield process.stdout.readline().strip()
+        finally:
+            process.terminate()
+
+
+def run(call: Callable[[int], object], requests: int, concurrency: int) -> List[float]:
+    """Make `requests` calls over `concurrency` threads; return the latency of each, in seconds."""
+
+    def timed(index: int) -> float:
+        start = time.perf_counter()
+        call(index)
+        return time.perf_counter() - start
+
+    if concurrency == 1:
+        return [timed(index) for index in range(requests)]
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(timed, range(requests)))
+
+
+def peak_memory(call: Callable[[int], object], calls: int) -> int:
+    """Return the peak bytes allocated while making `calls` calls, one at a time."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        for index in range(calls):
+            call(index)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    """Print the throughput, latency and memory of each call."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', type=int, default=500, help='the number of calls per scenario')
+    parser.add_argument('--concurrency', type=int, default=1, help='the number of threads making calls')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='the latency of the stand-in server')
+    parser.add_argument('--limit', type=int, default=50, help='the number of records per list response')
+    parser.add_argument('--item-bytes', type=int, default=None, help='the approximate size of each record')
+    parser.add_argument('--memory-calls', type=int, default=20, help='the number of calls traced for memory')
+    parser.add_argument('--url', default=None, help='the URL of a stand-in server that is already running')
+    parser.add_argument('scenarios', nargs='*', help='the calls to measure: {0}'.format(', '.join(SCENARIOS)))
+    args = parser.parse_args()
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error('unknown calls: {0}'.format(', '.join(sorted(unknown))))
+
+    with contextlib.ExitStack() as stack:
+        url = args.url or stack.enter_context(mock_server(args))
+        service = SchematicsV1(authenticator=NoAuthAuthenticator())
+        service.set_service_url(url)
+
+        print('{0:<22}{1:>10}{2:>10}{3:>10}{4:>12}'.format('call', 'req/s', 'p50 ms', 'p99 ms', 'peak KiB'))
+        for name in args.scenarios or SCENARIOS:
+
+            def call(index: int, scenario=SCENARIOS[name]) -> object:
+                return scenario(service, index, args.limit)
+
+            run(call, min(20, args.requests), args.concurrency)  # warm up the connections
+            start = time.perf_counter()
+            latencies = run(call, args.requests, args.concurrency)
+            elapsed = time.perf_counter() - start
+            percentiles = statistics.quantiles(latencies, n=100, method='inclusive')
+            print(
+                '{0:<22}{1:>10.0f}{2:>10.2f}{3:>10.2f}{4:>12,}'.format(
+                    name,
+                    len(latencies) / elapsed,
+                    percentiles[49] * 1000,
+                    percentiles[98] * 1000,
+                    peak_memory(call, args.memory_calls) // 1024,
+                )
+            )
+
+
+if __name__ == '__main__':
+    main()
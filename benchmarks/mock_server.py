@@ -0,0 +1,254 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A local stand-in for the Schematics API, with configurable latency and payload sizes.
+
+    python -m benchmarks.mock_server --port 8080 --latency-ms 20 --items 100 --item-bytes 4096
+
+The server answers the list, get and create requests of `/v1/workspaces`, `/v2/jobs`,
+`/v2/actions` and `/v2/agents` with the payloads of `benchmarks.payloads`; any
+other request is answered with 404. Responses are built from pre-serialized
+records, so that the server costs as little as possible next to the client.
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple
+from urllib.parse import parse_qs
+import argparse
+import copy
+import itertools
+import json
+import random
+import threading
+import time
+
+from .payloads import ACTION, AGENT, JOB, WORKSPACE
+
+# The collections served, with the key of their records and of their total in a list response.
+RESOURCES = {
+    '/v1/workspaces': ('workspaces', 'count', WORKSPACE),
+    '/v2/jobs': ('jobs', 'total_count', JOB),
+    '/v2/actions': ('actions', 'total_count', ACTION),
+    '/v2/agents': ('agents', 'total_count', AGENT),
+}
+DEFAULT_ITEMS = 100
+DEFAULT_LIMIT = 100
+
+_ID = '\x00id\x00'
+
+
+class _Collection:
+    """The pre-serialized records of a collection."""
+
+    def __init__(self, name: str, total_key: str, payload: dict, items: int, item_bytes: Optional[int]) -> None:
+        self.name = name
+        self.total_key = total_key
+        self.payload = _padded(payload, item_bytes)
+        template = dict(self.payload, id=_ID)
+        self.template = json.dumps(template, separators=(',', ':')).split(json.dumps(_ID))
+        self.records = [self.record('{0}-{1}'.format(payload['id'], index)) for index in range(items)]
+
+    def record(self, record_id: str) -> bytes:
+        """Return the serialized record with an ID."""
+        return json.dumps(record_id).join(self.template).encode('utf-8')
+
+    def page(self, offset: int, limit: int) -> bytes:
+        """Return a serialized list response."""
+        return b''.join(
+            [
+                '{{"{0}":{1},"limit":{2},"offset":{3},"{4}":['.format(
+                    self.total_key, len(self.records), limit, offset, self.name
+                ).encode('utf-8'),
+                b','.join(self.records[offset : offset + limit]),
+                b']}',
+            ]
+        )
+
+
+def _padded(payload: dict, item_bytes: Optional[int]) -> dict:
+    """Return a copy of a payload whose description makes it about `item_bytes` long."""
+    payload = copy.deepcopy(payload)
+    if item_bytes is not None:
+        missing = item_bytes - len(json.dumps(payload, separators=(',', ':')))
+        payload['description'] = payload.get('description', '') + 'x' * max(missing, 0)
+    return payload
+
+
+class MockSchematicsServer:
+    """
+    A threaded HTTP server that stands in for the Schematics API.
+
+    The server can be used as a context manager, which starts it in a background
+    thread and stops it on exit.
+
+    :param float latency: (optional) The seconds added to every response.
+    :param float jitter: (optional) The largest random seconds added to the
+           latency.
+    :param int items: (optional) The number of records of each collection.
+    :param int item_bytes: (optional) The approximate size of each record, in
+           bytes. Defaults to the size of the sample payloads.
+    :param str host: (optional) The address to listen on.
+    :param int port: (optional) The port to listen on; 0 picks a free port.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        items: int = DEFAULT_ITEMS,
+        item_bytes: Optional[int] = None,
+        host: str = '127.0.0.1',
+        port: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.collections = {
+            prefix: _Collection(name, total_key, payload, items, item_bytes)
+            for prefix, (name, total_key, payload) in RESOURCES.items()
+        }
+        self.requests = 0
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.mock = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """The base URL of the server."""
+        host, port = self._httpd.server_address[:2]
+        return 'http://{0}:{1}'.format(host, port)
+
+    def start(self) -> 'MockSchematicsServer':
+        """Serve requests in a background thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve requests in the current thread until interrupted."""
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        """Stop serving requests and close the socket."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> 'MockSchematicsServer':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def respond(self, method: str, path: str, query: str, body: bytes) -> Tuple[int, bytes]:
+        """Return the status code and body of the response to a request."""
+        with self._lock:
+            self.requests += 1
+        segments = path.strip('/').split('/')
+        collection = self.collections.get('/' + '/'.join(segments[:2]))
+        record_id = segments[2] if len(segments) == 3 else ''
+        if collection is None or len(segments) > 3:
+            return 404, _error(404, 'Not found: {0}'.format(path))
+        if not record_id and method == 'GET':
+            params = parse_qs(query)
+            offset = int(params.get('offset', ['0'])[0])
+            limit = int(params.get('limit', [str(DEFAULT_LIMIT)])[0])
+            return 200, collection.page(offset, limit)
+        if not record_id and method == 'POST':
+            try:
+                created = dict(collection.payload, **json.loads(body or b'{}'))
+            except (TypeError, ValueError):
+                return 400, _error(400, 'The request body is not JSON')
+            created['id'] = '{0}-new-{1}'.format(collection.payload['id'], next(self._ids))
+            return 201, json.dumps(created, separators=(',', ':')).encode('utf-8')
+        if record_id and method == 'GET':
+            return 200, collection.record(record_id)
+        return 404, _error(404, 'Not found: {0} {1}'.format(method, path))
+
+    def delay(self) -> float:
+        """Return the seconds to wait before a response."""
+        return self.latency + (random.uniform(0, self.jitter) if self.jitter else 0.0)
+
+
+def _error(status_code: int, message: str) -> bytes:
+    return json.dumps({'errors': [{'message': message}], 'status_code': status_code}).encode('utf-8')
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # The headers and the body are written separately; without this small responses wait for delayed ACKs.
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """Answer a GET request."""
+        self._handle('GET')
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        """Answer a POST request."""
+        self._handle('POST')
+
+    def log_message(self, format, *args) -> None:  # pylint: disable=redefined-builtin
+        """Do not log requests."""
+
+    def _handle(self, method: str) -> None:
+        mock: MockSchematicsServer = self.server.mock
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        path, _, query = self.path.partition('?')
+        status_code, payload = mock.respond(method, path, query, body)
+        delay = mock.delay()
+        if delay > 0:
+            time.sleep(delay)
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+def main() -> None:
+    """Serve the stand-in API until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1', help='the address to listen on')
+    parser.add_argument('--port', type=int, default=8080, help='the port to listen on; 0 picks a free port')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='the milliseconds added to every response')
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help='the largest random milliseconds added')
+    parser.add_argument('--items', type=int, default=DEFAULT_ITEMS, help='the number of records per collection')
+    parser.add_argument('--item-bytes', type=int, default=None, help='the approximate size of each record')
+    args = parser.parse_args()
+
+    server = MockSchematicsServer(
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        items=args.items,
+        item_bytes=args.item_bytes,
+        host=args.host,
+        port=args.port,
+    )
+    print(server.url, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
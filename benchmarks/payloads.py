@@ -0,0 +1,222 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Representative response payloads used by the benchmarks.
+"""
+
+import copy
+
+_TIMESTAMP = '2024-03-05T14:21:07.123Z'
+
+_VARIABLE = {
+    'name': 'region',
+    'value': 'us-south',
+    'use_default': False,
+    'metadata': {
+        'type': 'string',
+        'description': 'The region of the resources',
+        'default_value': 'us-south',
+        'secure': False,
+        'hidden': False,
+        'required': True,
+        'options': ['us-south', 'us-east', 'eu-de'],
+        'position': 1,
+        'source': 'variables.tf',
+    },
+}
+
+WORKSPACE = {
+    'applied_shareddata_ids': [],
+    'created_at': _TIMESTAMP,
+    'created_by': 'user@example.com',
+    'crn': 'crn:v1:bluemix:public:schematics:us-south:a/0123456789abcdef:workspace:us-south.workspace.vpc.1a2b3c4d',
+    'dependencies': {'parents': [], 'children': []},
+    'description': 'VPC with a virtual server instance',
+    'id': 'us-south.workspace.vpc.1a2b3c4d',
+    'last_health_check_at': _TIMESTAMP,
+    'location': 'us-south',
+    'name': 'vpc',
+    'resource_group': 'Default',
+    'runtime_data': [
+        {
+            'engine_name': 'terraform',
+            'engine_version': 'v1.5.7',
+            'id': 'vpc-template-1a2b3c4d',
+            'log_store_url': 'https://schematics.cloud.ibm.com/v1/workspaces/us-south.workspace.vpc.1a2b3c4d/runtime_data/vpc-template-1a2b3c4d/log_store',
+            'state_store_url': 'https://schematics.cloud.ibm.com/v1/workspaces/us-south.workspace.vpc.1a2b3c4d/runtime_data/vpc-template-1a2b3c4d/state_store',
+        }
+    ],
+    'shared_data': {'region': 'us-south', 'resource_group_id': '0123456789abcdef0123456789abcdef'},
+    'status': 'ACTIVE',
+    'tags': ['env:dev', 'team:network'],
+    'template_data': [
+        {
+            'folder': '.',
+            'compact': False,
+            'has_githubtoken': False,
+            'id': 'vpc-template-1a2b3c4d',
+            'type': 'terraform_v1.5',
+            'values_url': 'https://schematics.cloud.ibm.com/v1/workspaces/us-south.workspace.vpc.1a2b3c4d/template_data/vpc-template-1a2b3c4d/values',
+            'variablestore': [
+                {'name': 'region', 'type': 'string', 'value': 'us-south'},
+                {'name': 'zone', 'type': 'string', 'value': 'us-south-1'},
+            ],
+        }
+    ],
+    'template_repo': {
+        'branch': 'main',
+        'full_url': 'https://github.com/IBM-Cloud/terraform-provider-ibm/tree/main/examples/ibm-vpc',
+        'has_uploadedgitrepotar': False,
+        'url': 'https://github.com/IBM-Cloud/terraform-provider-ibm',
+    },
+    'type': ['terraform_v1.5'],
+    'updated_at': _TIMESTAMP,
+    'updated_by': 'user@example.com',
+    'last_job': {'job_id': 'a1b2c3d4e5f6', 'job_name': 'workspace_apply', 'job_status': 'COMPLETED'},
+    'workspace_status': {'frozen': False, 'locked': False, 'locked_time': _TIMESTAMP},
+    'workspace_status_msg': {'status_code': '200', 'status_msg': 'Workspace is active'},
+    'settings': [copy.deepcopy(_VARIABLE)],
+}
+
+INVENTORY = {
+    'name': 'web-servers',
+    'id': 'us-south.INVENTORY.web-servers.5e6f7a8b',
+    'description': 'Hosts of the web tier',
+    'location': 'us-south',
+    'resource_group': 'Default',
+    'created_at': _TIMESTAMP,
+    'created_by': 'user@example.com',
+    'updated_at': _TIMESTAMP,
+    'updated_by': 'user@example.com',
+    'inventories_ini': '[web]\n10.240.0.4\n10.240.0.5\n10.240.0.6\n',
+    'resource_queries': ['us-south.RESOURCEQUERY.web.9c8d7e6f'],
+}
+
+JOB = {
+    'command_object': 'workspace',
+    'command_object_id': 'us-south.workspace.vpc.1a2b3c4d',
+    'command_name': 'workspace_apply',
+    'command_parameter': '',
+    'command_options': ['-parallelism=10'],
+    'inputs': [copy.deepcopy(_VARIABLE)],
+    'settings': [copy.deepcopy(_VARIABLE)],
+    'tags': ['env:dev'],
+    'id': 'us-south.JOB.vpc.a1b2c3d4',
+    'name': 'workspace_apply',
+    'location': 'us-south',
+    'resource_group': 'Default',
+    'submitted_at': _TIMESTAMP,
+    'submitted_by': 'user@example.com',
+    'start_at': _TIMESTAMP,
+    'end_at': _TIMESTAMP,
+    'duration': '2m31s',
+    'status': {
+        'workspace_job_status': {
+            'workspace_name': 'vpc',
+            'status_code': 'job_finished',
+            'status_message': 'Apply complete',
+            'updated_at': _TIMESTAMP,
+        }
+    },
+    'data': {'job_type': 'workspace_job', 'workspace_job_data': {'workspace_name': 'vpc', 'inputs': []}},
+    'log_summary': {
+        'job_id': 'us-south.JOB.vpc.a1b2c3d4',
+        'job_type': 'workspace_job',
+        'log_start_at': _TIMESTAMP,
+        'log_analyzed_till': _TIMESTAMP,
+        'elapsed_time': 151.2,
+        'log_errors': [],
+        'repo_download_job': {'scanned_file_count': 12, 'quarantined_file_count': 0},
+        'workspace_job': {'resources_add': 4, 'resources_modify': 0, 'resources_destroy': 0},
+    },
+    'log_store_url': 'https://schematics.cloud.ibm.com/v2/jobs/us-south.JOB.vpc.a1b2c3d4/logs',
+    'state_store_url': 'https://schematics.cloud.ibm.com/v2/jobs/us-south.JOB.vpc.a1b2c3d4/states',
+    'results_url': 'https://schematics.cloud.ibm.com/v2/jobs/us-south.JOB.vpc.a1b2c3d4/results',
+    'updated_at': _TIMESTAMP,
+}
+
+ACTION = {
+    'name': 'configure-web',
+    'description': 'Configure the web servers',
+    'location': 'us-south',
+    'resource_group': 'Default',
+    'tags': ['env:dev'],
+    'user_state': {'state': 'live', 'set_by': 'user@example.com', 'set_at': _TIMESTAMP},
+    'source': {
+        'source_type': 'git_hub',
+        'git': {
+            'computed_git_repo_url': 'https://github.com/Cloud-Schematics/lamp-simple',
+            'git_repo_url': 'https://github.com/Cloud-Schematics/lamp-simple',
+            'git_branch': 'master',
+        },
+    },
+    'source_type': 'git_hub',
+    'command_parameter': 'site.yml',
+    'inventory': 'us-south.INVENTORY.web-servers.5e6f7a8b',
+    'inputs': [copy.deepcopy(_VARIABLE)],
+    'outputs': [],
+    'settings': [copy.deepcopy(_VARIABLE)],
+    'id': 'us-south.ACTION.configure-web.2b3c4d5e',
+    'crn': 'crn:v1:bluemix:public:schematics:us-south:a/0123456789abcdef:action:us-south.ACTION.configure-web.2b3c4d5e',
+    'account': '0123456789abcdef',
+    'source_created_at': _TIMESTAMP,
+    'created_at': _TIMESTAMP,
+    'created_by': 'user@example.com',
+    'updated_at': _TIMESTAMP,
+    'updated_by': 'user@example.com',
+    'state': {'status_code': 'normal', 'status_job_id': 'a1b2c3d4e5f6', 'status_message': 'Action is ready'},
+    'playbook_names': ['site.yml'],
+    'sys_lock': {'sys_locked': False},
+}
+
+AGENT = {
+    'name': 'agent-us-south',
+    'description': 'Agent of the private network',
+    'resource_group': 'Default',
+    'tags': ['env:dev'],
+    'version': 'v1.0.0',
+    'schematics_location': 'us-south',
+    'agent_location': 'us-south',
+    'agent_infrastructure': {
+        'infra_type': 'ibm_kubernetes',
+        'cluster_id': 'cl1a2b3c4d5e6f7a8b9c',
+        'cluster_resource_group': 'Default',
+        'cos_instance_name': 'agent-cos',
+        'cos_bucket_name': 'agent-bucket',
+        'cos_bucket_region': 'us-south',
+    },
+    'agent_inputs': [copy.deepcopy(_VARIABLE)],
+    'user_state': {'state': 'enable', 'set_by': 'user@example.com', 'set_at': _TIMESTAMP},
+    'agent_crn': 'crn:v1:bluemix:public:schematics:us-south:a/0123456789abcdef:agent:us-south.agent.agent-us-south.3c4d5e6f',
+    'id': 'us-south.agent.agent-us-south.3c4d5e6f',
+    'created_at': _TIMESTAMP,
+    'creation_by': 'user@example.com',
+    'updated_at': _TIMESTAMP,
+    'updated_by': 'user@example.com',
+    'system_state': {'status_code': 'draft', 'status_message': 'Agent is ready'},
+}
+
+
+def copies(payload: dict, count: int) -> list:
+    """Return `count` independent copies of a payload, each with its own id."""
+    items = []
+    for index in range(count):
+        item = copy.deepcopy(payload)
+        if 'id' in item:
+            item['id'] = '{0}-{1}'.format(item['id'], index)
+        items.append(item)
+    return items
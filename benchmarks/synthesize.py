@@ -0,0 +1,119 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Payloads synthesized for every model class, from the annotations of its properties.
+"""
+
+from datetime import datetime
+from typing import Any, List, Tuple, Union
+import inspect
+import sys
+import typing
+
+from ibm_schematics import schematics_2_0_api_v2, schematics_v1_models
+from ibm_schematics.serialization import BYTES, DATETIME, MODEL, MODEL_LIST, field_specs
+
+TIMESTAMP = '2024-03-05T14:21:07.123Z'
+MODEL_MODULES = (schematics_v1_models, schematics_2_0_api_v2)
+
+
+def all_models() -> List[Tuple[str, type]]:
+    """
+    Return every model class of both service modules, with a name qualified by its
+    service, such as `V1.Job` and `V2.Job`.
+    """
+    models = []
+    for service, module in zip(('V1', 'V2'), MODEL_MODULES):
+        for name, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ == module.__name__ and hasattr(cls, 'from_dict') and hasattr(cls, 'to_dict'):
+                models.append(('{0}.{1}'.format(service, name), cls))
+    return models
+
+
+def _unwrap(annotation: Any) -> Any:
+    if typing.get_origin(annotation) is Union:
+        return typing.get_args(annotation)[0]
+    return annotation
+
+
+def _enum_value(cls: type, name: str) -> Any:
+    enum = getattr(cls, ''.join(part.capitalize() for part in name.split('_')) + 'Enum', None)
+    return next(iter(enum)).value if enum is not None else None
+
+
+def _string(cls: type, name: str) -> str:
+    value = _enum_value(cls, name)
+    if value is not None:
+        return value
+    if name == 'id' or name.endswith('_id'):
+        return 'us-south.{0}.{1}.1a2b3c4d'.format(cls.__name__.lower(), name)
+    if name.endswith('url'):
+        return 'https://schematics.cloud.ibm.com/v2/{0}/{1}'.format(cls.__name__.lower(), name)
+    if name.endswith('crn'):
+        return 'crn:v1:bluemix:public:schematics:us-south:a/0123456789abcdef:{0}'.format(cls.__name__.lower())
+    if name in ('location', 'region') or name.endswith('_location'):
+        return 'us-south'
+    return 'The {0} of the {1}'.format(name.replace('_', ' '), cls.__name__)
+
+
+def _plain(cls: type, name: str, annotation: Any, list_size: int) -> Any:
+    annotation = _unwrap(annotation)
+    if typing.get_origin(annotation) is list:
+        (item,) = typing.get_args(annotation) or (str,)
+        return [_plain(cls, name, item, list_size) for _ in range(list_size)]
+    if annotation is bool:
+        return True
+    if annotation is int:
+        return 3
+    if annotation is float:
+        return 1.5
+    if annotation is dict or typing.get_origin(annotation) is dict:
+        return {'key': 'value', 'count': 1}
+    return _string(cls, name)
+
+
+def synthesize(cls: type, *, list_size: int = 3, depth: int = 4) -> dict:
+    """
+    Return a payload with every property of a model class.
+
+    Nested models are filled down to `depth` levels; below that, only their
+    required properties are. Lists hold `list_size` items.
+
+    :param type cls: A model class such as `Job`.
+    :param int list_size: (optional) The number of items of each list.
+    :param int depth: (optional) The number of levels of nested models filled.
+    :rtype: dict
+    """
+    hints = typing.get_type_hints(cls.__init__, vars(sys.modules[cls.__module__]), {})
+    payload = {}
+    for spec in field_specs(cls):
+        if depth <= 0 and not spec.required:
+            continue
+        if spec.kind == DATETIME:
+            payload[spec.name] = TIMESTAMP
+        elif spec.kind == BYTES:
+            payload[spec.name] = 'c2NoZW1hdGljcw=='
+        elif spec.kind == MODEL:
+            payload[spec.name] = synthesize(spec.model, list_size=list_size, depth=depth - 1)
+        elif spec.kind == MODEL_LIST:
+            payload[spec.name] = [
+                synthesize(spec.model, list_size=list_size, depth=depth - 1) for _ in range(list_size)
+            ]
+        else:
+            hint = hints.get(spec.name, str)
+            payload[spec.name] = _plain(cls, spec.name, hint if hint is not datetime else str, list_size)
+    return payload
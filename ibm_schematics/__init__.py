@@ -15,8 +15,44 @@
 
 """IBM Cloud Schematics Python SDK"""
 
-from ibm_cloud_sdk_core import IAMTokenManager, DetailedResponse, BaseService, ApiException
+from typing import TYPE_CHECKING
+import importlib
 
 from .common import get_sdk_headers
 from .version import __version__
-from .schematics_v1 import SchematicsV1
+
+if TYPE_CHECKING:
+    from ibm_cloud_sdk_core import IAMTokenManager, DetailedResponse, BaseService, ApiException
+    from .schematics_v1 import SchematicsV1
+
+__all__ = [
+    'SchematicsV1',
+    'IAMTokenManager',
+    'DetailedResponse',
+    'BaseService',
+    'ApiException',
+    'get_sdk_headers',
+    '__version__',
+]
+
+# The SDK core and the service are imported on first access (PEP 562), so that
+# `import ibm_schematics` and its lightweight submodules start quickly.
+_LAZY_ATTRIBUTES = {
+    'IAMTokenManager': 'ibm_cloud_sdk_core',
+    'DetailedResponse': 'ibm_cloud_sdk_core',
+    'BaseService': 'ibm_cloud_sdk_core',
+    'ApiException': 'ibm_cloud_sdk_core',
+    'SchematicsV1': 'ibm_schematics.schematics_v1',
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError('module {0!r} has no attribute {1!r}'.format(__name__, name))
+    value = globals()[name] = getattr(importlib.import_module(module), name)
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
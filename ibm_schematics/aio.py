@@ -0,0 +1,272 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+asyncio clients for the Schematics services.
+
+`AsyncSchematicsV1` and `AsyncSchematics20ApiV2` expose exactly the same operations
+as `SchematicsV1` and `Schematics20ApiV2`, but every operation returns a coroutine
+that must be awaited:
+
+    service = AsyncSchematicsV1(authenticator=authenticator)
+    job = (await service.get_job(job_id=job_id)).get_result()
+
+Requests are sent with an `httpx.AsyncClient`, so the `httpx` package must be
+installed (`pip install "ibm-schematics[async]"`). The client keeps a pool of
+connections that can be shared by any number of concurrent calls and service
+instances. Request preparation, including authentication, is the same as in the
+synchronous clients; token managers cache their tokens, so only an occasional
+token refresh is performed synchronously.
+"""
+
+from typing import Optional
+import asyncio
+import logging
+import random
+
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
+from ibm_cloud_sdk_core.utils import is_json_mimetype
+
+from .schematics_v1 import SchematicsV1
+from .schematics_2_0_api_v2 import Schematics20ApiV2
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 100
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class _AsyncServiceMixin:
+    """
+    Replaces the synchronous `BaseService.send` with a coroutine backed by a shared
+    `httpx.AsyncClient`.
+    """
+
+    def _init_async_transport(
+        self,
+        http_client: Optional['httpx.AsyncClient'],
+        max_connections: int,
+    ) -> None:
+        if httpx is None:
+            raise ImportError(
+                'The asyncio clients require the httpx package; install it with: pip install "ibm-schematics[async]"'
+            )
+        self._async_http_client = http_client
+        self._owns_async_http_client = http_client is None
+        self._max_connections = max_connections
+
+    def get_async_http_client(self) -> 'httpx.AsyncClient':
+        """
+        Return the `httpx.AsyncClient` used to send requests, creating it on first use.
+
+        The returned client can be passed to other async service instances so that
+        they share one connection pool.
+        """
+        if self._async_http_client is None:
+            self._async_http_client = httpx.AsyncClient(
+                verify=not self.disable_ssl_verification,
+                limits=httpx.Limits(
+                    max_connections=self._max_connections,
+                    max_keepalive_connections=self._max_connections,
+                ),
+            )
+        return self._async_http_client
+
+    def set_disable_ssl_verification(self, status: bool = False) -> None:
+        super().set_disable_ssl_verification(status)
+        if self._owns_async_http_client and self._async_http_client is not None:
+            # The verify setting is fixed when the client is created; build a new one on next use.
+            logger.debug('Discarding the async http client to apply the new SSL verification setting')
+            self._async_http_client = None
+
+    async def aclose(self) -> None:
+        """
+        Close the connection pool, unless it was supplied by the caller.
+        """
+        if self._owns_async_http_client and self._async_http_client is not None:
+            await self._async_http_client.aclose()
+            self._async_http_client = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def send(self, request: dict, **kwargs) -> DetailedResponse:
+        """
+        Send a request and wrap the response in a DetailedResponse or ApiException.
+
+        Mirrors `BaseService.send`: a 60 second timeout is used unless another one is
+        given, a JSON response body is returned as a dict, any other body as the
+        `httpx.Response` and a streamed response (`stream=True`) as an unread
+        `httpx.Response` that the caller must close. When retries were enabled with
+        `enable_retries()`, failed connections and 429/5xx responses are retried
+        honoring the `Retry-After` header.
+
+        :param dict request: The request built by `prepare_request`.
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse
+        """
+        kwargs = dict({'timeout': 60}, **kwargs)
+        kwargs = dict(kwargs, **self.http_config)
+        stream_response = kwargs.get('stream') or False
+
+        http_client = self.get_async_http_client()
+        http_request = http_client.build_request(
+            request['method'],
+            request['url'],
+            headers=dict(request['headers']),
+            params=request.get('params'),
+            timeout=kwargs.get('timeout'),
+            **self._build_body(request),
+        )
+
+        attempt = 0
+        while True:
+            try:
+                logger.debug('Sending HTTP request message')
+                response = await http_client.send(http_request, stream=stream_response)
+            except httpx.TransportError:
+                if not self._should_retry(attempt):
+                    raise
+                await asyncio.sleep(self._retry_delay(attempt, None))
+                attempt += 1
+                continue
+            logger.debug('Received HTTP response message, status code %d', response.status_code)
+            if response.status_code in self._retry_status_codes() and self._should_retry(attempt):
+                await response.aclose()
+                await asyncio.sleep(self._retry_delay(attempt, response.headers.get('Retry-After')))
+                attempt += 1
+                continue
+            break
+
+        if 200 <= response.status_code <= 299:
+            if response.status_code == 204 or request['method'] == 'HEAD':
+                result = None
+            elif stream_response:
+                result = response
+            elif not response.content:
+                result = None
+            elif is_json_mimetype(response.headers.get('Content-Type')):
+                try:
+                    result = response.json(strict=False)
+                except ValueError as err:
+                    raise ApiException(
+                        code=response.status_code,
+                        http_response=response,
+                        message='Error processing the HTTP response',
+                    ) from err
+            else:
+                result = response
+            return DetailedResponse(response=result, headers=response.headers, status_code=response.status_code)
+
+        if stream_response:
+            await response.aread()
+        raise ApiException(response.status_code, http_response=response)
+
+    @staticmethod
+    def _build_body(request: dict) -> dict:
+        data = request.get('data')
+        files = request.get('files')
+        if files:
+            body = {'files': files}
+            if isinstance(data, dict):
+                body['data'] = data
+            return body
+        if isinstance(data, dict):
+            return {'data': data}
+        if hasattr(data, 'read'):
+            return {'content': data.read()}
+        if data is not None:
+            return {'content': data}
+        return {}
+
+    def _retry_status_codes(self) -> tuple:
+        if self.retry_config is None:
+            return ()
+        return tuple(self.retry_config.status_forcelist or RETRY_STATUS_CODES)
+
+    def _should_retry(self, attempt: int) -> bool:
+        return self.retry_config is not None and attempt < (self.retry_config.total or 0)
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[str]) -> float:
+        backoff_max = getattr(self.retry_config, 'backoff_max', 30.0)
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), backoff_max)
+            except ValueError:
+                pass
+        delay = min(self.retry_config.backoff_factor * (2**attempt), backoff_max)
+        return random.uniform(0, delay)
+
+
+class AsyncSchematicsV1(_AsyncServiceMixin, SchematicsV1):
+    """The schematics V1 service, with operations that return coroutines."""
+
+    def __init__(
+        self,
+        authenticator: Authenticator = None,
+        *,
+        http_client: Optional['httpx.AsyncClient'] = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    ) -> None:
+        """
+        Construct a new asyncio client for the schematics service.
+
+        :param Authenticator authenticator: The authenticator specifies the authentication mechanism.
+               Get up to date information from https://github.com/IBM/python-sdk-core/blob/main/README.md
+               about initializing the authenticator of your choice.
+        :param httpx.AsyncClient http_client: (optional) A client to send the requests
+               with, typically shared with other async service instances. When omitted,
+               the service creates its own client on first use.
+        :param int max_connections: (optional) The size of the connection pool of the
+               client created by the service.
+        """
+        self._init_async_transport(http_client, max_connections)
+        SchematicsV1.__init__(self, authenticator)
+
+
+class AsyncSchematics20ApiV2(_AsyncServiceMixin, Schematics20ApiV2):
+    """The Schematics 2.0 API V2 service, with operations that return coroutines."""
+
+    def __init__(
+        self,
+        authenticator: Authenticator = None,
+        *,
+        http_client: Optional['httpx.AsyncClient'] = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    ) -> None:
+        """
+        Construct a new asyncio client for the Schematics 2.0 API service.
+
+        :param Authenticator authenticator: The authenticator specifies the authentication mechanism.
+               Get up to date information from https://github.com/IBM/python-sdk-core/blob/master/README.md
+               about initializing the authenticator of your choice.
+        :param httpx.AsyncClient http_client: (optional) A client to send the requests
+               with, typically shared with other async service instances. When omitted,
+               the service creates its own client on first use.
+        :param int max_connections: (optional) The size of the connection pool of the
+               client created by the service.
+        """
+        self._init_async_transport(http_client, max_connections)
+        Schematics20ApiV2.__init__(self, authenticator)
@@ -0,0 +1,209 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Run a workspace command, such as `apply`, against many workspaces at once.
+
+`BulkExecutor` sends the commands over a bounded thread pool, limits the rate of
+requests per region and collects the activity IDs of the jobs it starts into a
+`BulkReport`.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Union
+import logging
+import threading
+
+from .ratelimit import TokenBucket
+from .schematics_v1 import SchematicsV1
+
+logger = logging.getLogger(__name__)
+
+# The workspace commands that can be run in bulk, mapped to their operation.
+COMMANDS = {
+    'apply': 'apply_workspace_command',
+    'plan': 'plan_workspace_command',
+    'refresh': 'refresh_workspace_command',
+}
+DEFAULT_MAX_WORKERS = 8
+
+
+def workspace_region(w_id: str) -> str:
+    """
+    Return the region of a workspace from its ID.
+
+    Workspace IDs start with the region they were created in, for example
+    `us-south.workspace.myworkspace.1a2b3c4d`.
+
+    :param str w_id: The ID of the workspace.
+    :return: The region, or an empty string when the ID has no region.
+    :rtype: str
+    """
+    region, separator, _ = w_id.partition('.')
+    return region if separator else ''
+
+
+class BulkResult(NamedTuple):
+    """
+    The outcome of a command for one workspace.
+
+    :attr str w_id: The ID of the workspace.
+    :attr str region: The region of the workspace.
+    :attr str activity_id: The ID of the job started by the command, or None when
+          the command failed.
+    :attr Exception error: The error raised by the command, or None when it
+          succeeded.
+    """
+
+    w_id: str
+    region: str
+    activity_id: Optional[str] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the command started a job."""
+        return self.error is None
+
+
+class BulkReport:
+    """
+    The outcome of a command for every workspace of a bulk run.
+
+    :attr str command: The command that was run.
+    :attr list results: The `BulkResult` of each workspace, in the order the
+          workspaces were given.
+    """
+
+    def __init__(self, command: str, results: List[BulkResult]) -> None:
+        self.command = command
+        self.results = results
+
+    @property
+    def succeeded(self) -> List[BulkResult]:
+        """The results of the workspaces whose job was started."""
+        return [result for result in self.results if result.ok]
+
+    @property
+    def failed(self) -> List[BulkResult]:
+        """The results of the workspaces whose command failed."""
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def activity_ids(self) -> Dict[str, str]:
+        """The IDs of the jobs that were started, by workspace ID."""
+        return {result.w_id: result.activity_id for result in self.results if result.ok}
+
+    def by_region(self) -> Dict[str, List[BulkResult]]:
+        """Return the results grouped by region."""
+        regions: Dict[str, List[BulkResult]] = {}
+        for result in self.results:
+            regions.setdefault(result.region, []).append(result)
+        return regions
+
+    def __str__(self) -> str:
+        return '{0}: {1} started, {2} failed'.format(self.command, len(self.succeeded), len(self.failed))
+
+
+class BulkExecutor:
+    """
+    Runs workspace commands against many workspaces over a bounded thread pool.
+
+    The rate of commands sent to each region is limited by a token bucket, so a
+    large run does not exceed the request limits of the service. The buckets are
+    kept by the executor and shared by all its runs.
+
+    :param SchematicsV1 client: The service client.
+    :param int max_workers: (optional) The largest number of commands in flight.
+    :param dict rate_limits: (optional) The number of commands per second sent to
+           each region, for example `{'us-south': 5, 'eu-de': 2}`.
+    :param float default_rate: (optional) The number of commands per second sent
+           to the regions missing from `rate_limits`. By default they are not
+           limited.
+    """
+
+    def __init__(
+        self,
+        client: SchematicsV1,
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        rate_limits: Optional[Dict[str, float]] = None,
+        default_rate: Optional[float] = None,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError('max_workers must be a positive integer')
+        if default_rate is not None and default_rate <= 0:
+            raise ValueError('default_rate must be positive')
+        self.client = client
+        self.max_workers = max_workers
+        self.default_rate = default_rate
+        self._buckets = {region: TokenBucket(rate) for region, rate in (rate_limits or {}).items()}
+        self._lock = threading.Lock()
+
+    def run(
+        self,
+        command: str,
+        workspace_ids: Iterable[str],
+        refresh_token: Union[str, Callable[[str], str]],
+        **kwargs,
+    ) -> BulkReport:
+        """
+        Run a command against every workspace and wait for all the commands to be
+        sent.
+
+        A failed command does not stop the others; its error is recorded in the
+        report.
+
+        :param str command: `apply`, `plan` or `refresh`.
+        :param iterable workspace_ids: The IDs of the workspaces. Duplicates are run
+               once.
+        :param refresh_token: The IAM refresh token sent with every command, or a
+               function that returns the refresh token for a workspace ID.
+        :param **kwargs: (optional) Further arguments of the command, such as
+               `delegated_token` or `action_options`.
+        :return: The outcome of the command for each workspace.
+        :rtype: BulkReport
+        """
+        if command not in COMMANDS:
+            raise ValueError('command must be one of {0}'.format(', '.join(COMMANDS)))
+        operation = getattr(self.client, COMMANDS[command])
+        token_for = refresh_token if callable(refresh_token) else lambda _: refresh_token
+        workspace_ids = list(dict.fromkeys(workspace_ids))
+
+        def run_one(w_id: str) -> BulkResult:
+            region = workspace_region(w_id)
+            bucket = self._bucket(region)
+            if bucket is not None:
+                bucket.acquire()
+            try:
+                response = operation(w_id, token_for(w_id), **kwargs)
+            except Exception as e:  # pylint: disable=broad-except
+                logger.debug('%s failed for workspace %s: %s', command, w_id, e)
+                return BulkResult(w_id, region, error=e)
+            return BulkResult(w_id, region, activity_id=(response.get_result() or {}).get('activityid'))
+
+        if not workspace_ids:
+            return BulkReport(command, [])
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(workspace_ids))) as executor:
+            results = list(executor.map(run_one, workspace_ids))
+        return BulkReport(command, results)
+
+    def _bucket(self, region: str) -> Optional[TokenBucket]:
+        with self._lock:
+            bucket = self._buckets.get(region)
+            if bucket is None and self.default_rate is not None:
+                bucket = self._buckets[region] = TokenBucket(self.default_rate)
+            return bucket
@@ -0,0 +1,427 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Client-side caches for Schematics responses.
+
+`ResponseCache` keeps the results of operations whose data rarely changes, such as
+`list_locations` or `get_schematics_version`, for a configurable time, so that
+repeated calls are answered locally:
+
+    cache = ResponseCache()
+    cache.attach(schematics_service)
+    schematics_service.list_locations()  # sent to the service
+    schematics_service.list_locations()  # answered from the cache
+
+`ConditionalCache` keeps the results of `get_workspace` and the other operations that
+return a single resource together with their `ETag` and `Last-Modified` headers, and
+revalidates them with `If-None-Match` and `If-Modified-Since`, so that unchanged
+resources are not downloaded and parsed again.
+
+`SingleFlight` lets concurrent identical calls of `get_workspace` or `get_job` share
+one request and its result.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+import asyncio
+import copy
+import functools
+import inspect
+import logging
+import threading
+import time
+
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+# The time, in seconds, the results of each cached operation are kept by default.
+DEFAULT_TTLS = {
+    'list_schematics_location': 3600,
+    'list_locations': 3600,
+    'list_resource_group': 300,
+    'get_schematics_version': 3600,
+    'get_agent_versions': 3600,
+    'get_kms_settings': 300,
+}
+# The operations revalidated by a ConditionalCache by default.
+DEFAULT_CONDITIONAL_OPERATIONS = ('get_workspace', 'get_action', 'get_inventory', 'get_policy', 'get_agent')
+# The operations whose concurrent identical calls are coalesced by a SingleFlight by default.
+DEFAULT_SINGLE_FLIGHT_OPERATIONS = ('get_workspace', 'get_job')
+DEFAULT_MAXSIZE = 256
+
+
+class CacheInfo(NamedTuple):
+    """
+    Statistics of a cache.
+
+    :attr int hits: The number of calls answered from the cache, including the
+          calls revalidated with a `304 Not Modified` response.
+    :attr int misses: The number of calls whose result was downloaded.
+    :attr int size: The number of entries in the cache.
+    :attr int maxsize: The maximum number of entries in the cache.
+    """
+
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+
+class _Entry(NamedTuple):
+    expires_at: float
+    result: Any
+    headers: CaseInsensitiveDict
+    status_code: int
+
+
+def _freeze(value: Any) -> Any:
+    """Return a hashable equivalent of a parameter value."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class _OperationWrapper:
+    """
+    Replaces operations of service instances with wrappers built by `_wrap`.
+    """
+
+    def __init__(self, operations: Tuple[str, ...]) -> None:
+        self.operations = tuple(operations)
+
+    def attach(self, client: Any) -> Any:
+        """
+        Wrap the configured operations of a service instance.
+
+        :param client: A `SchematicsV1` instance.
+        :return: `client` itself.
+        :raises ValueError: when the client is an asyncio service instance, or has no
+                operation with a configured name.
+        """
+        if asyncio.iscoroutinefunction(client.send):
+            raise ValueError('{0} can only be attached to synchronous service instances'.format(type(self).__name__))
+        for operation in self.operations:
+            method = getattr(client, operation, None)
+            if method is None:
+                raise ValueError('{0} has no operation named {1}'.format(type(client).__name__, operation))
+            signature = inspect.signature(method)
+
+            def call_key(args, kwargs, operation=operation, signature=signature, client=client) -> Tuple:
+                params = dict(signature.bind(*args, **kwargs).arguments)
+                params.update(params.pop('kwargs', {}))
+                # The same call made by clients of other regions or accounts gets other results.
+                return (operation, _freeze(params), client.service_url, client.authenticator)
+
+            wrapper = functools.wraps(method)(self._wrap(operation, method, call_key))
+            wrapper.__wrapped_by__ = self
+            setattr(client, operation, wrapper)
+        return client
+
+    def detach(self, client: Any) -> None:
+        """
+        Restore the operations of a service instance replaced by `attach`.
+
+        :param client: A service instance this object was attached to.
+        """
+        for operation in self.operations:
+            if getattr(vars(client).get(operation), '__wrapped_by__', None) is self:
+                delattr(client, operation)
+
+    def _wrap(self, operation: str, method: Callable, call_key: Callable) -> Callable:
+        raise NotImplementedError
+
+
+class _OperationCache(_OperationWrapper):
+    """
+    The least recently used storage and statistics shared by the caches of this
+    module.
+    """
+
+    def __init__(self, operations: Tuple[str, ...], maxsize: int) -> None:
+        if maxsize < 1:
+            raise ValueError('maxsize must be a positive integer')
+        super().__init__(operations)
+        self.maxsize = maxsize
+        self._entries: 'OrderedDict[Tuple, _Entry]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def invalidate(self, operation: Optional[str] = None, **params) -> int:
+        """
+        Remove entries from the cache.
+
+        Without arguments every entry is removed. With an operation name, only the
+        entries of that operation are removed, or, when parameters are given too,
+        only the entry of the call with exactly those parameters.
+
+        :param str operation: (optional) The name of the operation, for example
+               `get_kms_settings`.
+        :param **params: (optional) The parameters of the call to forget, for
+               example `location='US'`.
+        :return: The number of entries removed.
+        :rtype: int
+        """
+        with self._lock:
+            if operation is None:
+                keys = list(self._entries)
+            elif params:
+                frozen = _freeze(params)
+                keys = [key for key in self._entries if key[0] == operation and key[1] == frozen]
+            else:
+                keys = [key for key in self._entries if key[0] == operation]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Remove every entry and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = 0
+
+    def info(self) -> CacheInfo:
+        """Return the statistics of the cache."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, len(self._entries), self.maxsize)
+
+    def _lookup(self, key: Tuple, now: Optional[float] = None) -> Optional[_Entry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now is not None and entry.expires_at <= now:
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    def _store(self, key: Tuple, entry: _Entry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                evicted, _ = self._entries.popitem(last=False)
+                logger.debug('Evicted the cached result of %s', evicted[0])
+
+    def _discard(self, key: Tuple) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+def _cacheable(response: DetailedResponse) -> bool:
+    """Return whether the result of a response is parsed JSON, or empty."""
+    result = response.get_result()
+    return result is None or isinstance(result, (dict, list))
+
+
+def _cached_response(entry: _Entry) -> DetailedResponse:
+    """Return a response with a copy of a cached result."""
+    return DetailedResponse(
+        response=copy.deepcopy(entry.result), headers=CaseInsensitiveDict(entry.headers), status_code=entry.status_code
+    )
+
+
+class ResponseCache(_OperationCache):
+    """
+    An in-memory, least recently used cache of operation results with a time to
+    live per operation.
+
+    The cache is attached to one or more service instances with `attach`, which
+    replaces the cached operations of the instance with versions that look up
+    the cache first. Entries are keyed on the operation name and its parameters,
+    including any custom headers, and on the service URL and authenticator of the
+    instance, so that instances of different regions or accounts never share
+    results. Only successful responses with a JSON (or
+    empty) body are cached, and every call returns its own copy of the result, so
+    callers may modify it freely. The cache can be shared between threads.
+
+    :param dict ttls: (optional) The operations to cache, mapped to the number of
+           seconds their results are kept. Defaults to `DEFAULT_TTLS`.
+    :param int maxsize: (optional) The maximum number of entries; the least
+           recently used entry is evicted when it is exceeded.
+    """
+
+    def __init__(self, *, ttls: Optional[Dict[str, float]] = None, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        for operation, ttl in self.ttls.items():
+            if ttl <= 0:
+                raise ValueError('The time to live of {0} must be positive'.format(operation))
+        super().__init__(tuple(self.ttls), maxsize)
+
+    def _wrap(self, operation: str, method: Callable, call_key: Callable) -> Callable:
+        def cached(*args, **kwargs) -> DetailedResponse:
+            key = call_key(args, kwargs)
+            entry = self._lookup(key, time.monotonic())
+            self._count(entry is not None)
+            if entry is None:
+                response = method(*args, **kwargs)
+                if not _cacheable(response):
+                    return response
+                entry = _Entry(
+                    time.monotonic() + self.ttls[operation],
+                    copy.deepcopy(response.get_result()),
+                    CaseInsensitiveDict(response.get_headers() or {}),
+                    response.get_status_code(),
+                )
+                self._store(key, entry)
+            return _cached_response(entry)
+
+        return cached
+
+
+class ConditionalCache(_OperationCache):
+    """
+    An in-memory, least recently used cache of operation results that are
+    revalidated with the service on every call.
+
+    Results are stored with the `ETag` and `Last-Modified` headers of their
+    response. The next call with the same parameters sends them back as
+    `If-None-Match` and `If-Modified-Since`; when the service answers
+    `304 Not Modified`, a copy of the stored result is returned without
+    downloading or parsing the resource again. Responses without either header
+    are not stored. Like `ResponseCache`, the cache is attached to service
+    instances with `attach`, keeps the results of each service URL and
+    authenticator apart, and can be shared between threads.
+
+    :param tuple operations: (optional) The operations to revalidate. Defaults to
+           `DEFAULT_CONDITIONAL_OPERATIONS`.
+    :param int maxsize: (optional) The maximum number of entries; the least
+           recently used entry is evicted when it is exceeded.
+    """
+
+    def __init__(
+        self, *, operations: Tuple[str, ...] = DEFAULT_CONDITIONAL_OPERATIONS, maxsize: int = DEFAULT_MAXSIZE
+    ) -> None:
+        super().__init__(operations, maxsize)
+
+    def _wrap(self, operation: str, method: Callable, call_key: Callable) -> Callable:
+        def revalidated(*args, **kwargs) -> DetailedResponse:
+            key = call_key(args, kwargs)
+            entry = self._lookup(key)
+            if entry is not None:
+                validators = {}
+                if 'ETag' in entry.headers:
+                    validators['If-None-Match'] = entry.headers['ETag']
+                if 'Last-Modified' in entry.headers:
+                    validators['If-Modified-Since'] = entry.headers['Last-Modified']
+                kwargs['headers'] = dict(validators, **(kwargs.get('headers') or {}))
+            try:
+                response = method(*args, **kwargs)
+            except ApiException as e:
+                if e.status_code in (404, 410):
+                    self._discard(key)
+                if e.status_code != 304 or entry is None:
+                    raise
+                self._count(True)
+                if e.http_response is not None:
+                    headers = CaseInsensitiveDict(entry.headers)
+                    headers.update(
+                        (name, value)
+                        for name, value in e.http_response.headers.items()
+                        if name.lower() in ('etag', 'last-modified', 'date', 'cache-control', 'expires')
+                    )
+                    entry = entry._replace(headers=headers)
+                    self._store(key, entry)
+                return _cached_response(entry)
+
+            self._count(False)
+            headers = CaseInsensitiveDict(response.get_headers() or {})
+            if _cacheable(response) and ('ETag' in headers or 'Last-Modified' in headers):
+                self._store(key, _Entry(0.0, copy.deepcopy(response.get_result()), headers, response.get_status_code()))
+            else:
+                self._discard(key)
+            return response
+
+        return revalidated
+
+
+class _Flight:
+    """A call in progress, and its outcome once it completes."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.response: Optional[DetailedResponse] = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight(_OperationWrapper):
+    """
+    Coalesces concurrent identical calls of operations.
+
+    While a call is in progress, the calls of the same operation with the same
+    parameters, made from other threads with the same service URL and
+    authenticator, wait for it instead of sending a request
+    of their own, and return its response, or raise its error. The response, and
+    its parsed result, are shared by all these callers, which must therefore not
+    modify them. Calls that stream the response (`stream=True`) are never
+    coalesced. A `SingleFlight` keeps no results once the calls complete; combine
+    it with a cache to reuse them.
+
+    :param tuple operations: (optional) The operations to coalesce. Defaults to
+           `DEFAULT_SINGLE_FLIGHT_OPERATIONS`.
+    :attr int shared: The number of calls that returned the outcome of another
+          call instead of sending a request.
+    """
+
+    def __init__(self, *, operations: Tuple[str, ...] = DEFAULT_SINGLE_FLIGHT_OPERATIONS) -> None:
+        super().__init__(operations)
+        self._flights: Dict[Tuple, _Flight] = {}
+        self._lock = threading.Lock()
+        self.shared = 0
+
+    def _wrap(self, operation: str, method: Callable, call_key: Callable) -> Callable:
+        def coalesced(*args, **kwargs) -> DetailedResponse:
+            if kwargs.get('stream'):
+                return method(*args, **kwargs)
+            key = call_key(args, kwargs)
+            with self._lock:
+                flight = self._flights.get(key)
+                leader = flight is None
+                if leader:
+                    flight = self._flights[key] = _Flight()
+                else:
+                    self.shared += 1
+
+            if not leader:
+                flight.done.wait()
+                if flight.error is not None:
+                    raise flight.error
+                return flight.response
+
+            try:
+                flight.response = method(*args, **kwargs)
+                return flight.response
+            except BaseException as e:
+                flight.error = e
+                raise
+            finally:
+                with self._lock:
+                    del self._flights[key]
+                flight.done.set()
+
+        return coalesced
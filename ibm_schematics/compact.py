@@ -0,0 +1,230 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compact, slot based variants of the Schematics models.
+
+Every generated model keeps its properties in a per-instance `__dict__`. When many
+models are held in memory, for example in a cache of workspaces or inventories, the
+dictionaries dominate the memory used. `compact_class(WorkspaceResponse)` returns a
+variant of the model that stores its properties in `__slots__` instead, with the
+same constructor, properties, enums, `from_dict`, `to_dict`, string form and
+equality. Nested models are compact too.
+"""
+
+from typing import Any, Dict, Type
+import base64
+import inspect
+import json
+import threading
+
+from ibm_cloud_sdk_core.utils import datetime_to_string
+
+from .common import string_to_datetime
+from .serialization import BYTES, DATETIME, MODEL, MODEL_LIST, field_specs
+
+__all__ = ['compact_class', 'compact_from_dict', 'is_compact']
+
+_compact_classes: Dict[type, type] = {}
+_lock = threading.RLock()
+
+_INIT_TEMPLATE = '''
+def __init__(self, {parameters}):
+{assignments}
+'''
+
+
+def _from_json(spec, value: Any) -> Any:
+    if spec.kind == DATETIME:
+        return string_to_datetime(value)
+    if spec.kind == BYTES:
+        return base64.b64decode(value)
+    if spec.kind == MODEL:
+        return compact_class(spec.model).from_dict(value)
+    if spec.kind == MODEL_LIST:
+        model = compact_class(spec.model)
+        return [model.from_dict(v) for v in value]
+    return value
+
+
+def _to_json(spec, value: Any) -> Any:
+    if spec.kind == DATETIME:
+        return datetime_to_string(value)
+    if spec.kind == BYTES:
+        return str(base64.b64encode(value), 'utf-8')
+    if spec.kind == MODEL:
+        return value if isinstance(value, dict) else value.to_dict()
+    if spec.kind == MODEL_LIST:
+        return [v if isinstance(v, dict) else v.to_dict() for v in value]
+    return value
+
+
+def _make_init(cls: type, specs: tuple, additional: bool):
+    # Keep the positional order of the required parameters of the model.
+    signature = inspect.signature(cls.__init__)
+    required = [name for name in signature.parameters if name in {spec.name for spec in specs if spec.required}]
+    optional = [spec.name for spec in specs if not spec.required]
+    parameters = required + (['*'] if optional or additional else []) + ['{0}=None'.format(name) for name in optional]
+    assignments = ['    self.{0} = {0}'.format(spec.name) for spec in specs]
+    if additional:
+        parameters.append('**kwargs')
+        assignments.append('    self._additional = kwargs or None')
+    namespace = {}
+    source = _INIT_TEMPLATE.format(parameters=', '.join(parameters), assignments='\n'.join(assignments) or '    pass')
+    exec(source, namespace)  # pylint: disable=exec-used
+    init = namespace['__init__']
+    init.__doc__ = cls.__init__.__doc__
+    init.__qualname__ = '{0}.__init__'.format(cls.__qualname__)
+    return init
+
+
+def _build_compact_class(cls: type) -> type:
+    specs = field_specs(cls)
+    names = tuple(spec.name for spec in specs)
+    required = tuple(spec.name for spec in specs if spec.required)
+    # Models of the older generator accept a null required property and keep the
+    # JSON properties they do not define.
+    properties = getattr(cls, '_properties', None)
+    additional = properties is not None
+
+    def from_dict(compact_cls: type, _dict: Dict) -> Any:
+        """Initialize a compact model from a json dictionary."""
+        for name in required:
+            if (name not in _dict) if additional else (_dict.get(name) is None):
+                raise ValueError('Required property \'{0}\' not present in {1} JSON'.format(name, cls.__name__))
+        model = object.__new__(compact_cls)
+        for spec in specs:
+            value = _dict.get(spec.name)
+            object.__setattr__(model, spec.name, None if value is None else _from_json(spec, value))
+        if additional:
+            extra = {key: value for (key, value) in _dict.items() if key not in properties}
+            object.__setattr__(model, '_additional', extra or None)
+        return model
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        for spec in specs:
+            value = getattr(self, spec.name)
+            if value is not None:
+                _dict[spec.name] = _to_json(spec, value)
+        if additional and self._additional:
+            for key, value in self._additional.items():
+                if value is not None:
+                    _dict[key] = value
+        return _dict
+
+    def state(self) -> tuple:
+        values = tuple(getattr(self, name) for name in names)
+        return values + (self._additional or None,) if additional else values
+
+    def __eq__(self, other: Any) -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return state(self) == state(other)
+
+    def __ne__(self, other: Any) -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    def __str__(self) -> str:
+        """Return a `str` version of this model."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __reduce__(self):
+        return compact_from_dict, (cls, self.to_dict())
+
+    namespace = {
+        '__slots__': names + (('_additional',) if additional else ()),
+        '__module__': cls.__module__,
+        '__qualname__': cls.__qualname__,
+        '__doc__': cls.__doc__,
+        '__init__': _make_init(cls, specs, additional),
+        'from_dict': classmethod(from_dict),
+        '_from_dict': classmethod(from_dict),
+        'to_dict': to_dict,
+        '_to_dict': to_dict,
+        '__str__': __str__,
+        '__eq__': __eq__,
+        '__ne__': __ne__,
+        '__hash__': None,
+        '__reduce__': __reduce__,
+        '_model_class': cls,
+    }
+    if additional:
+        namespace['_properties'] = properties
+        namespace['__getattr__'] = _get_additional
+        namespace['__setattr__'] = _set_additional
+    # The nested enums, such as Job.StatusEnum.
+    for name, value in vars(cls).items():
+        if isinstance(value, type) and not name.startswith('_'):
+            namespace[name] = value
+    return type(cls.__name__, (), namespace)
+
+
+def _get_additional(self, name: str) -> Any:
+    additional = object.__getattribute__(self, '_additional')
+    if additional is not None and name in additional:
+        return additional[name]
+    raise AttributeError("'{0}' object has no attribute '{1}'".format(type(self).__name__, name))
+
+
+def _set_additional(self, name: str, value: Any) -> None:
+    try:
+        object.__setattr__(self, name, value)
+    except AttributeError:
+        if self._additional is None:
+            object.__setattr__(self, '_additional', {})
+        self._additional[name] = value
+
+
+def compact_class(cls: type) -> type:
+    """
+    Return the compact variant of a model class.
+
+    The variant is created on first use and shared afterwards. It is not a subclass
+    of `cls`; use `is_compact` to tell compact models apart.
+
+    :param type cls: A model class such as `WorkspaceResponse`.
+    :return: The slot based variant of `cls`.
+    :rtype: type
+    """
+    compact_cls = _compact_classes.get(cls)
+    if compact_cls is None:
+        with _lock:
+            compact_cls = _compact_classes.get(cls)
+            if compact_cls is None:
+                compact_cls = _compact_classes[cls] = _build_compact_class(cls)
+    return compact_cls
+
+
+def compact_from_dict(cls: Type, _dict: Dict) -> Any:
+    """
+    Initialize the compact variant of a model from a json dictionary.
+
+    :param type cls: A model class such as `InventoryResourceRecord`.
+    :param dict _dict: A JSON object returned by the service.
+    :return: An instance of `compact_class(cls)`.
+    :raises ValueError: when a required property is not present in `_dict`.
+    """
+    return compact_class(cls).from_dict(_dict)
+
+
+def is_compact(model: Any) -> bool:
+    """Return `True` when `model` is an instance of a compact model class."""
+    model_class = getattr(type(model), '_model_class', None)
+    return model_class is not None and _compact_classes.get(model_class) is type(model)
@@ -0,0 +1,276 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Download the output files of Schematics jobs without holding them in memory.
+
+`get_job_files` returns the content of a job file, such as a Terraform state, as
+the `file_content` string of a `JobFileData` object, so the whole file is held in
+memory, twice, while the response is parsed. `download_job_file` streams the
+response instead and writes the content to a file or a binary buffer as it
+arrives:
+
+    download_job_file(schematics_service, job_id, 'state_file', 'terraform.tfstate')
+"""
+
+from json.decoder import scanstring
+from typing import BinaryIO, Callable, Union
+import base64
+import codecs
+import contextlib
+import logging
+import os
+import re
+import zlib
+
+from .schematics_v1 import SchematicsV1
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# The body of a JSON string, up to its closing quote or a trailing backslash.
+_STRING_BODY = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+_HIGH_SURROGATE = re.compile(r'\\u[dD][89abAB][0-9a-fA-F]{2}')
+_WHITESPACE = ' \t\r\n'
+
+
+class _JsonStringProperty:
+    """
+    Extracts the value of a string property of the top-level object of a JSON
+    document fed in pieces, passing the decoded value to `write` in pieces too.
+
+    Only the structure of the document is followed; the other values are skipped
+    without being decoded, and the value is decoded a piece at a time by the
+    string scanner of the `json` module.
+    """
+
+    def __init__(self, name: str, write: Callable[[str], None]) -> None:
+        self.name = name
+        self.found = False
+        self._write = write
+        self._carry = ''
+        self._depth = 0
+        self._state = 'structure'  # or 'key', 'string' or 'value'
+        self._expect_key = False
+        self._key: list = []
+        self._last_key = None
+        self._value_next = False
+
+    def feed(self, text: str) -> None:
+        """Process the next piece of the document."""
+        text = self._carry + text if self._carry else text
+        self._carry = ''
+        position, end = 0, len(text)
+        while position < end:
+            if self._state == 'structure':
+                position = self._structure(text, position)
+            else:
+                position = self._string(text, position)
+            if position < 0:
+                return
+
+    def close(self) -> None:
+        """Check that the document ended where a document can end."""
+        if self._carry or self._state != 'structure' or self._depth != 0:
+            raise ValueError('The JSON document is truncated')
+
+    def _structure(self, text: str, position: int) -> int:
+        char = text[position]
+        if char in _WHITESPACE:
+            return position + 1
+        if char == '"':
+            if self._value_next:
+                self._state = 'value'
+                self.found = True
+            elif self._depth == 1 and self._expect_key:
+                self._state = 'key'
+                self._key = []
+            else:
+                self._state = 'string'
+            self._value_next = False
+            return position + 1
+        self._value_next = False
+        if char in '{[':
+            self._depth += 1
+            self._expect_key = char == '{' and self._depth == 1
+        elif char in '}]':
+            self._depth -= 1
+        elif self._depth == 1 and char == ',':
+            self._expect_key = True
+        elif self._depth == 1 and char == ':':
+            self._expect_key = False
+            self._value_next = self._last_key == self.name and not self.found
+        return position + 1
+
+    def _string(self, text: str, position: int) -> int:
+        stop = _STRING_BODY.match(text, position).end()
+        closed = stop < len(text) and text[stop] == '"'
+        if not closed and self._state == 'value':
+            stop = self._complete_escapes_end(text, position, stop)
+        if stop > position:
+            if self._state == 'value':
+                self._write(scanstring(text[position:stop] + '"', 0, False)[0])
+            elif self._state == 'key':
+                self._key.append(text[position:stop])
+        if not closed:
+            self._carry = text[stop:]
+            return -1
+        if self._state == 'key':
+            self._last_key = scanstring(''.join(self._key) + '"', 0, False)[0]
+        self._state = 'structure'
+        return stop + 1
+
+    @staticmethod
+    def _complete_escapes_end(text: str, start: int, stop: int) -> int:
+        """
+        Return where to cut a piece of a string ending at `stop` so that the next
+        piece starts with any escape sequence that may be incomplete, or that is
+        the first half of a surrogate pair.
+        """
+
+        def run_start(index: int) -> int:
+            while index > start and text[index - 1] == '\\':
+                index -= 1
+            return index
+
+        # A backslash that follows another character always starts an escape.
+        backslash = text.find('\\', max(start, stop - 6), stop)
+        cut = run_start(backslash) if backslash >= 0 else stop
+        high = cut - 6
+        if (
+            high >= start
+            and _HIGH_SURROGATE.match(text, high)
+            and (high - run_start(high)) % 2 == 0  # an even number of backslashes before it
+        ):
+            cut = high
+        return cut
+
+
+class _Base64Decoder:
+    """Decodes base64 data fed in pieces."""
+
+    def __init__(self) -> None:
+        self._pending = b''
+
+    def decompress(self, data: bytes) -> bytes:
+        """Return the decoded bytes of the complete groups fed so far."""
+        data = self._pending + data.translate(None, b' \t\r\n')
+        usable = len(data) - len(data) % 4
+        self._pending = data[usable:]
+        return base64.b64decode(data[:usable], validate=True)
+
+    def flush(self) -> bytes:
+        """Return the rest of the decoded bytes."""
+        if self._pending:
+            raise ValueError('The base64 content is truncated')
+        return b''
+
+
+def download_job_file(
+    client: SchematicsV1,
+    job_id: str,
+    file_type: str,
+    dest: Union[str, os.PathLike, BinaryIO],
+    *,
+    base64_content: bool = False,
+    decompress: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **kwargs,
+) -> int:
+    """
+    Download an output file of a job, such as its Terraform state, to a file or a
+    binary buffer.
+
+    The response of `get_job_files` is read in chunks of `chunk_size` bytes,
+    decompressed by the HTTP client when the service compresses it, and the
+    `file_content` property is decoded from it as it arrives and written as UTF-8.
+    Neither the response nor the file is ever held in memory as a whole.
+
+    :param SchematicsV1 client: The service client.
+    :param str job_id: The ID of the job.
+    :param str file_type: The type of file, for example `state_file` or
+           `plan_json`.
+    :param dest: The path of the file to write, which is removed again when the
+           download fails, or a writable binary buffer.
+    :param bool base64_content: (optional) Whether the content of the file is
+           base64 encoded; it is then decoded before it is written.
+    :param bool decompress: (optional) Whether the content of the file is gzip or
+           zlib compressed; it is then decompressed before it is written.
+    :param int chunk_size: (optional) The number of bytes read from the response
+           at a time.
+    :param dict headers: (optional) A `dict` containing the request headers.
+    :return: The number of bytes written.
+    :rtype: int
+    :raises ValueError: when the response does not hold the content of a file.
+    """
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be a positive integer')
+    if hasattr(dest, 'write'):
+        return _download(client, job_id, file_type, dest, base64_content, decompress, chunk_size, kwargs)
+    try:
+        with open(dest, 'wb') as file:
+            return _download(client, job_id, file_type, file, base64_content, decompress, chunk_size, kwargs)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(dest)
+        raise
+
+
+def _download(
+    client: SchematicsV1,
+    job_id: str,
+    file_type: str,
+    dest: BinaryIO,
+    base64_content: bool,
+    decompress: bool,
+    chunk_size: int,
+    kwargs: dict,
+) -> int:
+    decoders = []
+    if base64_content:
+        decoders.append(_Base64Decoder())
+    if decompress:
+        decoders.append(zlib.decompressobj(wbits=47))  # gzip or zlib header
+    written = 0
+
+    def write_bytes(data: bytes, final: bool = False) -> None:
+        nonlocal written
+        for decoder in decoders:
+            data = decoder.decompress(data)
+            if final:
+                data += decoder.flush()
+        if data:
+            dest.write(data)
+            written += len(data)
+
+    def write_text(text: str) -> None:
+        write_bytes(text.encode('utf-8', 'surrogatepass'))
+
+    kwargs['stream'] = True
+    response = client.get_job_files(job_id, file_type, **kwargs).get_result()
+    parser = _JsonStringProperty('file_content', write_text)
+    text_decoder = codecs.getincrementaldecoder('utf-8')()
+    with contextlib.closing(response):
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            parser.feed(text_decoder.decode(chunk))
+        parser.feed(text_decoder.decode(b'', final=True))
+    parser.close()
+    if not parser.found:
+        raise ValueError('The response of job {0} has no {1} content'.format(job_id, file_type))
+    write_bytes(b'', final=True)
+    logger.debug('Downloaded %d bytes of the %s of job %s', written, file_type, job_id)
+    return written
@@ -0,0 +1,554 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Per-operation measurements of Schematics calls.
+
+`Instrumentation` measures every operation of the service instances it is
+attached to: its latency, the status code of its response, the bytes sent and
+received and the number of retries. Each call is summarized in a `CallRecord`,
+which is added to a `MetricsRegistry` of histograms, passed to listeners and,
+optionally, recorded as an OpenTelemetry span:
+
+    instrumentation = Instrumentation()
+    instrumentation.attach(schematics_service)
+    ...
+    for summary in instrumentation.registry.summary():
+        print(summary)
+
+`summary()` lists the operations by the total time spent in them, so that the
+calls that dominate the latency of an application come first.
+"""
+
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+import asyncio
+import bisect
+import contextvars
+import functools
+import logging
+import threading
+import time
+
+from ibm_cloud_sdk_core import ApiException
+
+from .schematics_v1 import SchematicsV1
+from .schematics_2_0_api_v2 import Schematics20ApiV2
+from .version import __version__
+
+try:
+    from opentelemetry import trace
+except ImportError:  # pragma: no cover
+    trace = None
+
+logger = logging.getLogger(__name__)
+
+# The upper bounds of the buckets of the latency histograms, in seconds.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# The upper bounds of the buckets of the size histograms, in bytes.
+SIZE_BUCKETS = tuple(256 * 4**exponent for exponent in range(11))
+
+_SERVICE_MODULES = (SchematicsV1.__module__, Schematics20ApiV2.__module__)
+
+
+class CallRecord(NamedTuple):
+    """
+    The measurements of one call of an operation.
+
+    :attr str operation: The name of the operation, for example `get_workspace`.
+    :attr str service: The name of the service class, for example `SchematicsV1`.
+    :attr float latency: The duration of the call, in seconds, from the
+          preparation of the request to the parsing of the response, including
+          retries.
+    :attr int status_code: The status code of the last response, or None when no
+          response was received.
+    :attr int request_bytes: The size of the request bodies sent.
+    :attr int response_bytes: The size of the response bodies received.
+    :attr int retries: The number of requests sent again after the first one.
+    :attr str error: The name of the type of the error raised by the call, or
+          None when it succeeded.
+    """
+
+    operation: str
+    service: str
+    latency: float
+    status_code: Optional[int] = None
+    request_bytes: int = 0
+    response_bytes: int = 0
+    retries: int = 0
+    error: Optional[str] = None
+
+
+class Histogram:
+    """
+    A thread-safe histogram with fixed buckets.
+
+    :param tuple buckets: The upper bounds of the buckets, in increasing order;
+           the values above the last bound are counted in an overflow bucket.
+    """
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        if not buckets or list(buckets) != sorted(set(buckets)):
+            raise ValueError('buckets must be a non-empty sequence of increasing bounds')
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Add a value."""
+        with self._lock:
+            self.counts[bisect.bisect_left(self.buckets, value)] += 1
+            self.count += 1
+            self.sum += value
+            self.min = value if self.min is None else min(self.min, value)
+            self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile of the values, by linear interpolation within the
+        bucket it falls into.
+
+        :param float q: The quantile, between 0 and 1, for example 0.99.
+        :return: The estimate, or None when there are no values.
+        :rtype: float
+        """
+        if not 0 <= q <= 1:
+            raise ValueError('q must be between 0 and 1')
+        with self._lock:
+            if not self.count:
+                return None
+            rank = q * self.count
+            cumulative = 0
+            for index, count in enumerate(self.counts):
+                if count and cumulative + count >= rank:
+                    lower = self.buckets[index - 1] if index > 0 else self.min
+                    upper = self.buckets[index] if index < len(self.buckets) else self.max
+                    lower, upper = max(lower, self.min), min(upper, self.max)
+                    return lower + (upper - lower) * max(rank - cumulative, 0) / count
+                cumulative += count
+            return self.max  # pragma: no cover
+
+    @property
+    def mean(self) -> Optional[float]:
+        """The mean of the values, or None when there are none."""
+        return self.sum / self.count if self.count else None
+
+
+class OperationSummary(NamedTuple):
+    """
+    The measurements of the calls of an operation, see `MetricsRegistry.summary`.
+    """
+
+    operation: str
+    calls: int
+    errors: int
+    retries: int
+    total_latency: float
+    p50_latency: float
+    p99_latency: float
+    request_bytes: int
+    response_bytes: int
+    status_codes: Dict[int, int]
+
+    def __str__(self) -> str:
+        return '{0}: {1} calls, {2} errors, {3} retries, {4:.3f} s total, p50 {5:.3f} s, p99 {6:.3f} s'.format(
+            self.operation,
+            self.calls,
+            self.errors,
+            self.retries,
+            self.total_latency,
+            self.p50_latency,
+            self.p99_latency,
+        )
+
+
+class _OperationMetrics:
+    def __init__(self, latency_buckets: Sequence[float], size_buckets: Sequence[float]) -> None:
+        self.latency = Histogram(latency_buckets)
+        self.request_bytes = Histogram(size_buckets)
+        self.response_bytes = Histogram(size_buckets)
+        self.errors = 0
+        self.retries = 0
+        self.status_codes: Counter = Counter()
+
+
+class MetricsRegistry:
+    """
+    An in-process registry of the histograms of the calls of each operation.
+
+    The registry can be shared by any number of `Instrumentation` objects and
+    threads.
+
+    :param tuple latency_buckets: (optional) The buckets of the latency
+           histograms, in seconds.
+    :param tuple size_buckets: (optional) The buckets of the request and response
+           size histograms, in bytes.
+    """
+
+    METRICS = ('latency', 'request_bytes', 'response_bytes')
+
+    def __init__(
+        self, *, latency_buckets: Sequence[float] = LATENCY_BUCKETS, size_buckets: Sequence[float] = SIZE_BUCKETS
+    ) -> None:
+        self.latency_buckets = tuple(latency_buckets)
+        self.size_buckets = tuple(size_buckets)
+        self._operations: Dict[str, _OperationMetrics] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, record: CallRecord) -> None:
+        self.record(record)
+
+    def record(self, record: CallRecord) -> None:
+        """Add the measurements of a call."""
+        with self._lock:
+            metrics = self._operations.get(record.operation)
+            if metrics is None:
+                metrics = self._operations[record.operation] = _OperationMetrics(
+                    self.latency_buckets, self.size_buckets
+                )
+            if record.error is not None:
+                metrics.errors += 1
+            metrics.retries += record.retries
+            if record.status_code is not None:
+                metrics.status_codes[record.status_code] += 1
+        metrics.latency.observe(record.latency)
+        metrics.request_bytes.observe(record.request_bytes)
+        metrics.response_bytes.observe(record.response_bytes)
+
+    @property
+    def operations(self) -> List[str]:
+        """The names of the operations measured so far."""
+        with self._lock:
+            return sorted(self._operations)
+
+    def histogram(self, operation: str, metric: str = 'latency') -> Optional[Histogram]:
+        """
+        Return a histogram of an operation.
+
+        :param str operation: The name of the operation.
+        :param str metric: (optional) `latency`, `request_bytes` or
+               `response_bytes`.
+        :return: The histogram, or None when the operation was not measured.
+        :rtype: Histogram
+        """
+        if metric not in self.METRICS:
+            raise ValueError('metric must be one of {0}'.format(', '.join(self.METRICS)))
+        with self._lock:
+            metrics = self._operations.get(operation)
+        return getattr(metrics, metric) if metrics is not None else None
+
+    def summary(self) -> List[OperationSummary]:
+        """
+        Return the measurements of every operation, by decreasing total latency.
+
+        :rtype: list
+        """
+        with self._lock:
+            operations = list(self._operations.items())
+        summaries = [
+            OperationSummary(
+                operation,
+                metrics.latency.count,
+                metrics.errors,
+                metrics.retries,
+                metrics.latency.sum,
+                metrics.latency.quantile(0.5),
+                metrics.latency.quantile(0.99),
+                int(metrics.request_bytes.sum),
+                int(metrics.response_bytes.sum),
+                dict(metrics.status_codes),
+            )
+            for operation, metrics in operations
+            if metrics.latency.count
+        ]
+        return sorted(summaries, key=lambda summary: summary.total_latency, reverse=True)
+
+    def reset(self) -> None:
+        """Forget every measurement."""
+        with self._lock:
+            self._operations.clear()
+
+
+def opentelemetry_tracer() -> Any:
+    """
+    Return the OpenTelemetry tracer of the SDK, from the global tracer provider.
+
+    The `opentelemetry-api` package must be installed
+    (`pip install "ibm-schematics[opentelemetry]"`).
+
+    :rtype: opentelemetry.trace.Tracer
+    """
+    if trace is None:
+        raise ImportError(
+            'OpenTelemetry spans require the opentelemetry-api package; '
+            'install it with: pip install "ibm-schematics[opentelemetry]"'
+        )
+    return trace.get_tracer('ibm_schematics', __version__)
+
+
+class _Call:
+    """The exchanges of a call in progress."""
+
+    def __init__(self, stream: bool) -> None:
+        self.stream = stream
+        self.exchanges = 0
+        self.status_code: Optional[int] = None
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.retries = 0
+
+    def exchange(self, status_code: int, request_bytes: int, response_bytes: int, retries: int = 0) -> None:
+        self.exchanges += 1
+        self.status_code = status_code
+        self.request_bytes += request_bytes
+        self.response_bytes += response_bytes
+        self.retries += retries
+
+
+_current_call: contextvars.ContextVar = contextvars.ContextVar('ibm_schematics_call', default=None)
+
+
+def _content_length(headers: Any) -> Optional[int]:
+    try:
+        return int(headers['Content-Length'])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _body_size(body: Any) -> int:
+    if isinstance(body, str):
+        return len(body.encode('utf-8'))
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    return 0
+
+
+def _response_hook(response, *args, **kwargs) -> None:  # pylint: disable=unused-argument
+    """Records an HTTP exchange of a `requests` session in the call in progress."""
+    call = _current_call.get()
+    if call is None:
+        return
+    request_bytes = _content_length(response.request.headers)
+    if request_bytes is None:
+        request_bytes = _body_size(response.request.body)
+    response_bytes = _content_length(response.headers)
+    if response_bytes is None:
+        response_bytes = 0 if call.stream else len(response.content or b'')
+    history = getattr(getattr(response.raw, 'retries', None), 'history', None) or ()
+    call.exchange(response.status_code, request_bytes, response_bytes, len(history))
+
+
+class Instrumentation:
+    """
+    Measures the operations of service instances.
+
+    Every call of an operation is summarized in a `CallRecord`, added to
+    `registry` and passed to each listener. Listeners are called in the thread
+    of the call, and their errors are logged and ignored. With a `tracer`, every
+    call is also recorded as a client span named after its operation, for
+    example `schematics.get_workspace`.
+
+    The bytes and retries of the synchronous services are measured on the
+    `requests` session of the service, including the retries of
+    `enable_retries()`; those of the asyncio services are measured per request,
+    so the retries made within their transport are not counted. Sizes are the
+    `Content-Length` of the requests and responses, when they have one, so
+    compressed bodies count their compressed size.
+
+    :param MetricsRegistry registry: (optional) The registry to add the records
+           to. Defaults to a new registry.
+    :param iterable listeners: (optional) Functions called with each
+           `CallRecord`.
+    :param tracer: (optional) An OpenTelemetry tracer, for example
+           `opentelemetry_tracer()`.
+    :param tuple operations: (optional) The names of the operations to measure.
+           Defaults to every operation of the service.
+    """
+
+    def __init__(
+        self,
+        *,
+        registry: Optional[MetricsRegistry] = None,
+        listeners: Iterable[Callable[[CallRecord], None]] = (),
+        tracer: Any = None,
+        operations: Optional[Tuple[str, ...]] = None,
+    ) -> None:
+        self.registry = registry if registry is not None else MetricsRegistry()
+        self.listeners = list(listeners)
+        self.tracer = tracer
+        self.operations = tuple(operations) if operations is not None else None
+
+    def attach(self, client: Any) -> Any:
+        """
+        Measure the operations of a service instance.
+
+        :param client: A `SchematicsV1`, `Schematics20ApiV2` or asyncio service
+               instance.
+        :return: `client` itself.
+        :raises ValueError: when the client has no operation with a configured name.
+        """
+        is_async = asyncio.iscoroutinefunction(client.send)
+        for operation in self.operations or _operations(client):
+            method = getattr(client, operation, None)
+            if method is None:
+                raise ValueError('{0} has no operation named {1}'.format(type(client).__name__, operation))
+            wrapper = self._wrap_async(client, operation, method) if is_async else self._wrap(client, operation, method)
+            wrapper = functools.wraps(method)(wrapper)
+            wrapper.__instrumentation__ = self
+            setattr(client, operation, wrapper)
+        if is_async:
+            send = client.send
+            measured = functools.wraps(send)(_measure_async_send(send))
+            measured.__instrumentation__ = self
+            client.send = measured
+        return client
+
+    def detach(self, client: Any) -> None:
+        """
+        Stop measuring the operations of a service instance.
+
+        :param client: A service instance this object was attached to.
+        """
+        for name, value in list(vars(client).items()):
+            if getattr(value, '__instrumentation__', None) is self:
+                delattr(client, name)
+        http_client = getattr(client, 'http_client', None)
+        hooks = getattr(http_client, 'hooks', {}).get('response', [])
+        if _response_hook in hooks:
+            hooks.remove(_response_hook)
+
+    def _wrap(self, client: Any, operation: str, method: Callable) -> Callable:
+        def measured(*args, **kwargs):
+            hooks = client.get_http_client().hooks['response']
+            if _response_hook not in hooks:
+                hooks.append(_response_hook)
+            call = _Call(bool(kwargs.get('stream')))
+            span = self._start_span(client, operation)
+            token = _current_call.set(call)
+            start = time.perf_counter()
+            try:
+                response = method(*args, **kwargs)
+            except BaseException as e:
+                self._finish(client, operation, call, start, span, e)
+                raise
+            finally:
+                _current_call.reset(token)
+            self._finish(client, operation, call, start, span, None)
+            return response
+
+        return measured
+
+    def _wrap_async(self, client: Any, operation: str, method: Callable) -> Callable:
+        async def measured(*args, **kwargs):
+            call = _Call(bool(kwargs.get('stream')))
+            span = self._start_span(client, operation)
+            token = _current_call.set(call)
+            start = time.perf_counter()
+            try:
+                response = await method(*args, **kwargs)
+            except BaseException as e:
+                self._finish(client, operation, call, start, span, e)
+                raise
+            finally:
+                _current_call.reset(token)
+            self._finish(client, operation, call, start, span, None)
+            return response
+
+        return measured
+
+    def _start_span(self, client: Any, operation: str) -> Any:
+        if self.tracer is None:
+            return None
+        attributes = {'rpc.system': 'ibm_schematics', 'rpc.service': type(client).__name__, 'rpc.method': operation}
+        if trace is not None:
+            return self.tracer.start_span('schematics.' + operation, kind=trace.SpanKind.CLIENT, attributes=attributes)
+        return self.tracer.start_span('schematics.' + operation, attributes=attributes)
+
+    def _finish(
+        self, client: Any, operation: str, call: _Call, start: float, span: Any, error: Optional[BaseException]
+    ) -> None:
+        latency = time.perf_counter() - start
+        status_code = call.status_code
+        if isinstance(error, ApiException) and not call.exchanges:
+            status_code = error.status_code
+        record = CallRecord(
+            operation,
+            type(client).__name__,
+            latency,
+            status_code,
+            call.request_bytes,
+            call.response_bytes,
+            call.retries + max(call.exchanges - 1, 0),
+            type(error).__name__ if error is not None else None,
+        )
+        if span is not None:
+            _end_span(span, record, error)
+        for listener in [self.registry.record] + self.listeners:
+            try:
+                listener(record)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception('The instrumentation listener %r failed', listener)
+
+
+def _end_span(span: Any, record: CallRecord, error: Optional[BaseException]) -> None:
+    if record.status_code is not None:
+        span.set_attribute('http.response.status_code', record.status_code)
+    span.set_attribute('schematics.request_bytes', record.request_bytes)
+    span.set_attribute('schematics.response_bytes', record.response_bytes)
+    span.set_attribute('schematics.retries', record.retries)
+    if error is not None:
+        span.record_exception(error)
+        if trace is not None:
+            span.set_status(trace.Status(trace.StatusCode.ERROR, str(error)))
+    span.end()
+
+
+def _measure_async_send(send: Callable) -> Callable:
+    async def measured(request: dict, **kwargs):
+        call = _current_call.get()
+        if call is None:
+            return await send(request, **kwargs)
+        request_bytes = _body_size(request.get('data'))
+        try:
+            response = await send(request, **kwargs)
+        except ApiException as e:
+            http_response = e.http_response
+            if http_response is not None:
+                response_bytes = _content_length(http_response.headers)
+                if response_bytes is None:
+                    response_bytes = len(getattr(http_response, 'content', b'') or b'')
+                call.exchange(e.status_code, request_bytes, response_bytes)
+            raise
+        call.exchange(response.get_status_code(), request_bytes, _content_length(response.get_headers()) or 0)
+        return response
+
+    return measured
+
+
+def _operations(client: Any) -> List[str]:
+    """Return the names of the operations of a service instance."""
+    names = set()
+    for cls in type(client).__mro__:
+        if cls.__module__ not in _SERVICE_MODULES:
+            continue
+        for name, value in vars(cls).items():
+            if not name.startswith('_') and callable(value) and not isinstance(value, (classmethod, staticmethod)):
+                names.add(name)
+    return sorted(names)
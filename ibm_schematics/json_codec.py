@@ -0,0 +1,208 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Faster JSON codecs for parsing responses and serializing request bodies.
+
+The service parses every JSON response with the `json` module of the standard
+library, which accounts for much of the CPU time of large responses such as those
+of `list_jobs` or `list_workspaces`. A `JsonCodec` attached to a service instance
+parses them with `orjson` or `ujson` instead, when installed, and serializes the
+bodies of `create_workspace`, `create_action` and `create_job` with it too:
+
+    get_codec().attach(schematics_service)
+
+The results are the same as with the standard library. A response that the codec
+cannot parse exactly, for example because it holds an integer wider than 64 bits
+or a control character in a string, is parsed by the standard library instead.
+"""
+
+from typing import Any, Callable, List, Union
+import asyncio
+import functools
+import importlib
+import json
+
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+from ibm_cloud_sdk_core.utils import is_json_mimetype
+import requests
+
+# The codecs, by name, in order of preference.
+CODECS = ('orjson', 'ujson', 'json')
+
+# Documents with a run of 19 digits may hold an integer wider than 64 bits, which orjson
+# and ujson parse as a float or not at all. Mapping every digit to 0 and searching for
+# the run is many times faster than a regular expression.
+_DIGITS_TO_ZERO = bytes.maketrans(b'123456789', b'000000000')
+_LONG_DIGITS = b'0' * 19
+
+
+class JsonCodec:
+    """
+    A JSON implementation used by service instances.
+
+    :param str name: The name of the implementation, such as `orjson`.
+    :param loads: The function that parses a JSON document from bytes; it raises
+           `ValueError` for the documents it does not parse exactly.
+    :param dumps: The function that serializes a value to a JSON `str` or UTF-8
+           `bytes`.
+    """
+
+    def __init__(self, name: str, loads: Callable[[bytes], Any], dumps: Callable[[Any], Union[str, bytes]]) -> None:
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+
+    def __repr__(self) -> str:
+        return 'JsonCodec({0!r})'.format(self.name)
+
+    def attach(self, client: Any) -> Any:
+        """
+        Parse the responses of a service instance, and serialize its request
+        bodies, with this codec.
+
+        :param client: A `SchematicsV1` or `Schematics20ApiV2` instance.
+        :return: `client` itself.
+        """
+        if asyncio.iscoroutinefunction(client.send):
+            raise ValueError('JSON codecs can only be attached to synchronous service instances')
+        self.detach(client)
+
+        def dumps(value: Any) -> Union[str, bytes]:
+            return self.dumps(value)
+
+        dumps.__json_codec__ = self
+        client.json_dumps = dumps
+        send = functools.wraps(client.send)(self._wrap(client.send))
+        send.__json_codec__ = self
+        client.send = send
+        return client
+
+    def detach(self, client: Any) -> None:
+        """
+        Restore the standard library JSON implementation of a service instance.
+
+        :param client: A service instance a codec was attached to.
+        """
+        for name in ('json_dumps', 'send'):
+            if getattr(vars(client).get(name), '__json_codec__', None) is not None:
+                delattr(client, name)
+
+    def _wrap(self, send: Callable) -> Callable:
+        def decoded(request: dict, **kwargs) -> DetailedResponse:
+            if kwargs.get('stream'):
+                return send(request, **kwargs)
+            response = send(request, **dict(kwargs, stream=True))
+            http_response = response.get_result()
+            if not isinstance(http_response, requests.Response):
+                return response
+            result = http_response
+            if not http_response.content:
+                result = None
+            elif is_json_mimetype(http_response.headers.get('Content-Type')):
+                result = self._decode(http_response)
+            return DetailedResponse(response=result, headers=response.get_headers(), status_code=response.status_code)
+
+        return decoded
+
+    def _decode(self, http_response: requests.Response) -> Any:
+        try:
+            return self.loads(http_response.content)
+        except ValueError:
+            pass
+        # The path of `BaseService.send`.
+        try:
+            return http_response.json(strict=False)
+        except json.JSONDecodeError as err:
+            raise ApiException(
+                code=http_response.status_code,
+                http_response=http_response,
+                message='Error processing the HTTP response',
+            ) from err
+
+
+def _orjson_codec() -> JsonCodec:
+    orjson = importlib.import_module('orjson')
+
+    def loads(data: bytes) -> Any:
+        if _LONG_DIGITS in data.translate(_DIGITS_TO_ZERO):
+            raise ValueError('The document may hold an integer wider than 64 bits')
+        return orjson.loads(data)
+
+    def dumps(value: Any) -> Union[str, bytes]:
+        try:
+            return orjson.dumps(value)
+        except TypeError:  # keys that are not strings, integers wider than 64 bits
+            return json.dumps(value)
+
+    return JsonCodec('orjson', loads, dumps)
+
+
+def _ujson_codec() -> JsonCodec:
+    ujson = importlib.import_module('ujson')
+
+    def loads(data: bytes) -> Any:
+        if _LONG_DIGITS in data.translate(_DIGITS_TO_ZERO):
+            raise ValueError('The document may hold an integer wider than 64 bits')
+        return ujson.loads(data)
+
+    def dumps(value: Any) -> Union[str, bytes]:
+        try:
+            return ujson.dumps(value)
+        except (TypeError, ValueError, OverflowError):  # NaN, integers wider than 64 bits
+            return json.dumps(value)
+
+    return JsonCodec('ujson', loads, dumps)
+
+
+def _json_codec() -> JsonCodec:
+    return JsonCodec('json', json.loads, json.dumps)
+
+
+_FACTORIES = {'orjson': _orjson_codec, 'ujson': _ujson_codec, 'json': _json_codec}
+
+
+def available_codecs() -> List[str]:
+    """
+    Return the names of the codecs that are installed, in order of preference.
+
+    :rtype: list
+    """
+    names = []
+    for name in CODECS:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def get_codec(name: str = 'auto') -> JsonCodec:
+    """
+    Return a JSON codec.
+
+    :param str name: (optional) `orjson`, `ujson`, `json`, or `auto` for the
+           fastest one installed.
+    :rtype: JsonCodec
+    :raises ImportError: when the codec is not installed.
+    """
+    if name == 'auto':
+        name = available_codecs()[0]
+    factory = _FACTORIES.get(name)
+    if factory is None:
+        raise ValueError('name must be one of auto, {0}'.format(', '.join(CODECS)))
+    return factory()
@@ -0,0 +1,160 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Incremental tailing of Schematics job logs.
+
+The `list_job_logs` operation always returns the whole log, base64 encoded in the
+`details` property of a `JobLog`. `tail_job_logs` remembers how many bytes it has
+already emitted and, on every poll, only decodes and splits the part of the log that
+is new. Memory use is bounded by one response plus the last incomplete line,
+whatever the length of the log.
+"""
+
+from typing import Iterator, Optional
+import base64
+import logging
+import time
+
+from .schematics_v1 import Job, SchematicsV1
+from .waiters import JOB_TERMINAL_STATUSES, Backoff, job_status_code
+
+logger = logging.getLogger(__name__)
+
+
+class _LineSplitter:
+    """
+    Split a growing byte stream into lines, keeping only the last incomplete line.
+    """
+
+    def __init__(self, encoding: str) -> None:
+        self._encoding = encoding
+        self._partial = b''
+
+    def feed(self, data: bytes) -> Iterator[str]:
+        """Yield the lines completed by `data`."""
+        if not data:
+            return
+        lines = (self._partial + data).split(b'\n')
+        self._partial = lines.pop()
+        for line in lines:
+            yield self._decode(line)
+
+    def flush(self) -> Iterator[str]:
+        """Yield the last line when the stream ends without a newline."""
+        if self._partial:
+            yield self._decode(self._partial)
+        self._partial = b''
+
+    def reset(self) -> None:
+        """Drop the incomplete line."""
+        self._partial = b''
+
+    def _decode(self, line: bytes) -> str:
+        return line.rstrip(b'\r').decode(self._encoding, errors='replace')
+
+
+def _canonical(encoded: str) -> str:
+    """Remove the line breaks some encoders insert, so that offsets map to characters."""
+    if len(encoded) % 4 or '\n' in encoded:
+        return ''.join(encoded.split())
+    return encoded
+
+
+def _decoded_length(encoded: str) -> int:
+    return len(encoded) // 4 * 3 - encoded[-2:].count('=')
+
+
+def _decode_from(encoded: str, offset: int) -> bytes:
+    """
+    Decode the bytes of a base64 string that follow `offset`, without decoding the
+    bytes before it.
+    """
+    if offset == 0:
+        return base64.b64decode(encoded)
+    start = (offset // 3) * 4
+    return base64.b64decode(encoded[start:])[offset % 3 :]
+
+
+def tail_job_logs(
+    client: SchematicsV1,
+    job_id: str,
+    *,
+    follow: bool = True,
+    timeout: Optional[float] = None,
+    initial_interval: float = 1.0,
+    max_interval: float = 10.0,
+    encoding: str = 'utf-8',
+) -> Iterator[str]:
+    """
+    Yield the lines of a job log as they are written.
+
+    Each poll fetches the log with `list_job_logs` and yields only the lines added
+    since the previous poll. While following, the job status is checked with
+    `get_job` and the generator ends once the job reaches a terminal state and its
+    final log lines have been yielded. The polling interval starts at
+    `initial_interval`, backs off up to `max_interval` while the log is idle and
+    starts over whenever new lines arrive.
+
+    :param SchematicsV1 client: The service client.
+    :param str job_id: Job Id. Use `GET /v2/jobs` API to look up the Job Ids in
+           your IBM Cloud account.
+    :param bool follow: (optional) Keep polling until the job ends; when false,
+           the current log is yielded once.
+    :param float timeout: (optional) The number of seconds to follow the log
+           before giving up; None follows it until the job ends.
+    :param float initial_interval: (optional) The first polling interval, in seconds.
+    :param float max_interval: (optional) The largest polling interval, in seconds.
+    :param str encoding: (optional) The encoding of the log text.
+    :return: An iterator over the log lines, without their line terminators.
+    :rtype: Iterator[str]
+    :raises TimeoutError: when the job is still running after `timeout` seconds.
+    """
+    splitter = _LineSplitter(encoding)
+    backoff = Backoff(initial_interval=initial_interval, max_interval=max_interval)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    offset = 0
+    while True:
+        finished = True
+        if follow:
+            # Read the status before the log, so that the log of a finished job is complete.
+            job = Job.from_dict(client.get_job(job_id=job_id).get_result())
+            finished = job_status_code(job) in JOB_TERMINAL_STATUSES
+
+        encoded = _canonical(client.list_job_logs(job_id=job_id).get_result().get('details') or '')
+        length = _decoded_length(encoded)
+        if length < offset:
+            logger.debug('The log of job %s was truncated; reading it from the start', job_id)
+            offset = 0
+            splitter.reset()
+        data = _decode_from(encoded, offset)
+        del encoded
+        offset = length
+        if data:
+            backoff.reset()
+        yield from splitter.feed(data)
+
+        if finished:
+            yield from splitter.flush()
+            return
+
+        delay = backoff.next_interval()
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError('Timed out after {0} seconds following the log of job {1}'.format(timeout, job_id))
+            delay = min(delay, remaining)
+        time.sleep(delay)
@@ -0,0 +1,185 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The request-building path shared by the operations of both service modules.
+
+Every operation used to build its headers from scratch: a new dictionary, the
+SDK headers of `get_sdk_headers`, the caller's headers and the `Accept` and
+`Content-Type` of the operation, before `BaseService.prepare_request` copied and
+cleaned them again. The headers an operation always sends are now computed once,
+as an immutable `HeaderTemplate`, and `prepare_operation` builds the request
+dictionary of `prepare_request` directly from it in the common case of a request
+without files or compression:
+
+    request = prepare_operation(
+        self, 'V1', 'get_workspace', kwargs, method='GET', url=url, accept='application/json'
+    )
+"""
+
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
+import functools
+
+from ibm_cloud_sdk_core import base_service
+from ibm_cloud_sdk_core.utils import cleanup_value, cleanup_values, remove_null_values, strip_extra_slashes
+from requests.structures import CaseInsensitiveDict
+
+from .common import get_sdk_headers
+
+
+class HeaderTemplate:
+    """
+    The headers an operation always sends.
+
+    The headers of a request are, in increasing order of precedence, the header
+    parameters of the operation, the SDK headers and `Content-Type`, the headers
+    given by the caller and `Accept`.
+
+    :param dict sdk_headers: The headers returned by `get_sdk_headers`.
+    :param str content_type: (optional) The content type of the request body.
+    :param str accept: (optional) The content type of the response.
+    """
+
+    __slots__ = ('_defaults', '_headers', 'accept')
+
+    def __init__(
+        self, sdk_headers: Mapping[str, str], content_type: Optional[str] = None, accept: Optional[str] = None
+    ) -> None:
+        defaults = dict(sdk_headers)
+        if content_type is not None:
+            defaults['content-type'] = content_type
+        headers = dict(defaults)
+        if accept is not None:
+            headers['Accept'] = accept
+        object.__setattr__(self, '_defaults', defaults)
+        object.__setattr__(self, '_headers', headers)
+        object.__setattr__(self, 'accept', accept)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError('HeaderTemplate is immutable')
+
+    def __repr__(self) -> str:
+        return 'HeaderTemplate({0!r})'.format(self._headers)
+
+    @property
+    def defaults(self) -> Mapping[str, str]:
+        """The headers that the caller's headers take precedence over."""
+        return MappingProxyType(self._defaults)
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        """The headers of a request without header parameters or caller's headers."""
+        return MappingProxyType(self._headers)
+
+    def build(self, parameters: Optional[Dict[str, str]] = None, headers: Optional[Dict[str, str]] = None) -> dict:
+        """
+        Return the headers of a request.
+
+        :param dict parameters: (optional) The header parameters of the operation.
+        :param dict headers: (optional) The headers given by the caller.
+        :rtype: dict
+        """
+        if not parameters and not headers:
+            return self._headers.copy()
+        built = dict(parameters) if parameters else {}
+        built.update(self._defaults)
+        if headers:
+            built.update(headers)
+        if self.accept is not None:
+            built['Accept'] = self.accept
+        return built
+
+
+@functools.lru_cache(maxsize=None)
+def header_template(
+    service_name: str, service_version: str, operation_id: str, content_type: Optional[str], accept: Optional[str]
+) -> HeaderTemplate:
+    """
+    Return the header template of an operation, computed on its first call.
+
+    :param str service_name: The name of the service, such as `schematics`.
+    :param str service_version: The version of the service, such as `V1`.
+    :param str operation_id: The name of the operation, such as `get_workspace`.
+    :param str content_type: The content type of the request body, or None.
+    :param str accept: The content type of the response, or None.
+    :rtype: HeaderTemplate
+    """
+    sdk_headers = get_sdk_headers(service_name=service_name, service_version=service_version, operation_id=operation_id)
+    return HeaderTemplate(sdk_headers, content_type, accept)
+
+
+def prepare_operation(
+    service: base_service.BaseService,
+    service_version: str,
+    operation_id: str,
+    kwargs: dict,
+    *,
+    method: str,
+    url: str,
+    content_type: Optional[str] = None,
+    accept: Optional[str] = None,
+    headers: Optional[dict] = None,
+    params: Optional[dict] = None,
+    data=None,
+    files=None,
+) -> dict:
+    """
+    Build the request of an operation, as `BaseService.prepare_request` does.
+
+    :param service: The service instance the operation is called on.
+    :param str service_version: The version of the service, such as `V1`.
+    :param str operation_id: The name of the operation, such as `get_workspace`.
+    :param dict kwargs: The keyword arguments of the operation; its `headers`, the
+           caller's headers, are removed.
+    :param str method: The HTTP method of the request.
+    :param str url: The path of the request.
+    :param str content_type: (optional) The content type of the request body.
+    :param str accept: (optional) The content type of the response.
+    :param dict headers: (optional) The header parameters of the operation.
+    :param dict params: (optional) The query parameters of the operation.
+    :param data: (optional) The request body.
+    :param files: (optional) The parts of a multipart request body.
+    :return: The request, to be passed to `send`.
+    :rtype: dict
+    """
+    template = header_template(service.DEFAULT_SERVICE_NAME, service_version, operation_id, content_type, accept)
+    caller_headers = kwargs.pop('headers', None)
+    built = template.build(headers, caller_headers)
+    if files is not None or not isinstance(data, (str, bytes, type(None))) or service.get_enable_gzip_compression():
+        return service.prepare_request(method=method, url=url, headers=built, params=params, data=data, files=files)
+
+    if not service.service_url:
+        raise ValueError('The service_url is required')
+    if headers or caller_headers:
+        # As remove_null_values and cleanup_values do, in one pass.
+        built = {key: cleanup_value(value) for key, value in built.items() if value is not None}
+    request_headers = CaseInsensitiveDict(built)
+    if service.default_headers is not None:
+        request_headers.update(service.default_headers)
+    if 'user-agent' not in request_headers:
+        request_headers.update(service.user_agent_header)
+    request = {
+        'method': method,
+        'url': strip_extra_slashes(service.service_url + url),
+        'headers': request_headers,
+        'params': cleanup_values(remove_null_values(params)),
+        'data': data.encode('utf-8') if isinstance(data, str) else data,
+        'files': [],
+    }
+    service.authenticator.authenticate(request)
+    base_service.logger.debug('Prepared request [%s %s]', method, request['url'])
+    return request
@@ -0,0 +1,308 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Client-side rate limiting of Schematics requests.
+
+`TokenBucket` lets requests through at a steady rate, with bursts of up to
+`capacity` requests, and can be shared between threads.
+
+`RateLimiter` keeps a token bucket per endpoint family, such as `/v1/workspaces` or
+`/v2/jobs`, and paces every request of the service instances it is attached to.
+When the service answers `429 Too Many Requests`, the whole family is paused for
+the time given by `Retry-After`, or a jittered exponential backoff, before the
+request is retried, so that the threads sharing the limiter back off together
+instead of retrying independently:
+
+    limiter = RateLimiter({'/v1/workspaces': 10, '/v2/jobs': 5}, default_rate=20)
+    limiter.attach(schematics_service)
+"""
+
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlsplit
+import asyncio
+import datetime
+import functools
+import logging
+import random
+import threading
+import time
+
+from ibm_cloud_sdk_core import ApiException
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_RETRIES = 4
+DEFAULT_INITIAL_INTERVAL = 1.0
+DEFAULT_MAX_INTERVAL = 30.0
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket.
+
+    The bucket holds up to `capacity` tokens and gains `rate` tokens per second.
+    `acquire()` takes a token, waiting until one is available. Waiting callers
+    reserve their token first, so they are served in the order they arrived and
+    never wait longer than the rate requires.
+
+    :param float rate: The number of tokens added per second.
+    :param float capacity: (optional) The largest number of tokens the bucket
+           holds, that is, the largest burst. Defaults to `max(rate, 1)`.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+        if capacity is None:
+            capacity = max(rate, 1.0)
+        if capacity < 1:
+            raise ValueError('capacity must be at least 1')
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens from the bucket, waiting until they are available.
+
+        :param float tokens: (optional) The number of tokens to take.
+        :return: The number of seconds waited.
+        :rtype: float
+        """
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens from the bucket without waiting.
+
+        The tokens are taken even when the bucket does not hold them yet; the
+        caller must then wait for the returned delay before proceeding.
+
+        :param float tokens: (optional) The number of tokens to take.
+        :return: The number of seconds until the tokens are available.
+        :rtype: float
+        """
+        if tokens > self.capacity:
+            raise ValueError('Cannot take more tokens than the capacity of the bucket')
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / self.rate)
+
+
+def endpoint_family(url: str) -> str:
+    """
+    Return the endpoint family of a request URL: its API version and first
+    resource, for example `/v1/workspaces` for
+    `https://schematics.cloud.ibm.com/v1/workspaces/{w_id}/apply`.
+
+    :param str url: The URL of the request.
+    :return: The endpoint family, or the whole path when it has no version.
+    :rtype: str
+    """
+    segments = [segment for segment in urlsplit(url).path.split('/') if segment]
+    for index, segment in enumerate(segments):
+        if segment[:1] == 'v' and segment[1:].isdigit():
+            return '/' + '/'.join(segments[index : index + 2])
+    return '/' + '/'.join(segments)
+
+
+def retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Return the delay, in seconds, given by a `Retry-After` header.
+
+    :param str value: The value of the header, in seconds or as an HTTP date.
+    :return: The delay, or None when the value is missing or invalid.
+    :rtype: float
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (date - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+
+class RateLimiter:
+    """
+    A thread-safe rate limiter of Schematics requests, per endpoint family.
+
+    Each family has its own token bucket; the families missing from `rates` share
+    `default_rate`, per family, or are not paced when it is None. A request
+    answered with `429 Too Many Requests` pauses its family until the delay of the
+    `Retry-After` header, or of a jittered exponential backoff when there is none,
+    has elapsed, and is retried up to `max_retries` times. Requests that upload
+    a file are not retried, because their body cannot be sent again.
+
+    A limiter can be attached to any number of service instances, synchronous or
+    asyncio, which then share its buckets.
+
+    :param dict rates: (optional) The number of requests per second of each
+           endpoint family, for example `{'/v1/workspaces': 10, '/v2/jobs': 5}`.
+    :param float default_rate: (optional) The number of requests per second of
+           every other endpoint family.
+    :param int max_retries: (optional) The largest number of retries of a
+           request answered with 429.
+    :param float initial_interval: (optional) The first backoff interval, in
+           seconds.
+    :param float max_interval: (optional) The largest backoff interval, and the
+           largest delay taken from `Retry-After`, in seconds.
+    """
+
+    def __init__(
+        self,
+        rates: Optional[Dict[str, float]] = None,
+        *,
+        default_rate: Optional[float] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        initial_interval: float = DEFAULT_INITIAL_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+    ) -> None:
+        if default_rate is not None and default_rate <= 0:
+            raise ValueError('default_rate must be positive')
+        if max_retries < 0:
+            raise ValueError('max_retries must not be negative')
+        if initial_interval <= 0 or max_interval < initial_interval:
+            raise ValueError('initial_interval must be positive and not greater than max_interval')
+        self.default_rate = default_rate
+        self.max_retries = max_retries
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self._buckets = {family: TokenBucket(rate) for family, rate in (rates or {}).items()}
+        self._paused_until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def attach(self, client: Any) -> Any:
+        """
+        Pace the requests of a service instance.
+
+        :param client: A `SchematicsV1`, `Schematics20ApiV2` or asyncio service
+               instance.
+        :return: `client` itself.
+        """
+        send = client.send
+        wrapper = self._wrap_async(send) if asyncio.iscoroutinefunction(send) else self._wrap(send)
+        wrapper = functools.wraps(send)(wrapper)
+        wrapper.__rate_limiter__ = self
+        client.send = wrapper
+        return client
+
+    def detach(self, client: Any) -> None:
+        """
+        Stop pacing the requests of a service instance.
+
+        :param client: A service instance this limiter was attached to.
+        """
+        if getattr(vars(client).get('send'), '__rate_limiter__', None) is self:
+            del client.send
+
+    def reserve(self, family: str) -> float:
+        """
+        Reserve the right to send a request of an endpoint family.
+
+        :param str family: The endpoint family, see `endpoint_family`.
+        :return: The number of seconds to wait before sending the request.
+        :rtype: float
+        """
+        with self._lock:
+            bucket = self._buckets.get(family)
+            if bucket is None and self.default_rate is not None:
+                bucket = self._buckets[family] = TokenBucket(self.default_rate)
+            paused = self._paused_until.get(family, 0.0) - time.monotonic()
+        delay = bucket.reserve() if bucket is not None else 0.0
+        return max(delay, paused)
+
+    def pause(self, family: str, delay: float) -> None:
+        """
+        Hold back the requests of an endpoint family.
+
+        :param str family: The endpoint family, see `endpoint_family`.
+        :param float delay: The number of seconds to hold the requests back.
+        """
+        with self._lock:
+            until = time.monotonic() + delay
+            self._paused_until[family] = max(self._paused_until.get(family, 0.0), until)
+
+    def _throttled(self, family: str, request: dict, error: ApiException, attempt: int) -> bool:
+        """Pause the family of a throttled request; return whether to retry the request."""
+        if error.status_code != 429:
+            return False
+        delay = self._backoff(error, attempt)
+        logger.debug('%s was throttled; holding back its requests for %.2f seconds', family, delay)
+        self.pause(family, delay)
+        return attempt < self.max_retries and not _has_stream(request)
+
+    def _backoff(self, error: ApiException, attempt: int) -> float:
+        """Return the delay before sending another request of a throttled family."""
+        headers = error.http_response.headers if error.http_response is not None else {}
+        delay = retry_after(headers.get('Retry-After'))
+        if delay is None:
+            interval = min(self.initial_interval * 2**attempt, self.max_interval)
+            delay = random.uniform(interval / 2, interval)
+        return min(delay, self.max_interval)
+
+    def _wrap(self, send: Callable) -> Callable:
+        def paced(request: dict, **kwargs):
+            family = endpoint_family(request['url'])
+            attempt = 0
+            while True:
+                delay = self.reserve(family)
+                if delay > 0:
+                    time.sleep(delay)
+                try:
+                    return send(request, **kwargs)
+                except ApiException as e:
+                    if not self._throttled(family, request, e, attempt):
+                        raise
+                    attempt += 1
+
+        return paced
+
+    def _wrap_async(self, send: Callable) -> Callable:
+        async def paced(request: dict, **kwargs):
+            family = endpoint_family(request['url'])
+            attempt = 0
+            while True:
+                delay = self.reserve(family)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                try:
+                    return await send(request, **kwargs)
+                except ApiException as e:
+                    if not self._throttled(family, request, e, attempt):
+                        raise
+                    attempt += 1
+
+        return paced
+
+
+def _has_stream(request: dict) -> bool:
+    """Return whether the body of a request is read from a file, and cannot be sent twice."""
+    return bool(request.get('files')) or hasattr(request.get('data'), 'read')
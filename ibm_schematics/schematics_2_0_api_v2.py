@@ -31,9 +31,10 @@ import json
 from ibm_cloud_sdk_core import BaseService, DetailedResponse
 from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
-from ibm_cloud_sdk_core.utils import convert_model, datetime_to_string, string_to_datetime
+from ibm_cloud_sdk_core.utils import convert_model, datetime_to_string
 
-from .common import get_sdk_headers
+from .common import string_to_datetime
+from .operations import prepare_operation
 
 ##############################################################################
 # Service
@@ -45,6 +46,8 @@ class Schematics20ApiV2(BaseService):
 
     DEFAULT_SERVICE_URL = 'https://schematics-dev.containers.appdomain.cloud'
     DEFAULT_SERVICE_NAME = 'schematics_2_0_api'
+    # Serializes the JSON bodies of create_workspace, create_action and create_job; see json_codec.
+    json_dumps = staticmethod(json.dumps)
 
     @classmethod
     def new_instance(
@@ -89,18 +92,10 @@ class Schematics20ApiV2(BaseService):
         :rtype: DetailedResponse with `dict` result representing a `SchematicsInfo` object
         """
 
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_schematics_info'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         url = '/v2/info'
-        request = self.prepare_request(method='GET', url=url, headers=headers)
+        request = prepare_operation(
+            self, 'V2', 'get_schematics_info', kwargs, method='GET', url=url, accept='application/json'
+        )
 
         response = self.send(request)
         return response
@@ -117,18 +112,10 @@ class Schematics20ApiV2(BaseService):
         :rtype: DetailedResponse with `dict` result representing a `SchematicsAccessRuleList` object
         """
 
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='list_schematics_access_rules'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         url = '/v2/access'
-        request = self.prepare_request(method='GET', url=url, headers=headers)
+        request = prepare_operation(
+            self, 'V2', 'list_schematics_access_rules', kwargs, method='GET', url=url, accept='application/json'
+        )
 
         response = self.send(request)
         return response
@@ -153,25 +140,23 @@ class Schematics20ApiV2(BaseService):
 
         if resource_name is None:
             raise ValueError('resource_name must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V2',
-            operation_id='get_schematics_access_rules_for_resource',
-        )
-        headers.update(sdk_headers)
 
         params = {'command_name': command_name, 'command_parameter': command_parameter}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['resource_name']
         path_param_values = self.encode_path_vars(resource_name)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/access/{resource_name}'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self,
+            'V2',
+            'get_schematics_access_rules_for_resource',
+            kwargs,
+            method='GET',
+            url=url,
+            accept='application/json',
+            params=params,
+        )
 
         response = self.send(request)
         return response
@@ -190,21 +175,14 @@ class Schematics20ApiV2(BaseService):
 
         if resource_name is None:
             raise ValueError('resource_name must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_schematics_command_names'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['resource_name']
         path_param_values = self.encode_path_vars(resource_name)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/commands/{resource_name}'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers)
+        request = prepare_operation(
+            self, 'V2', 'get_schematics_command_names', kwargs, method='GET', url=url, accept='application/json'
+        )
 
         response = self.send(request)
         return response
@@ -241,20 +219,12 @@ class Schematics20ApiV2(BaseService):
         :rtype: DetailedResponse with `dict` result representing a `WorkspaceList` object
         """
 
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='list_workspaces'
-        )
-        headers.update(sdk_headers)
-
         params = {'offset': offset, 'limit': limit, 'sort': sort, 'profile': profile}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         url = '/v2/workspaces'
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'list_workspaces', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -275,21 +245,21 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('workspace must be provided')
         if isinstance(workspace, Workspace):
             workspace = convert_model(workspace)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='create_workspace'
-        )
-        headers.update(sdk_headers)
-
-        data = json.dumps(workspace)
-        headers['content-type'] = 'application/json'
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
+        data = self.json_dumps(workspace)
 
         url = '/v2/workspaces'
-        request = self.prepare_request(method='POST', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'create_workspace',
+            kwargs,
+            method='POST',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -310,23 +280,16 @@ class Schematics20ApiV2(BaseService):
 
         if w_id is None:
             raise ValueError('w_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_workspace'
-        )
-        headers.update(sdk_headers)
 
         params = {'profile': profile}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['w_id']
         path_param_values = self.encode_path_vars(w_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/workspaces/{w_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'get_workspace', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -351,24 +314,24 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('workspace must be provided')
         if isinstance(workspace, Workspace):
             workspace = convert_model(workspace)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='replace_workspace'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(workspace)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['w_id']
         path_param_values = self.encode_path_vars(w_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/workspaces/{w_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='PUT', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'replace_workspace',
+            kwargs,
+            method='PUT',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -394,19 +357,12 @@ class Schematics20ApiV2(BaseService):
         if w_id is None:
             raise ValueError('w_id must be provided')
         headers = {'force': force, 'propagate': propagate}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='delete_workspace'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
 
         path_param_keys = ['w_id']
         path_param_values = self.encode_path_vars(w_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/workspaces/{w_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='DELETE', url=url, headers=headers)
+        request = prepare_operation(self, 'V2', 'delete_workspace', kwargs, method='DELETE', url=url, headers=headers)
 
         response = self.send(request)
         return response
@@ -431,24 +387,24 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('workspace must be provided')
         if isinstance(workspace, Workspace):
             workspace = convert_model(workspace)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='update_workspace'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(workspace)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['w_id']
         path_param_values = self.encode_path_vars(w_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/workspaces/{w_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='PATCH', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'update_workspace',
+            kwargs,
+            method='PATCH',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -479,23 +435,16 @@ class Schematics20ApiV2(BaseService):
 
         if w_id is None:
             raise ValueError('w_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='list_workspace_inputs'
-        )
-        headers.update(sdk_headers)
 
         params = {'offset': offset, 'limit': limit}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['w_id']
         path_param_values = self.encode_path_vars(w_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/workspaces/{w_id}/inputs'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'list_workspace_inputs', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -525,23 +474,23 @@ class Schematics20ApiV2(BaseService):
 
         if w_id is None:
             raise ValueError('w_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='list_workspace_outputs'
-        )
-        headers.update(sdk_headers)
 
         params = {'offset': offset, 'limit': limit}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['w_id']
         path_param_values = self.encode_path_vars(w_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/workspaces/{w_id}/outputs'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self,
+            'V2',
+            'list_workspace_outputs',
+            kwargs,
+            method='GET',
+            url=url,
+            accept='application/json',
+            params=params,
+        )
 
         response = self.send(request)
         return response
@@ -572,20 +521,22 @@ class Schematics20ApiV2(BaseService):
         if isinstance(template_list_request, TemplateListRequest):
             template_list_request = convert_model(template_list_request)
         headers = {'X-Github-token': x_github_token}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='create_workspace_templates'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(template_list_request)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         url = '/v2/templates'
-        request = self.prepare_request(method='POST', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'create_workspace_templates',
+            kwargs,
+            method='POST',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            headers=headers,
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -622,23 +573,23 @@ class Schematics20ApiV2(BaseService):
 
         if w_id is None:
             raise ValueError('w_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='list_templates_in_workspace'
-        )
-        headers.update(sdk_headers)
 
         params = {'offset': offset, 'limit': limit, 'sort': sort, 'profile': profile}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['w_id']
         path_param_values = self.encode_path_vars(w_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/workspaces/{w_id}/templates'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self,
+            'V2',
+            'list_templates_in_workspace',
+            kwargs,
+            method='GET',
+            url=url,
+            accept='application/json',
+            params=params,
+        )
 
         response = self.send(request)
         return response
@@ -669,23 +620,25 @@ class Schematics20ApiV2(BaseService):
         if isinstance(template, Template):
             template = convert_model(template)
         headers = {'X-Github-token': x_github_token}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='add_templates_to_workspace'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(template)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['w_id']
         path_param_values = self.encode_path_vars(w_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/workspaces/{w_id}/templates'.format(**path_param_dict)
-        request = self.prepare_request(method='POST', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'add_templates_to_workspace',
+            kwargs,
+            method='POST',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            headers=headers,
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -713,23 +666,23 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('w_id must be provided')
         if t_id is None:
             raise ValueError('t_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_template_in_workspace'
-        )
-        headers.update(sdk_headers)
 
         params = {'profile': profile}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['w_id', 't_id']
         path_param_values = self.encode_path_vars(w_id, t_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/workspaces/{w_id}/templates/{t_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self,
+            'V2',
+            'get_template_in_workspace',
+            kwargs,
+            method='GET',
+            url=url,
+            accept='application/json',
+            params=params,
+        )
 
         response = self.send(request)
         return response
@@ -766,23 +719,25 @@ class Schematics20ApiV2(BaseService):
         if template is not None and isinstance(template, Template):
             template = convert_model(template)
         headers = {'X-Github-token': x_github_token}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='replace_template_in_workspace'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(template)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['w_id', 't_id']
         path_param_values = self.encode_path_vars(w_id, t_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/workspaces/{w_id}/templates/{t_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='PUT', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'replace_template_in_workspace',
+            kwargs,
+            method='PUT',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            headers=headers,
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -818,19 +773,14 @@ class Schematics20ApiV2(BaseService):
         if t_id is None:
             raise ValueError('t_id must be provided')
         headers = {'force': force, 'propagate': propagate}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='delete_template_from_workspace'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
 
         path_param_keys = ['w_id', 't_id']
         path_param_values = self.encode_path_vars(w_id, t_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/workspaces/{w_id}/templates/{t_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='DELETE', url=url, headers=headers)
+        request = prepare_operation(
+            self, 'V2', 'delete_template_from_workspace', kwargs, method='DELETE', url=url, headers=headers
+        )
 
         response = self.send(request)
         return response
@@ -867,23 +817,25 @@ class Schematics20ApiV2(BaseService):
         if template is not None and isinstance(template, Template):
             template = convert_model(template)
         headers = {'X-Github-token': x_github_token}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='update_template_in_workspace'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(template)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['w_id', 't_id']
         path_param_values = self.encode_path_vars(w_id, t_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/workspaces/{w_id}/templates/{t_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='PATCH', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'update_template_in_workspace',
+            kwargs,
+            method='PATCH',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            headers=headers,
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -925,26 +877,26 @@ class Schematics20ApiV2(BaseService):
         if t_id is None:
             raise ValueError('t_id must be provided')
         headers = {'X-Github-token': x_github_token}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V2',
-            operation_id='upload_template_tar_in_workspace',
-        )
-        headers.update(sdk_headers)
 
         form_data = []
         if file:
             form_data.append(('file', (None, file, file_content_type or 'application/octet-stream')))
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['w_id', 't_id']
         path_param_values = self.encode_path_vars(w_id, t_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/workspaces/{w_id}/templates/{t_id}/content'.format(**path_param_dict)
-        request = self.prepare_request(method='PUT', url=url, headers=headers, files=form_data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'upload_template_tar_in_workspace',
+            kwargs,
+            method='PUT',
+            url=url,
+            accept='application/json',
+            headers=headers,
+            files=form_data,
+        )
 
         response = self.send(request)
         return response
@@ -975,19 +927,12 @@ class Schematics20ApiV2(BaseService):
         if t_id is None:
             raise ValueError('t_id must be provided')
         headers = {'Accept': accept}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_template_readme'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
 
         path_param_keys = ['w_id', 't_id']
         path_param_values = self.encode_path_vars(w_id, t_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/workspaces/{w_id}/templates/{t_id}/readme'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers)
+        request = prepare_operation(self, 'V2', 'get_template_readme', kwargs, method='GET', url=url, headers=headers)
 
         response = self.send(request)
         return response
@@ -1015,21 +960,14 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('w_id must be provided')
         if t_id is None:
             raise ValueError('t_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_template_source'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['w_id', 't_id']
         path_param_values = self.encode_path_vars(w_id, t_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/workspaces/{w_id}/templates/{t_id}/source'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers)
+        request = prepare_operation(
+            self, 'V2', 'get_template_source', kwargs, method='GET', url=url, accept='application/json'
+        )
 
         response = self.send(request)
         return response
@@ -1057,21 +995,14 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('w_id must be provided')
         if t_id is None:
             raise ValueError('t_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='list_template_inputs'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['w_id', 't_id']
         path_param_values = self.encode_path_vars(w_id, t_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/workspaces/{w_id}/templates/{t_id}/inputs'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers)
+        request = prepare_operation(
+            self, 'V2', 'list_template_inputs', kwargs, method='GET', url=url, accept='application/json'
+        )
 
         response = self.send(request)
         return response
@@ -1099,21 +1030,14 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('w_id must be provided')
         if t_id is None:
             raise ValueError('t_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='list_template_outputs'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['w_id', 't_id']
         path_param_values = self.encode_path_vars(w_id, t_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/workspaces/{w_id}/templates/{t_id}/outputs'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers)
+        request = prepare_operation(
+            self, 'V2', 'list_template_outputs', kwargs, method='GET', url=url, accept='application/json'
+        )
 
         response = self.send(request)
         return response
@@ -1154,23 +1078,23 @@ class Schematics20ApiV2(BaseService):
 
         if w_id is None:
             raise ValueError('w_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='list_flows_in_workspace'
-        )
-        headers.update(sdk_headers)
 
         params = {'offset': offset, 'limit': limit, 'sort': sort, 'profile': profile}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['w_id']
         path_param_values = self.encode_path_vars(w_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/workspaces/{w_id}/flows'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self,
+            'V2',
+            'list_flows_in_workspace',
+            kwargs,
+            method='GET',
+            url=url,
+            accept='application/json',
+            params=params,
+        )
 
         response = self.send(request)
         return response
@@ -1195,24 +1119,24 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('template_flow must be provided')
         if isinstance(template_flow, TemplateFlow):
             template_flow = convert_model(template_flow)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='add_flow_to_workspace'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(template_flow)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['w_id']
         path_param_values = self.encode_path_vars(w_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/workspaces/{w_id}/flows'.format(**path_param_dict)
-        request = self.prepare_request(method='POST', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'add_flow_to_workspace',
+            kwargs,
+            method='POST',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -1237,23 +1161,16 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('w_id must be provided')
         if flow_id is None:
             raise ValueError('flow_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_flow_in_workspace'
-        )
-        headers.update(sdk_headers)
 
         params = {'profile': profile}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['w_id', 'flow_id']
         path_param_values = self.encode_path_vars(w_id, flow_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/workspaces/{w_id}/flows/{flow_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'get_flow_in_workspace', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -1283,24 +1200,24 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('flow_id must be provided')
         if template_flow is not None and isinstance(template_flow, TemplateFlow):
             template_flow = convert_model(template_flow)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='replace_flow_in_workspace'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(template_flow)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['w_id', 'flow_id']
         path_param_values = self.encode_path_vars(w_id, flow_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/workspaces/{w_id}/flows/{flow_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='PUT', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'replace_flow_in_workspace',
+            kwargs,
+            method='PUT',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -1331,19 +1248,14 @@ class Schematics20ApiV2(BaseService):
         if flow_id is None:
             raise ValueError('flow_id must be provided')
         headers = {'propagate': propagate, 'force': force}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='delete_flow_from_workspace'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
 
         path_param_keys = ['w_id', 'flow_id']
         path_param_values = self.encode_path_vars(w_id, flow_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/workspaces/{w_id}/flows/{flow_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='DELETE', url=url, headers=headers)
+        request = prepare_operation(
+            self, 'V2', 'delete_flow_from_workspace', kwargs, method='DELETE', url=url, headers=headers
+        )
 
         response = self.send(request)
         return response
@@ -1373,24 +1285,24 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('flow_id must be provided')
         if template_flow is not None and isinstance(template_flow, TemplateFlow):
             template_flow = convert_model(template_flow)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='update_flow_in_workspace'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(template_flow)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['w_id', 'flow_id']
         path_param_values = self.encode_path_vars(w_id, flow_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/workspaces/{w_id}/flows/{flow_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='PATCH', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'update_flow_in_workspace',
+            kwargs,
+            method='PATCH',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -1437,20 +1349,12 @@ class Schematics20ApiV2(BaseService):
         :rtype: DetailedResponse with `dict` result representing a `ActionList` object
         """
 
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='list_actions'
-        )
-        headers.update(sdk_headers)
-
         params = {'offset': offset, 'limit': limit, 'sort': sort, 'profile': profile}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         url = '/v2/actions'
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'list_actions', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -1496,20 +1400,22 @@ class Schematics20ApiV2(BaseService):
         if isinstance(action, Action):
             action = convert_model(action)
         headers = {'X-Github-token': x_github_token}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='create_action'
-        )
-        headers.update(sdk_headers)
 
-        data = json.dumps(action)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
+        data = self.json_dumps(action)
 
         url = '/v2/actions'
-        request = self.prepare_request(method='POST', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'create_action',
+            kwargs,
+            method='POST',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            headers=headers,
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -1537,23 +1443,16 @@ class Schematics20ApiV2(BaseService):
 
         if action_id is None:
             raise ValueError('action_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_action'
-        )
-        headers.update(sdk_headers)
 
         params = {'profile': profile}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['action_id']
         path_param_values = self.encode_path_vars(action_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/actions/{action_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'get_action', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -1590,19 +1489,12 @@ class Schematics20ApiV2(BaseService):
         if action_id is None:
             raise ValueError('action_id must be provided')
         headers = {'force': force, 'propagate': propagate}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='delete_action'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
 
         path_param_keys = ['action_id']
         path_param_values = self.encode_path_vars(action_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/actions/{action_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='DELETE', url=url, headers=headers)
+        request = prepare_operation(self, 'V2', 'delete_action', kwargs, method='DELETE', url=url, headers=headers)
 
         response = self.send(request)
         return response
@@ -1648,23 +1540,25 @@ class Schematics20ApiV2(BaseService):
         if isinstance(action, Action):
             action = convert_model(action)
         headers = {'X-Github-token': x_github_token}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='update_action'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(action)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['action_id']
         path_param_values = self.encode_path_vars(action_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/actions/{action_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='PATCH', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'update_action',
+            kwargs,
+            method='PATCH',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            headers=headers,
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -1695,25 +1589,25 @@ class Schematics20ApiV2(BaseService):
 
         if action_id is None:
             raise ValueError('action_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='upload_template_tar_action'
-        )
-        headers.update(sdk_headers)
 
         form_data = []
         if file:
             form_data.append(('file', (None, file, file_content_type or 'application/octet-stream')))
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['action_id']
         path_param_values = self.encode_path_vars(action_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/actions/{action_id}/template_repo_upload'.format(**path_param_dict)
-        request = self.prepare_request(method='PUT', url=url, headers=headers, files=form_data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'upload_template_tar_action',
+            kwargs,
+            method='PUT',
+            url=url,
+            accept='application/json',
+            files=form_data,
+        )
 
         response = self.send(request)
         return response
@@ -1774,12 +1668,6 @@ class Schematics20ApiV2(BaseService):
         :rtype: DetailedResponse with `dict` result representing a `JobList` object
         """
 
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='list_jobs'
-        )
-        headers.update(sdk_headers)
-
         params = {
             'offset': offset,
             'limit': limit,
@@ -1791,12 +1679,10 @@ class Schematics20ApiV2(BaseService):
             'list': list,
         }
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         url = '/v2/jobs'
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'list_jobs', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -1841,20 +1727,22 @@ class Schematics20ApiV2(BaseService):
         if isinstance(job, Job):
             job = convert_model(job)
         headers = {'refresh_token': refresh_token}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='create_job'
-        )
-        headers.update(sdk_headers)
 
-        data = json.dumps(job)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
+        data = self.json_dumps(job)
 
         url = '/v2/jobs'
-        request = self.prepare_request(method='POST', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'create_job',
+            kwargs,
+            method='POST',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            headers=headers,
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -1880,23 +1768,16 @@ class Schematics20ApiV2(BaseService):
 
         if job_id is None:
             raise ValueError('job_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_job'
-        )
-        headers.update(sdk_headers)
 
         params = {'profile': profile}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['job_id']
         path_param_values = self.encode_path_vars(job_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/jobs/{job_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'get_job', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -1949,23 +1830,25 @@ class Schematics20ApiV2(BaseService):
         if isinstance(job, Job):
             job = convert_model(job)
         headers = {'refresh_token': refresh_token}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='update_job'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(job)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['job_id']
         path_param_values = self.encode_path_vars(job_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/jobs/{job_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='PUT', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'update_job',
+            kwargs,
+            method='PUT',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            headers=headers,
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -2021,19 +1904,12 @@ class Schematics20ApiV2(BaseService):
         if refresh_token is None:
             raise ValueError('refresh_token must be provided')
         headers = {'refresh_token': refresh_token, 'force': force, 'propagate': propagate}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='delete_job'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
 
         path_param_keys = ['job_id']
         path_param_values = self.encode_path_vars(job_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/jobs/{job_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='DELETE', url=url, headers=headers)
+        request = prepare_operation(self, 'V2', 'delete_job', kwargs, method='DELETE', url=url, headers=headers)
 
         response = self.send(request)
         return response
@@ -2056,21 +1932,14 @@ class Schematics20ApiV2(BaseService):
 
         if job_id is None:
             raise ValueError('job_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='list_job_logs'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['job_id']
         path_param_values = self.encode_path_vars(job_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/jobs/{job_id}/logs'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers)
+        request = prepare_operation(
+            self, 'V2', 'list_job_logs', kwargs, method='GET', url=url, accept='application/json'
+        )
 
         response = self.send(request)
         return response
@@ -2097,23 +1966,16 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('job_id must be provided')
         if file_type is None:
             raise ValueError('file_type must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_job_files'
-        )
-        headers.update(sdk_headers)
 
         params = {'file_type': file_type}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['job_id']
         path_param_values = self.encode_path_vars(job_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/jobs/{job_id}/files'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'get_job_files', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -2150,20 +2012,12 @@ class Schematics20ApiV2(BaseService):
         :rtype: DetailedResponse with `dict` result representing a `ControlsList` object
         """
 
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='list_controls'
-        )
-        headers.update(sdk_headers)
-
         params = {'offset': offset, 'limit': limit, 'sort': sort, 'profile': profile}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         url = '/v2/controls'
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'list_controls', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -2184,21 +2038,21 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('controls must be provided')
         if isinstance(controls, Controls):
             controls = convert_model(controls)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='create_controls'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(controls)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         url = '/v2/controls'
-        request = self.prepare_request(method='POST', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'create_controls',
+            kwargs,
+            method='POST',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -2219,23 +2073,16 @@ class Schematics20ApiV2(BaseService):
 
         if controls_id is None:
             raise ValueError('controls_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_controls'
-        )
-        headers.update(sdk_headers)
 
         params = {'profile': profile}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['controls_id']
         path_param_values = self.encode_path_vars(controls_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/controls/{controls_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'get_controls', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -2262,19 +2109,12 @@ class Schematics20ApiV2(BaseService):
         if controls_id is None:
             raise ValueError('controls_id must be provided')
         headers = {'force': force, 'propagate': propagate}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='delete_controls'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
 
         path_param_keys = ['controls_id']
         path_param_values = self.encode_path_vars(controls_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/controls/{controls_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='DELETE', url=url, headers=headers)
+        request = prepare_operation(self, 'V2', 'delete_controls', kwargs, method='DELETE', url=url, headers=headers)
 
         response = self.send(request)
         return response
@@ -2299,24 +2139,24 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('controls must be provided')
         if isinstance(controls, Controls):
             controls = convert_model(controls)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='update_controls'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(controls)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['controls_id']
         path_param_values = self.encode_path_vars(controls_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/controls/{controls_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='PATCH', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'update_controls',
+            kwargs,
+            method='PATCH',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -2360,23 +2200,16 @@ class Schematics20ApiV2(BaseService):
 
         if controls_id is None:
             raise ValueError('controls_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='list_capsules'
-        )
-        headers.update(sdk_headers)
 
         params = {'offset': offset, 'limit': limit, 'sort': sort, 'profile': profile}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['controls_id']
         path_param_values = self.encode_path_vars(controls_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/controls/{controls_id}/capsules'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'list_capsules', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -2401,24 +2234,24 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('capsule must be provided')
         if isinstance(capsule, Capsule):
             capsule = convert_model(capsule)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='create_capsule'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(capsule)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['controls_id']
         path_param_values = self.encode_path_vars(controls_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/controls/{controls_id}/capsules'.format(**path_param_dict)
-        request = self.prepare_request(method='POST', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'create_capsule',
+            kwargs,
+            method='POST',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -2444,23 +2277,16 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('controls_id must be provided')
         if capsule_id is None:
             raise ValueError('capsule_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_capsule'
-        )
-        headers.update(sdk_headers)
 
         params = {'profile': profile}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['controls_id', 'capsule_id']
         path_param_values = self.encode_path_vars(controls_id, capsule_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/controls/{controls_id}/capsules/{capsule_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'get_capsule', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -2485,20 +2311,12 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('controls_id must be provided')
         if capsule_id is None:
             raise ValueError('capsule_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='delete_capsule'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
 
         path_param_keys = ['controls_id', 'capsule_id']
         path_param_values = self.encode_path_vars(controls_id, capsule_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/controls/{controls_id}/capsules/{capsule_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='DELETE', url=url, headers=headers)
+        request = prepare_operation(self, 'V2', 'delete_capsule', kwargs, method='DELETE', url=url)
 
         response = self.send(request)
         return response
@@ -2528,24 +2346,24 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('capsule must be provided')
         if isinstance(capsule, Capsule):
             capsule = convert_model(capsule)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='update_capsule'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(capsule)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['controls_id', 'capsule_id']
         path_param_values = self.encode_path_vars(controls_id, capsule_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/controls/{controls_id}/capsules/{capsule_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='PATCH', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'update_capsule',
+            kwargs,
+            method='PATCH',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -2582,20 +2400,12 @@ class Schematics20ApiV2(BaseService):
         :rtype: DetailedResponse with `dict` result representing a `DatasetList` object
         """
 
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='list_datasets'
-        )
-        headers.update(sdk_headers)
-
         params = {'offset': offset, 'limit': limit, 'sort': sort, 'profile': profile}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         url = '/v2/datasets'
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'list_datasets', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -2616,21 +2426,21 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('dataset must be provided')
         if isinstance(dataset, Dataset):
             dataset = convert_model(dataset)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='create_dataset'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(dataset)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         url = '/v2/datasets'
-        request = self.prepare_request(method='POST', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'create_dataset',
+            kwargs,
+            method='POST',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -2650,21 +2460,12 @@ class Schematics20ApiV2(BaseService):
 
         if dataset_id is None:
             raise ValueError('dataset_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_dataset'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['dataset_id']
         path_param_values = self.encode_path_vars(dataset_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/datasets/{dataset_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers)
+        request = prepare_operation(self, 'V2', 'get_dataset', kwargs, method='GET', url=url, accept='application/json')
 
         response = self.send(request)
         return response
@@ -2689,24 +2490,24 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('dataset must be provided')
         if isinstance(dataset, Dataset):
             dataset = convert_model(dataset)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='replace_dataset'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(dataset)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['dataset_id']
         path_param_values = self.encode_path_vars(dataset_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/datasets/{dataset_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='PUT', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'replace_dataset',
+            kwargs,
+            method='PUT',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -2733,19 +2534,12 @@ class Schematics20ApiV2(BaseService):
         if dataset_id is None:
             raise ValueError('dataset_id must be provided')
         headers = {'force': force, 'propagate': propagate}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='delete_dataset'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
 
         path_param_keys = ['dataset_id']
         path_param_values = self.encode_path_vars(dataset_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/datasets/{dataset_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='DELETE', url=url, headers=headers)
+        request = prepare_operation(self, 'V2', 'delete_dataset', kwargs, method='DELETE', url=url, headers=headers)
 
         response = self.send(request)
         return response
@@ -2770,24 +2564,24 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('dataset must be provided')
         if isinstance(dataset, Dataset):
             dataset = convert_model(dataset)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='update_ataset'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(dataset)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['dataset_id']
         path_param_values = self.encode_path_vars(dataset_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/datasets/{dataset_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='PATCH', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'update_ataset',
+            kwargs,
+            method='PATCH',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -2807,21 +2601,14 @@ class Schematics20ApiV2(BaseService):
 
         if dataset_id is None:
             raise ValueError('dataset_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='list_dataset_variables'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['dataset_id']
         path_param_values = self.encode_path_vars(dataset_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/datasets/{dataset_id}/variables'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers)
+        request = prepare_operation(
+            self, 'V2', 'list_dataset_variables', kwargs, method='GET', url=url, accept='application/json'
+        )
 
         response = self.send(request)
         return response
@@ -2844,21 +2631,14 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('dataset_id must be provided')
         if var_name is None:
             raise ValueError('var_name must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_dataset_variable'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['dataset_id', 'var_name']
         path_param_values = self.encode_path_vars(dataset_id, var_name)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/datasets/{dataset_id}/values/{var_name}'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers)
+        request = prepare_operation(
+            self, 'V2', 'get_dataset_variable', kwargs, method='GET', url=url, accept='application/json'
+        )
 
         response = self.send(request)
         return response
@@ -2904,20 +2684,12 @@ class Schematics20ApiV2(BaseService):
         :rtype: DetailedResponse with `dict` result representing a `InventoryResourceRecordList` object
         """
 
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='list_inventories'
-        )
-        headers.update(sdk_headers)
-
         params = {'offset': offset, 'limit': limit, 'sort': sort, 'profile': profile}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         url = '/v2/inventories'
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'list_inventories', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -2955,21 +2727,21 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('inventory_resource_definition must be provided')
         if isinstance(inventory_resource_definition, InventoryResourceDefinition):
             inventory_resource_definition = convert_model(inventory_resource_definition)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='create_inventory'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(inventory_resource_definition)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         url = '/v2/inventories'
-        request = self.prepare_request(method='POST', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'create_inventory',
+            kwargs,
+            method='POST',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -3003,23 +2775,16 @@ class Schematics20ApiV2(BaseService):
 
         if inventory_id is None:
             raise ValueError('inventory_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_inventory'
-        )
-        headers.update(sdk_headers)
 
         params = {'profile': profile}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['inventory_id']
         path_param_values = self.encode_path_vars(inventory_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/inventories/{inventory_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'get_inventory', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -3060,24 +2825,24 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('inventory_resource_definition must be provided')
         if isinstance(inventory_resource_definition, InventoryResourceDefinition):
             inventory_resource_definition = convert_model(inventory_resource_definition)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='replace_inventory'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(inventory_resource_definition)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['inventory_id']
         path_param_values = self.encode_path_vars(inventory_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/inventories/{inventory_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='PUT', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'replace_inventory',
+            kwargs,
+            method='PUT',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -3116,19 +2881,12 @@ class Schematics20ApiV2(BaseService):
         if inventory_id is None:
             raise ValueError('inventory_id must be provided')
         headers = {'force': force, 'propagate': propagate}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='delete_inventory'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
 
         path_param_keys = ['inventory_id']
         path_param_values = self.encode_path_vars(inventory_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/inventories/{inventory_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='DELETE', url=url, headers=headers)
+        request = prepare_operation(self, 'V2', 'delete_inventory', kwargs, method='DELETE', url=url, headers=headers)
 
         response = self.send(request)
         return response
@@ -3171,20 +2929,12 @@ class Schematics20ApiV2(BaseService):
         :rtype: DetailedResponse with `dict` result representing a `ResourceQueryRecordList` object
         """
 
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='list_resource_query'
-        )
-        headers.update(sdk_headers)
-
         params = {'offset': offset, 'limit': limit, 'sort': sort, 'profile': profile}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         url = '/v2/resources_query'
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'list_resource_query', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -3220,21 +2970,21 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('resource_query_definition must be provided')
         if isinstance(resource_query_definition, ResourceQueryDefinition):
             resource_query_definition = convert_model(resource_query_definition)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='create_resource_query'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(resource_query_definition)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         url = '/v2/resources_query'
-        request = self.prepare_request(method='POST', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'create_resource_query',
+            kwargs,
+            method='POST',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -3262,21 +3012,14 @@ class Schematics20ApiV2(BaseService):
 
         if query_id is None:
             raise ValueError('query_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_resources_query'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['query_id']
         path_param_values = self.encode_path_vars(query_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/resources_query/{query_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers)
+        request = prepare_operation(
+            self, 'V2', 'get_resources_query', kwargs, method='GET', url=url, accept='application/json'
+        )
 
         response = self.send(request)
         return response
@@ -3315,24 +3058,24 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('resource_query_definition must be provided')
         if isinstance(resource_query_definition, ResourceQueryDefinition):
             resource_query_definition = convert_model(resource_query_definition)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='replace_resources_query'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(resource_query_definition)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['query_id']
         path_param_values = self.encode_path_vars(query_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/resources_query/{query_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='PUT', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'replace_resources_query',
+            kwargs,
+            method='PUT',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -3352,21 +3095,14 @@ class Schematics20ApiV2(BaseService):
 
         if query_id is None:
             raise ValueError('query_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='execute_resource_query'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['query_id']
         path_param_values = self.encode_path_vars(query_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/resources_query/{query_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='POST', url=url, headers=headers)
+        request = prepare_operation(
+            self, 'V2', 'execute_resource_query', kwargs, method='POST', url=url, accept='application/json'
+        )
 
         response = self.send(request)
         return response
@@ -3400,19 +3136,14 @@ class Schematics20ApiV2(BaseService):
         if query_id is None:
             raise ValueError('query_id must be provided')
         headers = {'force': force, 'propagate': propagate}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='delete_resources_query'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
 
         path_param_keys = ['query_id']
         path_param_values = self.encode_path_vars(query_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/resources_query/{query_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='DELETE', url=url, headers=headers)
+        request = prepare_operation(
+            self, 'V2', 'delete_resources_query', kwargs, method='DELETE', url=url, headers=headers
+        )
 
         response = self.send(request)
         return response
@@ -3443,20 +3174,12 @@ class Schematics20ApiV2(BaseService):
         :rtype: DetailedResponse with `dict` result representing a `AgentList` object
         """
 
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='list_agent'
-        )
-        headers.update(sdk_headers)
-
         params = {'offset': offset, 'limit': limit, 'profile': profile}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         url = '/v2/settings/agents'
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'list_agent', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -3477,21 +3200,21 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('agent must be provided')
         if isinstance(agent, Agent):
             agent = convert_model(agent)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='register_agent'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(agent)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         url = '/v2/settings/agents'
-        request = self.prepare_request(method='POST', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'register_agent',
+            kwargs,
+            method='POST',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -3511,23 +3234,16 @@ class Schematics20ApiV2(BaseService):
 
         if agent_id is None:
             raise ValueError('agent_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_agent'
-        )
-        headers.update(sdk_headers)
 
         params = {'profile': profile}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['agent_id']
         path_param_values = self.encode_path_vars(agent_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/settings/agents/{agent_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'get_agent', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -3546,20 +3262,12 @@ class Schematics20ApiV2(BaseService):
 
         if agent_id is None:
             raise ValueError('agent_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='delete_agent'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
 
         path_param_keys = ['agent_id']
         path_param_values = self.encode_path_vars(agent_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/settings/agents/{agent_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='DELETE', url=url, headers=headers)
+        request = prepare_operation(self, 'V2', 'delete_agent', kwargs, method='DELETE', url=url)
 
         response = self.send(request)
         return response
@@ -3583,24 +3291,24 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('agent must be provided')
         if isinstance(agent, Agent):
             agent = convert_model(agent)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='update_agent_registration'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(agent)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['agent_id']
         path_param_values = self.encode_path_vars(agent_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/settings/agents/{agent_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='PATCH', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'update_agent_registration',
+            kwargs,
+            method='PATCH',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -3627,21 +3335,14 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('dataset_id must be provided')
         if var_name is None:
             raise ValueError('var_name must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_dataset_variable_value'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['dataset_id', 'var_name']
         path_param_values = self.encode_path_vars(dataset_id, var_name)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/datasets/{dataset_id}/values/{var_name}/value'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers)
+        request = prepare_operation(
+            self, 'V2', 'get_dataset_variable_value', kwargs, method='GET', url=url, accept='application/json'
+        )
 
         response = self.send(request)
         return response
@@ -3664,21 +3365,14 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('creds_id must be provided')
         if var_name is None:
             raise ValueError('var_name must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_credential_variable_value'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['creds_id', 'var_name']
         path_param_values = self.encode_path_vars(creds_id, var_name)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/credentials/{creds_id}/variables/{var_name}/value'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers)
+        request = prepare_operation(
+            self, 'V2', 'get_credential_variable_value', kwargs, method='GET', url=url, accept='application/json'
+        )
 
         response = self.send(request)
         return response
@@ -3702,21 +3396,14 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('inventory_id must be provided')
         if var_name is None:
             raise ValueError('var_name must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_inventory_variable_value'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['inventory_id', 'var_name']
         path_param_values = self.encode_path_vars(inventory_id, var_name)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/inventories/{inventory_id}/variables/{var_name}/value'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers)
+        request = prepare_operation(
+            self, 'V2', 'get_inventory_variable_value', kwargs, method='GET', url=url, accept='application/json'
+        )
 
         response = self.send(request)
         return response
@@ -3752,23 +3439,23 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('w_id must be provided')
         if var_name is None:
             raise ValueError('var_name must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_workspace_input_value'
-        )
-        headers.update(sdk_headers)
 
         params = {'limit': limit, 'offset': offset}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['w_id', 'var_name']
         path_param_values = self.encode_path_vars(w_id, var_name)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/workspaces/{w_id}/inputs/{var_name}/value'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self,
+            'V2',
+            'get_workspace_input_value',
+            kwargs,
+            method='GET',
+            url=url,
+            accept='application/json',
+            params=params,
+        )
 
         response = self.send(request)
         return response
@@ -3804,23 +3491,23 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('w_id must be provided')
         if var_name is None:
             raise ValueError('var_name must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_workspace_output_value'
-        )
-        headers.update(sdk_headers)
 
         params = {'offset': offset, 'limit': limit}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['w_id', 'var_name']
         path_param_values = self.encode_path_vars(w_id, var_name)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/workspaces/{w_id}/outputs/{var_name}/value'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self,
+            'V2',
+            'get_workspace_output_value',
+            kwargs,
+            method='GET',
+            url=url,
+            accept='application/json',
+            params=params,
+        )
 
         response = self.send(request)
         return response
@@ -3856,23 +3543,23 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('w_id must be provided')
         if var_name is None:
             raise ValueError('var_name must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_workspace_settings_value'
-        )
-        headers.update(sdk_headers)
 
         params = {'offset': offset, 'limit': limit}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['w_id', 'var_name']
         path_param_values = self.encode_path_vars(w_id, var_name)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/workspaces/{w_id}/settings/{var_name}/value'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self,
+            'V2',
+            'get_workspace_settings_value',
+            kwargs,
+            method='GET',
+            url=url,
+            accept='application/json',
+            params=params,
+        )
 
         response = self.send(request)
         return response
@@ -3915,25 +3602,23 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('t_id must be provided')
         if var_name is None:
             raise ValueError('var_name must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V2',
-            operation_id='get_workspace_template_input_value',
-        )
-        headers.update(sdk_headers)
 
         params = {'offset': offset, 'limit': limit}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['w_id', 't_id', 'var_name']
         path_param_values = self.encode_path_vars(w_id, t_id, var_name)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/workspaces/{w_id}/templates/{t_id}/inputs/{var_name}/value'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self,
+            'V2',
+            'get_workspace_template_input_value',
+            kwargs,
+            method='GET',
+            url=url,
+            accept='application/json',
+            params=params,
+        )
 
         response = self.send(request)
         return response
@@ -3976,25 +3661,23 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('t_id must be provided')
         if var_name is None:
             raise ValueError('var_name must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V2',
-            operation_id='get_workspace_template_output_value',
-        )
-        headers.update(sdk_headers)
 
         params = {'offset': offset, 'limit': limit}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['w_id', 't_id', 'var_name']
         path_param_values = self.encode_path_vars(w_id, t_id, var_name)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/workspaces/{w_id}/templates/{t_id}/outputs/{var_name}/value'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self,
+            'V2',
+            'get_workspace_template_output_value',
+            kwargs,
+            method='GET',
+            url=url,
+            accept='application/json',
+            params=params,
+        )
 
         response = self.send(request)
         return response
@@ -4037,25 +3720,23 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('t_id must be provided')
         if var_name is None:
             raise ValueError('var_name must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V2',
-            operation_id='get_workspace_template_setting_value',
-        )
-        headers.update(sdk_headers)
 
         params = {'offset': offset, 'limit': limit}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['w_id', 't_id', 'var_name']
         path_param_values = self.encode_path_vars(w_id, t_id, var_name)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/workspaces/{w_id}/templates/{t_id}/settings/{var_name}/value'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self,
+            'V2',
+            'get_workspace_template_setting_value',
+            kwargs,
+            method='GET',
+            url=url,
+            accept='application/json',
+            params=params,
+        )
 
         response = self.send(request)
         return response
@@ -4095,23 +3776,23 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('w_id must be provided')
         if var_name is None:
             raise ValueError('var_name must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_job_workspace_input_value'
-        )
-        headers.update(sdk_headers)
 
         params = {'offset': offset, 'limit': limit}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['job_id', 'w_id', 'var_name']
         path_param_values = self.encode_path_vars(job_id, w_id, var_name)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/jobs/{job_id}/workspaces/{w_id}/inputs/{var_name}/value'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self,
+            'V2',
+            'get_job_workspace_input_value',
+            kwargs,
+            method='GET',
+            url=url,
+            accept='application/json',
+            params=params,
+        )
 
         response = self.send(request)
         return response
@@ -4151,23 +3832,23 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('w_id must be provided')
         if var_name is None:
             raise ValueError('var_name must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_job_workspace_output_value'
-        )
-        headers.update(sdk_headers)
 
         params = {'offset': offset, 'limit': limit}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['job_id', 'w_id', 'var_name']
         path_param_values = self.encode_path_vars(job_id, w_id, var_name)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/jobs/{job_id}/workspaces/{w_id}/outputs/{var_name}/value'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self,
+            'V2',
+            'get_job_workspace_output_value',
+            kwargs,
+            method='GET',
+            url=url,
+            accept='application/json',
+            params=params,
+        )
 
         response = self.send(request)
         return response
@@ -4207,23 +3888,23 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('w_id must be provided')
         if var_name is None:
             raise ValueError('var_name must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_job_workspace_setting_value'
-        )
-        headers.update(sdk_headers)
 
         params = {'offset': offset, 'limit': limit}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['job_id', 'w_id', 'var_name']
         path_param_values = self.encode_path_vars(job_id, w_id, var_name)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/jobs/{job_id}/workspaces/{w_id}/settings/{var_name}/value'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self,
+            'V2',
+            'get_job_workspace_setting_value',
+            kwargs,
+            method='GET',
+            url=url,
+            accept='application/json',
+            params=params,
+        )
 
         response = self.send(request)
         return response
@@ -4254,20 +3935,13 @@ class Schematics20ApiV2(BaseService):
 
         if location is None:
             raise ValueError('location must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_kms_settings'
-        )
-        headers.update(sdk_headers)
 
         params = {'location': location}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         url = '/v2/settings/kms'
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'get_kms_settings', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -4297,21 +3971,21 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('kms_settings must be provided')
         if isinstance(kms_settings, KMSSettings):
             kms_settings = convert_model(kms_settings)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='update_kms_settings'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(kms_settings)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         url = '/v2/settings/kms'
-        request = self.prepare_request(method='PUT', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'update_kms_settings',
+            kwargs,
+            method='PUT',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -4357,11 +4031,6 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('encryption_scheme must be provided')
         if location is None:
             raise ValueError('location must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='list_kms'
-        )
-        headers.update(sdk_headers)
 
         params = {
             'encryption_scheme': encryption_scheme,
@@ -4371,12 +4040,10 @@ class Schematics20ApiV2(BaseService):
             'sort': sort,
         }
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         url = '/v2/settings/kms_instances'
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'list_kms', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -4410,20 +4077,12 @@ class Schematics20ApiV2(BaseService):
         :rtype: DetailedResponse with `dict` result representing a `TriggerList` object
         """
 
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='list_triggers'
-        )
-        headers.update(sdk_headers)
-
         params = {'offset': offset, 'limit': limit, 'sort': sort}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         url = '/v2/settings/triggers'
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'list_triggers', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -4445,21 +4104,21 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('trigger must be provided')
         if isinstance(trigger, Trigger):
             trigger = convert_model(trigger)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='create_trigger'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(trigger)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         url = '/v2/settings/triggers'
-        request = self.prepare_request(method='POST', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'create_trigger',
+            kwargs,
+            method='POST',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -4478,21 +4137,12 @@ class Schematics20ApiV2(BaseService):
 
         if trigger_id is None:
             raise ValueError('trigger_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_trigger'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['trigger_id']
         path_param_values = self.encode_path_vars(trigger_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/settings/triggers/{trigger_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers)
+        request = prepare_operation(self, 'V2', 'get_trigger', kwargs, method='GET', url=url, accept='application/json')
 
         response = self.send(request)
         return response
@@ -4516,24 +4166,24 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('trigger must be provided')
         if isinstance(trigger, Trigger):
             trigger = convert_model(trigger)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='replace_trigger'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(trigger)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['trigger_id']
         path_param_values = self.encode_path_vars(trigger_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/settings/triggers/{trigger_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='PUT', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'replace_trigger',
+            kwargs,
+            method='PUT',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -4552,20 +4202,12 @@ class Schematics20ApiV2(BaseService):
 
         if trigger_id is None:
             raise ValueError('trigger_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='delete_trigger'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
 
         path_param_keys = ['trigger_id']
         path_param_values = self.encode_path_vars(trigger_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/settings/triggers/{trigger_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='DELETE', url=url, headers=headers)
+        request = prepare_operation(self, 'V2', 'delete_trigger', kwargs, method='DELETE', url=url)
 
         response = self.send(request)
         return response
@@ -4599,20 +4241,12 @@ class Schematics20ApiV2(BaseService):
         :rtype: DetailedResponse with `dict` result representing a `WebHookList` object
         """
 
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='list_webhook'
-        )
-        headers.update(sdk_headers)
-
         params = {'offset': offset, 'limit': limit, 'sort': sort}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         url = '/v2/settings/hooks'
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'list_webhook', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -4635,21 +4269,21 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('web_hook must be provided')
         if isinstance(web_hook, WebHook):
             web_hook = convert_model(web_hook)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='create_webhook'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(web_hook)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         url = '/v2/settings/hooks'
-        request = self.prepare_request(method='POST', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'create_webhook',
+            kwargs,
+            method='POST',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -4668,21 +4302,12 @@ class Schematics20ApiV2(BaseService):
 
         if hook_id is None:
             raise ValueError('hook_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_webhook'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['hook_id']
         path_param_values = self.encode_path_vars(hook_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/settings/hooks/{hook_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers)
+        request = prepare_operation(self, 'V2', 'get_webhook', kwargs, method='GET', url=url, accept='application/json')
 
         response = self.send(request)
         return response
@@ -4706,24 +4331,24 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('web_hook must be provided')
         if isinstance(web_hook, WebHook):
             web_hook = convert_model(web_hook)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='replace_webhook'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(web_hook)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['hook_id']
         path_param_values = self.encode_path_vars(hook_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/settings/hooks/{hook_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='PUT', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'replace_webhook',
+            kwargs,
+            method='PUT',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -4742,20 +4367,12 @@ class Schematics20ApiV2(BaseService):
 
         if hook_id is None:
             raise ValueError('hook_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='delete_webhook'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
 
         path_param_keys = ['hook_id']
         path_param_values = self.encode_path_vars(hook_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/settings/hooks/{hook_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='DELETE', url=url, headers=headers)
+        request = prepare_operation(self, 'V2', 'delete_webhook', kwargs, method='DELETE', url=url)
 
         response = self.send(request)
         return response
@@ -4775,18 +4392,10 @@ class Schematics20ApiV2(BaseService):
         :rtype: DetailedResponse with `dict` result representing a `PrivateClusterList` object
         """
 
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_private_cluster'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         url = '/v2/settings/private_clusters'
-        request = self.prepare_request(method='GET', url=url, headers=headers)
+        request = prepare_operation(
+            self, 'V2', 'get_private_cluster', kwargs, method='GET', url=url, accept='application/json'
+        )
 
         response = self.send(request)
         return response
@@ -4809,21 +4418,21 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('private_cluster must be provided')
         if isinstance(private_cluster, PrivateCluster):
             private_cluster = convert_model(private_cluster)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='create_private_cluster'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(private_cluster)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         url = '/v2/settings/private_clusters'
-        request = self.prepare_request(method='POST', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'create_private_cluster',
+            kwargs,
+            method='POST',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -4839,17 +4448,8 @@ class Schematics20ApiV2(BaseService):
         :rtype: DetailedResponse
         """
 
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='delete_private_cluster'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-
         url = '/v2/settings/private_clusters'
-        request = self.prepare_request(method='DELETE', url=url, headers=headers)
+        request = prepare_operation(self, 'V2', 'delete_private_cluster', kwargs, method='DELETE', url=url)
 
         response = self.send(request)
         return response
@@ -4886,20 +4486,12 @@ class Schematics20ApiV2(BaseService):
         :rtype: DetailedResponse with `dict` result representing a `AdapterList` object
         """
 
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='list_adapter'
-        )
-        headers.update(sdk_headers)
-
         params = {'offset': offset, 'limit': limit, 'sort': sort, 'profile': profile}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         url = '/v2/settings/adapters'
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'list_adapter', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -4921,21 +4513,21 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('adapter must be provided')
         if isinstance(adapter, Adapter):
             adapter = convert_model(adapter)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='create_adapter'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(adapter)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         url = '/v2/settings/adapters'
-        request = self.prepare_request(method='POST', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'create_adapter',
+            kwargs,
+            method='POST',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -4954,21 +4546,12 @@ class Schematics20ApiV2(BaseService):
 
         if adapter_id is None:
             raise ValueError('adapter_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_adapter'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['adapter_id']
         path_param_values = self.encode_path_vars(adapter_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/settings/adapters/{adapter_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers)
+        request = prepare_operation(self, 'V2', 'get_adapter', kwargs, method='GET', url=url, accept='application/json')
 
         response = self.send(request)
         return response
@@ -4992,24 +4575,24 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('adapter must be provided')
         if isinstance(adapter, Adapter):
             adapter = convert_model(adapter)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='replace_adapter'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(adapter)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['adapter_id']
         path_param_values = self.encode_path_vars(adapter_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/settings/adapters/{adapter_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='PUT', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'replace_adapter',
+            kwargs,
+            method='PUT',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -5028,20 +4611,12 @@ class Schematics20ApiV2(BaseService):
 
         if adapter_id is None:
             raise ValueError('adapter_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='delete_adapter'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
 
         path_param_keys = ['adapter_id']
         path_param_values = self.encode_path_vars(adapter_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/settings/adapters/{adapter_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='DELETE', url=url, headers=headers)
+        request = prepare_operation(self, 'V2', 'delete_adapter', kwargs, method='DELETE', url=url)
 
         response = self.send(request)
         return response
@@ -5075,20 +4650,12 @@ class Schematics20ApiV2(BaseService):
         :rtype: DetailedResponse with `dict` result representing a `ConnectionList` object
         """
 
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='list_connection'
-        )
-        headers.update(sdk_headers)
-
         params = {'offset': offset, 'limit': limit, 'sort': sort}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         url = '/v2/settings/connections'
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'list_connection', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -5109,21 +4676,21 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('connection must be provided')
         if isinstance(connection, Connection):
             connection = convert_model(connection)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='create_connection'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(connection)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         url = '/v2/settings/connections'
-        request = self.prepare_request(method='POST', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'create_connection',
+            kwargs,
+            method='POST',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -5143,21 +4710,14 @@ class Schematics20ApiV2(BaseService):
 
         if connection_id is None:
             raise ValueError('connection_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_connection'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['connection_id']
         path_param_values = self.encode_path_vars(connection_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/settings/connections/{connection_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers)
+        request = prepare_operation(
+            self, 'V2', 'get_connection', kwargs, method='GET', url=url, accept='application/json'
+        )
 
         response = self.send(request)
         return response
@@ -5177,20 +4737,12 @@ class Schematics20ApiV2(BaseService):
 
         if connection_id is None:
             raise ValueError('connection_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='delete_connection'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
 
         path_param_keys = ['connection_id']
         path_param_values = self.encode_path_vars(connection_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/settings/connections/{connection_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='DELETE', url=url, headers=headers)
+        request = prepare_operation(self, 'V2', 'delete_connection', kwargs, method='DELETE', url=url)
 
         response = self.send(request)
         return response
@@ -5222,20 +4774,12 @@ class Schematics20ApiV2(BaseService):
         :rtype: DetailedResponse with `dict` result representing a `DatasourceList` object
         """
 
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='list_datasources'
-        )
-        headers.update(sdk_headers)
-
         params = {'offset': offset, 'limit': limit, 'sort': sort}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         url = '/v2/settings/datasources'
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'list_datasources', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -5256,21 +4800,21 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('datasource must be provided')
         if isinstance(datasource, Datasource):
             datasource = convert_model(datasource)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='create_datasource'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(datasource)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         url = '/v2/settings/datasources'
-        request = self.prepare_request(method='POST', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'create_datasource',
+            kwargs,
+            method='POST',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -5290,23 +4834,16 @@ class Schematics20ApiV2(BaseService):
 
         if datasource_id is None:
             raise ValueError('datasource_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_data'
-        )
-        headers.update(sdk_headers)
 
         params = {'preview': preview}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['datasource_id']
         path_param_values = self.encode_path_vars(datasource_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/settings/datasources/{datasource_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'get_data', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -5346,20 +4883,12 @@ class Schematics20ApiV2(BaseService):
         :rtype: DetailedResponse with `dict` result representing a `CartOrderList` object
         """
 
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='list_cart'
-        )
-        headers.update(sdk_headers)
-
         params = {'offset': offset, 'limit': limit, 'service_name': service_name}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         url = '/v2/cart'
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'list_cart', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -5396,21 +4925,21 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('cart_order must be provided')
         if isinstance(cart_order, CartOrder):
             cart_order = convert_model(cart_order)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='create_cart_order'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(cart_order)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         url = '/v2/cart'
-        request = self.prepare_request(method='POST', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'create_cart_order',
+            kwargs,
+            method='POST',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -5436,23 +4965,16 @@ class Schematics20ApiV2(BaseService):
 
         if order_id is None:
             raise ValueError('order_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_cart_order'
-        )
-        headers.update(sdk_headers)
 
         params = {'profile': profile}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['order_id']
         path_param_values = self.encode_path_vars(order_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/cart/{order_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'get_cart_order', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -5487,26 +5009,27 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('cart_order must be provided')
         if isinstance(cart_order, CartOrder):
             cart_order = convert_model(cart_order)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='replace_cart_order'
-        )
-        headers.update(sdk_headers)
 
         params = {'operation': operation}
 
         data = json.dumps(cart_order)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['order_id']
         path_param_values = self.encode_path_vars(order_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/cart/{order_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='PUT', url=url, headers=headers, params=params, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'replace_cart_order',
+            kwargs,
+            method='PUT',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            params=params,
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -5534,22 +5057,16 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('order_id must be provided')
         if operation is None:
             raise ValueError('operation must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='run_fulfilment_operation'
-        )
-        headers.update(sdk_headers)
 
         params = {'operation': operation}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-
         path_param_keys = ['order_id']
         path_param_values = self.encode_path_vars(order_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/cart/{order_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='POST', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'run_fulfilment_operation', kwargs, method='POST', url=url, params=params
+        )
 
         response = self.send(request)
         return response
@@ -5575,22 +5092,14 @@ class Schematics20ApiV2(BaseService):
 
         if order_id is None:
             raise ValueError('order_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='delete_cart_order'
-        )
-        headers.update(sdk_headers)
 
         params = {'destroy': destroy}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-
         path_param_keys = ['order_id']
         path_param_values = self.encode_path_vars(order_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/cart/{order_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='DELETE', url=url, headers=headers, params=params)
+        request = prepare_operation(self, 'V2', 'delete_cart_order', kwargs, method='DELETE', url=url, params=params)
 
         response = self.send(request)
         return response
@@ -5627,26 +5136,27 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('update_cart_order must be provided')
         if isinstance(update_cart_order, UpdateCartOrder):
             update_cart_order = convert_model(update_cart_order)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='update_cart_order'
-        )
-        headers.update(sdk_headers)
 
         params = {'operation': operation}
 
         data = json.dumps(update_cart_order)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['order_id']
         path_param_values = self.encode_path_vars(order_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/cart/{order_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='PATCH', url=url, headers=headers, params=params, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'update_cart_order',
+            kwargs,
+            method='PATCH',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            params=params,
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -5666,21 +5176,14 @@ class Schematics20ApiV2(BaseService):
 
         if order_id is None:
             raise ValueError('order_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_cart_metadata'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['order_id']
         path_param_values = self.encode_path_vars(order_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/cart/{order_id}/metadata'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers)
+        request = prepare_operation(
+            self, 'V2', 'get_cart_metadata', kwargs, method='GET', url=url, accept='application/json'
+        )
 
         response = self.send(request)
         return response
@@ -5712,23 +5215,16 @@ class Schematics20ApiV2(BaseService):
 
         if order_id is None:
             raise ValueError('order_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='list_cart_resources'
-        )
-        headers.update(sdk_headers)
 
         params = {'offset': offset, 'limit': limit}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['order_id']
         path_param_values = self.encode_path_vars(order_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/cart/{order_id}/resources'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'list_cart_resources', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -5760,23 +5256,16 @@ class Schematics20ApiV2(BaseService):
 
         if order_id is None:
             raise ValueError('order_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='list_cart_order_jobs'
-        )
-        headers.update(sdk_headers)
 
         params = {'offset': offset, 'limit': limit}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['order_id']
         path_param_values = self.encode_path_vars(order_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/cart/{order_id}/jobs'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'list_cart_order_jobs', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -5812,23 +5301,16 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('order_id must be provided')
         if job_id is None:
             raise ValueError('job_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_cart_order_job'
-        )
-        headers.update(sdk_headers)
 
         params = {'offset': offset, 'limit': limit}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['order_id', 'job_id']
         path_param_values = self.encode_path_vars(order_id, job_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/cart/{order_id}/jobs/{job_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'get_cart_order_job', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -5864,23 +5346,23 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('order_id must be provided')
         if job_id is None:
             raise ValueError('job_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_cart_order_job_log'
-        )
-        headers.update(sdk_headers)
 
         params = {'offset': offset, 'limit': limit}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['order_id', 'job_id']
         path_param_values = self.encode_path_vars(order_id, job_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/cart/{order_id}/jobs/{job_id}/logs'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self,
+            'V2',
+            'get_cart_order_job_log',
+            kwargs,
+            method='GET',
+            url=url,
+            accept='application/json',
+            params=params,
+        )
 
         response = self.send(request)
         return response
@@ -5916,23 +5398,23 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('order_id must be provided')
         if job_id is None:
             raise ValueError('job_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_cart_order_job_resources'
-        )
-        headers.update(sdk_headers)
 
         params = {'offset': offset, 'limit': limit}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['order_id', 'job_id']
         path_param_values = self.encode_path_vars(order_id, job_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/cart/{order_id}/jobs/{job_id}/resources'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self,
+            'V2',
+            'get_cart_order_job_resources',
+            kwargs,
+            method='GET',
+            url=url,
+            accept='application/json',
+            params=params,
+        )
 
         response = self.send(request)
         return response
@@ -5962,20 +5444,12 @@ class Schematics20ApiV2(BaseService):
         :rtype: DetailedResponse with `dict` result representing a `BlueprintList` object
         """
 
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='list_blueprint'
-        )
-        headers.update(sdk_headers)
-
         params = {'offset': offset, 'limit': limit}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         url = '/v2/blueprints'
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'list_blueprint', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -5996,21 +5470,21 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('blueprint must be provided')
         if isinstance(blueprint, Blueprint):
             blueprint = convert_model(blueprint)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='create_blueprint'
-        )
-        headers.update(sdk_headers)
 
         data = json.dumps(blueprint)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         url = '/v2/blueprints'
-        request = self.prepare_request(method='POST', url=url, headers=headers, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'create_blueprint',
+            kwargs,
+            method='POST',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -6031,23 +5505,16 @@ class Schematics20ApiV2(BaseService):
 
         if blueprint_id is None:
             raise ValueError('blueprint_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_blueprint'
-        )
-        headers.update(sdk_headers)
 
         params = {'profile': profile}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['blueprint_id']
         path_param_values = self.encode_path_vars(blueprint_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/blueprints/{blueprint_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'get_blueprint', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -6075,26 +5542,27 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('blueprint must be provided')
         if isinstance(blueprint, Blueprint):
             blueprint = convert_model(blueprint)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='replace_blueprint'
-        )
-        headers.update(sdk_headers)
 
         params = {'profile': profile}
 
         data = json.dumps(blueprint)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['blueprint_id']
         path_param_values = self.encode_path_vars(blueprint_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/blueprints/{blueprint_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='PUT', url=url, headers=headers, params=params, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'replace_blueprint',
+            kwargs,
+            method='PUT',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            params=params,
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -6119,22 +5587,14 @@ class Schematics20ApiV2(BaseService):
 
         if blueprint_id is None:
             raise ValueError('blueprint_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='delete_blueprint'
-        )
-        headers.update(sdk_headers)
 
         params = {'profile': profile, 'destroy': destroy}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-
         path_param_keys = ['blueprint_id']
         path_param_values = self.encode_path_vars(blueprint_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/blueprints/{blueprint_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='DELETE', url=url, headers=headers, params=params)
+        request = prepare_operation(self, 'V2', 'delete_blueprint', kwargs, method='DELETE', url=url, params=params)
 
         response = self.send(request)
         return response
@@ -6162,26 +5622,27 @@ class Schematics20ApiV2(BaseService):
             raise ValueError('blueprint must be provided')
         if isinstance(blueprint, Blueprint):
             blueprint = convert_model(blueprint)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='update_blueprint'
-        )
-        headers.update(sdk_headers)
 
         params = {'profile': profile}
 
         data = json.dumps(blueprint)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
 
         path_param_keys = ['blueprint_id']
         path_param_values = self.encode_path_vars(blueprint_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/blueprints/{blueprint_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='PATCH', url=url, headers=headers, params=params, data=data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'update_blueprint',
+            kwargs,
+            method='PATCH',
+            url=url,
+            content_type='application/json',
+            accept='application/json',
+            params=params,
+            data=data,
+        )
 
         response = self.send(request)
         return response
@@ -6206,25 +5667,25 @@ class Schematics20ApiV2(BaseService):
 
         if blueprint_id is None:
             raise ValueError('blueprint_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='upload_template_tar_blueprint'
-        )
-        headers.update(sdk_headers)
 
         form_data = []
         if file:
             form_data.append(('file', (None, file, file_content_type or 'application/octet-stream')))
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['blueprint_id']
         path_param_values = self.encode_path_vars(blueprint_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/blueprints/{blueprint_id}/template_repo_upload'.format(**path_param_dict)
-        request = self.prepare_request(method='PUT', url=url, headers=headers, files=form_data)
+        request = prepare_operation(
+            self,
+            'V2',
+            'upload_template_tar_blueprint',
+            kwargs,
+            method='PUT',
+            url=url,
+            accept='application/json',
+            files=form_data,
+        )
 
         response = self.send(request)
         return response
@@ -6260,20 +5721,12 @@ class Schematics20ApiV2(BaseService):
         :rtype: DetailedResponse with `List[CatalogOfferingItem]` result
         """
 
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='list_catalog_items'
-        )
-        headers.update(sdk_headers)
-
         params = {'offset': offset, 'limit': limit, 'catalog_id': catalog_id, 'catalog_name': catalog_name}
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         url = '/v2/catalog'
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'list_catalog_items', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -6322,11 +5775,6 @@ class Schematics20ApiV2(BaseService):
 
         if offering_id is None:
             raise ValueError('offering_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='get_catalog_item'
-        )
-        headers.update(sdk_headers)
 
         params = {
             'catalog_id': catalog_id,
@@ -6337,15 +5785,13 @@ class Schematics20ApiV2(BaseService):
             'limit': limit,
         }
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         path_param_keys = ['offering_id']
         path_param_values = self.encode_path_vars(offering_id)
         path_param_dict = dict(zip(path_param_keys, path_param_values))
         url = '/v2/catalog/{offering_id}'.format(**path_param_dict)
-        request = self.prepare_request(method='GET', url=url, headers=headers, params=params)
+        request = prepare_operation(
+            self, 'V2', 'get_catalog_item', kwargs, method='GET', url=url, accept='application/json', params=params
+        )
 
         response = self.send(request)
         return response
@@ -6371,18 +5817,10 @@ class Schematics20ApiV2(BaseService):
         :rtype: DetailedResponse with `dict` result representing a `SchematicsLocationsList` object
         """
 
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME, service_version='V2', operation_id='list_locations'
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-        headers['Accept'] = 'application/json'
-
         url = '/v2/locations'
-        request = self.prepare_request(method='GET', url=url, headers=headers)
+        request = prepare_operation(
+            self, 'V2', 'list_locations', kwargs, method='GET', url=url, accept='application/json'
+        )
 
         response = self.send(request)
         return response
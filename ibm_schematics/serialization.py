@@ -0,0 +1,471 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Alternative ways of converting Schematics models from and to JSON dictionaries.
+
+The generated `from_dict` methods convert a whole response eagerly: every nested
+model, list of models and timestamp is built before the caller reads a single
+property. `lazy_from_dict` builds the same model, but defers those conversions to
+the first access of each property, which is much cheaper when only a few
+properties of a large list response are read.
+
+`fast_from_dict` and `fast_to_dict` produce exactly what `from_dict` and `to_dict`
+do, with functions generated once per model class that convert all the properties
+in a single pass, without the per-property `hasattr` and `getattr` calls.
+
+The conversions are driven by a field specification that is derived once per
+model class from the annotations of its `__init__` method.
+"""
+
+from datetime import datetime
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple, Type, TypeVar, Union
+import base64
+import inspect
+import linecache
+import sys
+import threading
+import typing
+
+from ibm_cloud_sdk_core.utils import datetime_to_string
+
+from .common import string_to_datetime
+
+__all__ = ['FieldSpec', 'fast_from_dict', 'fast_to_dict', 'field_specs', 'hydrate', 'is_lazy', 'lazy_from_dict']
+
+T = TypeVar('T')
+
+PLAIN = 'plain'
+DATETIME = 'datetime'
+BYTES = 'bytes'
+MODEL = 'model'
+MODEL_LIST = 'model_list'
+
+
+class FieldSpec(NamedTuple):
+    """
+    How one property of a model is converted from and to JSON.
+
+    :attr str name: The property name, which is also the JSON key.
+    :attr str kind: One of `plain`, `datetime`, `bytes`, `model` and `model_list`.
+    :attr type model: (optional) The model class of a `model` or `model_list` property.
+    :attr bool required: Whether `from_dict` rejects a JSON object without the property.
+    """
+
+    name: str
+    kind: str
+    model: Optional[type]
+    required: bool
+
+
+_specs: Dict[type, Tuple[FieldSpec, ...]] = {}
+_lazy_classes: Dict[type, type] = {}
+_compiled: Dict[type, '_Compiled'] = {}
+_lock = threading.RLock()
+
+
+def _is_model(annotation: Any) -> bool:
+    return inspect.isclass(annotation) and hasattr(annotation, 'from_dict')
+
+
+def _field_kind(annotation: Any) -> Tuple[str, Optional[type]]:
+    if typing.get_origin(annotation) is Union:
+        annotation = typing.get_args(annotation)[0]
+    if annotation is datetime:
+        return DATETIME, None
+    if annotation is bytes:
+        return BYTES, None
+    if _is_model(annotation):
+        return MODEL, annotation
+    if typing.get_origin(annotation) is list:
+        (item,) = typing.get_args(annotation)
+        if _is_model(item):
+            return MODEL_LIST, item
+    return PLAIN, None
+
+
+def field_specs(cls: type) -> Tuple[FieldSpec, ...]:
+    """
+    Return the field specification of a model class.
+
+    The specification lists the properties in the order `to_dict` writes them,
+    which is also the order in which `__init__` assigns them, and is computed only
+    once per class.
+
+    :param type cls: A model class such as `Job` or `WorkspaceResponse`.
+    :return: The specification of each property of the model.
+    :rtype: Tuple[FieldSpec, ...]
+    """
+    specs = _specs.get(cls)
+    if specs is None:
+        # Both service modules annotate with the same forward references, such as
+        # List['ActionLite']; a separate locals mapping stops typing from reusing
+        # the class that a reference resolved to in the other module.
+        hints = typing.get_type_hints(cls.__init__, vars(sys.modules[cls.__module__]), {})
+        parameters = [
+            parameter
+            for parameter in list(inspect.signature(cls.__init__).parameters.values())[1:]
+            if parameter.kind not in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD)
+        ]
+        # Required parameters come first in the signature, so take the order from
+        # the attributes of an empty instance instead.
+        order = list(vars(cls(**{parameter.name: None for parameter in parameters})))
+        fields = []
+        for parameter in sorted(parameters, key=lambda parameter: order.index(parameter.name)):
+            kind, model = _field_kind(hints.get(parameter.name))
+            fields.append(FieldSpec(parameter.name, kind, model, parameter.default is parameter.empty))
+        specs = _specs.setdefault(cls, tuple(fields))
+    return specs
+
+
+class _LazyField:
+    """
+    A non-data descriptor that converts a raw JSON value on first access and stores
+    the result in the instance dictionary, which then shadows the descriptor.
+    """
+
+    __slots__ = ('name', 'convert')
+
+    def __init__(self, name: str, convert: Callable[[Any], Any]) -> None:
+        self.name = name
+        self.convert = convert
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = self.convert(instance._raw[self.name])
+        instance.__dict__[self.name] = value
+        return value
+
+
+def _lazy_converter(spec: FieldSpec) -> Callable[[Any], Any]:
+    if spec.kind == DATETIME:
+        return string_to_datetime
+    if spec.kind == BYTES:
+        return base64.b64decode
+    if spec.kind == MODEL:
+        model = spec.model
+        return lambda value: lazy_from_dict(model, value)
+    model = spec.model
+    return lambda values: [lazy_from_dict(model, value) for value in values]
+
+
+def _materialize(model: Any) -> None:
+    for name, attribute in vars(type(model)).items():
+        if isinstance(attribute, _LazyField) and name not in model.__dict__:
+            getattr(model, name)
+
+
+def _restore(cls: type, state: dict) -> Any:
+    model = cls.__new__(cls)
+    model.__dict__.update(state)
+    return model
+
+
+def _lazy_class(cls: type) -> type:
+    lazy_cls = _lazy_classes.get(cls)
+    if lazy_cls is not None:
+        return lazy_cls
+
+    specs = field_specs(cls)
+    plain = tuple(spec.name for spec in specs if spec.kind == PLAIN)
+    deferred = tuple(spec.name for spec in specs if spec.kind != PLAIN)
+    required = tuple(spec.name for spec in specs if spec.required)
+    # Models of the older generator accept a null required property and keep the
+    # JSON properties they do not define.
+    properties = getattr(cls, '_properties', None)
+
+    def from_raw(lazy_cls: type, _dict: Dict) -> Any:
+        for name in required:
+            if (name not in _dict) if properties is not None else (_dict.get(name) is None):
+                raise ValueError('Required property \'{0}\' not present in {1} JSON'.format(name, cls.__name__))
+        model = object.__new__(lazy_cls)
+        model._raw = _dict
+        state = model.__dict__
+        for name in plain:
+            state[name] = _dict.get(name)
+        for name in deferred:
+            if _dict.get(name) is None:
+                state[name] = None
+        if properties is not None:
+            for key, value in _dict.items():
+                if key not in properties:
+                    state[key] = value
+        return model
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, cls):
+            return False
+        _materialize(self)
+        if is_lazy(other):
+            _materialize(other)
+        return self.__dict__ == other.__dict__
+
+    def __reduce__(self):
+        _materialize(self)
+        return _restore, (cls, dict(self.__dict__))
+
+    namespace = {
+        '__slots__': ('_raw',),
+        '__module__': cls.__module__,
+        '__qualname__': cls.__qualname__,
+        '__doc__': cls.__doc__,
+        '__eq__': __eq__,
+        '__hash__': None,
+        '__reduce__': __reduce__,
+        '_from_raw': classmethod(from_raw),
+    }
+    for spec in specs:
+        if spec.kind != PLAIN:
+            namespace[spec.name] = _LazyField(spec.name, _lazy_converter(spec))
+
+    with _lock:
+        lazy_cls = _lazy_classes.get(cls)
+        if lazy_cls is None:
+            lazy_cls = _lazy_classes[cls] = type(cls.__name__, (cls,), namespace)
+    return lazy_cls
+
+
+def lazy_from_dict(cls: Type[T], _dict: Dict) -> T:
+    """
+    Initialize a model from a json dictionary, deferring nested conversions.
+
+    The returned object is an instance of `cls` with the same properties, `to_dict`
+    and equality as the one returned by `cls.from_dict(_dict)`. Plain properties are
+    copied right away; nested models, lists of models, timestamps and base64
+    encoded properties are converted when they are first read. Nested models are
+    themselves lazy. `_dict` is kept by the model until then and must not be
+    modified.
+
+    :param type cls: A model class such as `JobList` or `WorkspaceResponseList`.
+    :param dict _dict: A JSON object returned by the service.
+    :return: A lazily hydrated instance of `cls`.
+    :raises ValueError: when a required property is not present in `_dict`.
+    """
+    return _lazy_class(cls)._from_raw(_dict)
+
+
+def is_lazy(model: Any) -> bool:
+    """Return `True` when `model` was built by `lazy_from_dict`."""
+    return type(model) is _lazy_classes.get(type(model).__base__)
+
+
+def hydrate(model: T) -> T:
+    """
+    Convert all the deferred properties of a lazily hydrated model, recursively.
+
+    Hydrating is useful before sharing a model between threads or measuring it;
+    eager models and other values are returned unchanged.
+
+    :param model: A model, possibly built by `lazy_from_dict`, or a list of models.
+    :return: `model` itself.
+    """
+    if isinstance(model, list):
+        for item in model:
+            hydrate(item)
+    elif is_lazy(model):
+        _materialize(model)
+        for spec in field_specs(type(model).__base__):
+            if spec.kind in (MODEL, MODEL_LIST):
+                hydrate(model.__dict__[spec.name])
+    return model
+
+
+class _Compiled(NamedTuple):
+    from_dict: Callable[[Dict], Any]
+    to_dict: Callable[[Any], Dict]
+
+
+class _Generator:
+    """
+    Generates the source of the `from_dict` and `to_dict` functions of one model
+    class, together with the namespace they are executed in.
+    """
+
+    def __init__(self, cls: type) -> None:
+        self.cls = cls
+        self.namespace = {
+            '_cls': cls,
+            '_new': object.__new__,
+            '_string_to_datetime': string_to_datetime,
+            '_datetime_to_string': datetime_to_string,
+            '_b64decode': base64.b64decode,
+            '_b64encode': base64.b64encode,
+            '_properties': getattr(cls, '_properties', None),
+        }
+
+    def nested(self, index: int, model: type) -> None:
+        """Bind the functions of a nested model class."""
+        if model in _compiling:
+            # A model that contains itself: look its functions up when called.
+            self.namespace['_from_{0}'.format(index)] = lambda value: _compile(model).from_dict(value)
+            self.namespace['_to_{0}'.format(index)] = lambda value: _compile(model).to_dict(value)
+        else:
+            compiled = _compile(model)
+            self.namespace['_from_{0}'.format(index)] = compiled.from_dict
+            self.namespace['_to_{0}'.format(index)] = compiled.to_dict
+        self.namespace['_type_{0}'.format(index)] = model
+
+    def from_dict_source(self, specs: Tuple[FieldSpec, ...]) -> str:
+        """Return the source of the `from_dict` function."""
+        additional = self.namespace['_properties'] is not None
+        lines = ['def from_dict(_dict):', '    _get = _dict.get']
+        for spec in specs:
+            if spec.required:
+                missing = '{0!r} not in _dict' if additional else '_get({0!r}) is None'
+                lines += [
+                    '    if {0}:'.format(missing.format(spec.name)),
+                    '        raise ValueError({0!r})'.format(
+                        'Required property \'{0}\' not present in {1} JSON'.format(spec.name, self.cls.__name__)
+                    ),
+                ]
+        lines.append('    model = _new(_cls)')
+        for index, spec in enumerate(specs):
+            if spec.kind == PLAIN:
+                lines.append('    model.{0} = _get({0!r})'.format(spec.name))
+                continue
+            if spec.kind == DATETIME:
+                value = '_string_to_datetime(value)'
+            elif spec.kind == BYTES:
+                value = '_b64decode(value)'
+            elif spec.kind == MODEL:
+                self.nested(index, spec.model)
+                value = '_from_{0}(value)'.format(index)
+            else:
+                self.nested(index, spec.model)
+                value = '[_from_{0}(item) for item in value]'.format(index)
+            lines += [
+                '    value = _get({0!r})'.format(spec.name),
+                '    model.{0} = None if value is None else {1}'.format(spec.name, value),
+            ]
+        if additional:
+            lines += [
+                '    if not _properties.issuperset(_dict):',
+                '        for key, value in _dict.items():',
+                '            if key not in _properties:',
+                '                setattr(model, key, value)',
+            ]
+        lines.append('    return model')
+        return '\n'.join(lines)
+
+    def to_dict_source(self, specs: Tuple[FieldSpec, ...]) -> str:
+        """Return the source of the `to_dict` function."""
+        # Properties are read as attributes, which keeps the instance dictionary of
+        # the model unmaterialized; a deleted property falls back to `to_dict`.
+        lines = ['def to_dict(model):', '    _dict = {}', '    try:']
+        nested = (
+            '_to_{0}({{0}}) if type({{0}}) is _type_{0} else ({{0}} if isinstance({{0}}, dict) else {{0}}.to_dict())'
+        )
+        for index, spec in enumerate(specs):
+            if spec.kind == PLAIN:
+                value = 'value'
+            elif spec.kind == DATETIME:
+                value = '_datetime_to_string(value)'
+            elif spec.kind == BYTES:
+                value = 'str(_b64encode(value), \'utf-8\')'
+            elif spec.kind == MODEL:
+                value = nested.format(index).format('value')
+            else:
+                value = '[{0} for item in value]'.format(nested.format(index).format('item'))
+            lines += [
+                '        value = model.{0}'.format(spec.name),
+                '        if value is not None:',
+                '            _dict[{0!r}] = {1}'.format(spec.name, value),
+            ]
+        lines += ['    except AttributeError:', '        return model.to_dict()']
+        if self.namespace['_properties'] is not None:
+            lines += [
+                '    state = model.__dict__',
+                '    if not _properties.issuperset(state):',
+                '        for key, value in state.items():',
+                '            if key not in _properties and value is not None:',
+                '                _dict[key] = value',
+            ]
+        lines.append('    return _dict')
+        return '\n'.join(lines)
+
+    def function(self, name: str, source: str) -> Callable:
+        """Compile a generated function, keeping its source available to tracebacks."""
+        filename = '<{0} {1}.{2}>'.format(__name__, self.cls.__qualname__, name)
+        exec(compile(source, filename, 'exec'), self.namespace)  # pylint: disable=exec-used
+        linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+        function = self.namespace[name]
+        function.__qualname__ = '{0}.{1}'.format(self.cls.__qualname__, name)
+        return function
+
+
+_compiling = set()
+
+
+def _compile(cls: type) -> _Compiled:
+    compiled = _compiled.get(cls)
+    if compiled is not None:
+        return compiled
+    with _lock:
+        compiled = _compiled.get(cls)
+        if compiled is None:
+            _compiling.add(cls)
+            try:
+                specs = field_specs(cls)
+                generator = _Generator(cls)
+                compiled = _Compiled(
+                    generator.function('from_dict', generator.from_dict_source(specs)),
+                    generator.function('to_dict', generator.to_dict_source(specs)),
+                )
+            finally:
+                _compiling.discard(cls)
+            _compiled[cls] = compiled
+    return compiled
+
+
+def fast_from_dict(cls: Type[T], _dict: Dict) -> T:
+    """
+    Initialize a model from a json dictionary.
+
+    The result is equal to `cls.from_dict(_dict)`, but is built by a function
+    generated for `cls` the first time it is used, which converts every property
+    with a single dictionary lookup and no intermediate keyword arguments.
+
+    :param type cls: A model class such as `Job` or `WorkspaceResponse`.
+    :param dict _dict: A JSON object returned by the service.
+    :return: An instance of `cls`.
+    :raises ValueError: when a required property is not present in `_dict`.
+    """
+    return _compile(cls).from_dict(_dict)
+
+
+def fast_to_dict(model: Any) -> Dict:
+    """
+    Return a json dictionary representing a model.
+
+    The result is equal to `model.to_dict()`, but is built by a function generated
+    for the class of the model the first time it is used. Lazily hydrated models
+    are hydrated first; models of other classes fall back to their own `to_dict`.
+
+    :param model: A model, such as one returned by `fast_from_dict`.
+    :return: The JSON object representing the model.
+    :rtype: dict
+    """
+    cls = type(model)
+    compiled = _compiled.get(cls)
+    if compiled is None:
+        if is_lazy(model):
+            compiled = _compile(cls.__base__)
+        elif 'to_dict' in vars(cls) and hasattr(model, '__dict__'):
+            compiled = _compile(cls)
+        else:
+            return model.to_dict()
+    return compiled.to_dict(model)
@@ -0,0 +1,405 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A local, content-addressed cache of Terraform statefiles.
+
+Drift reports read the statefiles of the same workspaces over and over, although
+most of them have not changed since the last report. `StateCache` keeps the
+statefiles on disk, each stored once under the SHA-256 digest of its content,
+and evicts the least recently used ones when the cache grows beyond `max_bytes`.
+`get_template_state`, `get_workspace_states` and `get_job_state` read through
+the cache, so that only the statefiles that changed are downloaded:
+
+    cache = StateCache()
+    states = get_workspace_states(schematics_service, w_id, cache=cache)
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+
+from ibm_cloud_sdk_core import ApiException
+
+from .schematics_v1 import SchematicsV1
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.ibm_schematics', 'state_cache')
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def state_key(*, w_id: Optional[str] = None, t_id: Optional[str] = None, job_id: Optional[str] = None) -> str:
+    """
+    Return the key of a statefile in a `StateCache`.
+
+    The statefile of a template is keyed by its workspace and template, and by
+    the job that produced it when `job_id` is given; the statefile of a job alone
+    by the job.
+
+    :param str w_id: (optional) The ID of the workspace.
+    :param str t_id: (optional) The ID of the template of the workspace.
+    :param str job_id: (optional) The ID of the job.
+    :rtype: str
+    """
+    if w_id or t_id:
+        if not w_id or not t_id:
+            raise ValueError('Both w_id and t_id must be provided')
+        key = 'workspace:{0}:{1}'.format(w_id, t_id)
+        return key + ':' + job_id if job_id else key
+    if not job_id:
+        raise ValueError('Either w_id and t_id, or job_id must be provided')
+    return 'job:{0}'.format(job_id)
+
+
+class StateEntry(NamedTuple):
+    """
+    A statefile stored in a `StateCache`.
+
+    :attr str digest: The SHA-256 digest of the content of the statefile.
+    :attr int size: The size of the statefile, in bytes.
+    :attr str etag: The `ETag` header of the response the statefile was
+          downloaded with, if any.
+    :attr str last_modified: The `Last-Modified` header of the response the
+          statefile was downloaded with, if any.
+    """
+
+    digest: str
+    size: int
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class StateCacheInfo(NamedTuple):
+    """Statistics of a `StateCache`."""
+
+    hits: int
+    misses: int
+    entries: int
+    size: int
+    max_bytes: int
+
+
+class StateCache:
+    """
+    An on-disk cache of statefiles, addressed by content and evicted in least
+    recently used order.
+
+    The content of each statefile is stored once, in `objects/` under its SHA-256
+    digest, however many keys refer to it; `index.json` maps the keys to the
+    digests, in the order they were last used, and is rewritten atomically after
+    every change. When the statefiles referred to exceed `max_bytes`, the least
+    recently used keys are dropped and the statefiles no longer referred to are
+    deleted. A cache can be shared between threads.
+
+    :param str path: (optional) The directory of the cache. Defaults to
+           `DEFAULT_CACHE_DIR`.
+    :param int max_bytes: (optional) The largest total size of the statefiles
+           kept, in bytes.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_DIR, *, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if max_bytes < 1:
+            raise ValueError('max_bytes must be a positive integer')
+        self.path = path
+        self.max_bytes = max_bytes
+        self._index: Optional['OrderedDict[str, StateEntry]'] = None
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+
+    def lookup(self, key: str) -> Optional[StateEntry]:
+        """Return the entry stored for a key, or None, without marking it as used."""
+        with self._lock:
+            return self._load().get(key)
+
+    def read(self, key: str) -> Optional[bytes]:
+        """
+        Return the content of the statefile stored for a key and mark it as used.
+
+        :param str key: The key, see `state_key`.
+        :return: The content, or None when the key is not stored or its statefile
+                 is missing or damaged.
+        :rtype: bytes
+        """
+        with self._lock:
+            entry = self._load().get(key)
+            if entry is None:
+                return None
+            try:
+                with open(self._object_path(entry.digest), 'rb') as file:
+                    data = file.read()
+            except FileNotFoundError:
+                data = None
+            if data is None or hashlib.sha256(data).hexdigest() != entry.digest:
+                logger.warning('Dropping the missing or damaged statefile of %s from %s', key, self.path)
+                self._remove(key)
+                self._save()
+                return None
+            if next(reversed(self._index)) != key:
+                self._index.move_to_end(key)
+                self._save()
+            return data
+
+    def store(
+        self, key: str, data: bytes, *, etag: Optional[str] = None, last_modified: Optional[str] = None
+    ) -> Optional[StateEntry]:
+        """
+        Store the content of a statefile for a key and mark it as used.
+
+        :param str key: The key, see `state_key`.
+        :param bytes data: The content of the statefile.
+        :param str etag: (optional) The `ETag` header of its response.
+        :param str last_modified: (optional) The `Last-Modified` header of its
+               response.
+        :return: The entry stored, or None when the statefile is larger than the
+                 cache.
+        :rtype: StateEntry
+        """
+        with self._lock:
+            index = self._load()
+            if len(data) > self.max_bytes:
+                if self._remove(key):
+                    self._save()
+                return None
+            entry = StateEntry(hashlib.sha256(data).hexdigest(), len(data), etag, last_modified)
+            object_path = self._object_path(entry.digest)
+            if not os.path.exists(object_path):
+                _write_atomically(object_path, data)
+            self._remove(key)
+            index[key] = entry
+            self._evict()
+            self._save()
+            return entry
+
+    def forget(self, key: str) -> None:
+        """Remove the statefile stored for a key, if any."""
+        with self._lock:
+            self._load()
+            if self._remove(key):
+                self._save()
+
+    def clear(self) -> None:
+        """Remove every statefile."""
+        with self._lock:
+            for key in list(self._load()):
+                self._remove(key)
+            self._save()
+
+    def info(self) -> StateCacheInfo:
+        """Return the statistics of the cache."""
+        with self._lock:
+            index = self._load()
+            return StateCacheInfo(self._hits, self._misses, len(index), self._size(), self.max_bytes)
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.path, 'objects', digest[:2], digest)
+
+    def _size(self) -> int:
+        return sum({entry.digest: entry.size for entry in self._index.values()}.values())
+
+    def _remove(self, key: str) -> bool:
+        """Drop a key, and its statefile when no other key refers to it."""
+        entry = self._index.pop(key, None)
+        if entry is None:
+            return False
+        if all(other.digest != entry.digest for other in self._index.values()):
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self._object_path(entry.digest))
+        return True
+
+    def _evict(self) -> None:
+        size = self._size()
+        while size > self.max_bytes:
+            key = next(iter(self._index))
+            logger.debug('Evicting the statefile of %s from %s', key, self.path)
+            self._remove(key)
+            size = self._size()
+
+    def _load(self) -> 'OrderedDict[str, StateEntry]':
+        if self._index is None:
+            self._index = OrderedDict()
+            try:
+                with open(os.path.join(self.path, 'index.json'), encoding='utf-8') as file:
+                    for key, values in json.load(file):
+                        self._index[key] = StateEntry(*values)
+            except FileNotFoundError:
+                pass
+            except (TypeError, ValueError):
+                logger.warning('Ignoring the unreadable statefile index in %s', self.path)
+                self._index = OrderedDict()
+        return self._index
+
+    def _save(self) -> None:
+        data = json.dumps([[key, list(entry)] for key, entry in self._index.items()], indent=1)
+        _write_atomically(os.path.join(self.path, 'index.json'), data.encode('utf-8'))
+
+
+def _write_atomically(path: str, data: bytes) -> None:
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(temp_path)
+        raise
+
+
+def _validators(entry: Optional[StateEntry]) -> Dict[str, str]:
+    validators = {}
+    if entry is not None and entry.etag:
+        validators['If-None-Match'] = entry.etag
+    if entry is not None and entry.last_modified:
+        validators['If-Modified-Since'] = entry.last_modified
+    return validators
+
+
+def get_template_state(
+    client: SchematicsV1,
+    w_id: str,
+    t_id: str,
+    *,
+    cache: StateCache,
+    job_id: Optional[str] = None,
+    **kwargs,
+) -> Dict[str, Any]:
+    """
+    Return the content of the Terraform statefile of a workspace template, reading
+    it from the cache when it did not change.
+
+    A statefile stored with the `ETag` or `Last-Modified` header of its response
+    is revalidated with `If-None-Match` and `If-Modified-Since`, and only
+    downloaded again when the service does not answer `304 Not Modified`. When
+    `job_id` names the job that last changed the template, such as the
+    `last_job` of the workspace, a statefile stored for that job is returned
+    without sending any request, because it cannot change anymore.
+
+    :param SchematicsV1 client: The service client.
+    :param str w_id: The ID of the workspace.
+    :param str t_id: The ID of the template of the workspace.
+    :param StateCache cache: The cache.
+    :param str job_id: (optional) The ID of the last finished job of the
+           workspace.
+    :param dict headers: (optional) A `dict` containing the request headers.
+    :return: The statefile, as a `dict` representing a `TemplateStateStore`.
+    :rtype: dict
+    """
+    key = state_key(w_id=w_id, t_id=t_id)
+    if job_id:
+        data = cache.read(state_key(w_id=w_id, t_id=t_id, job_id=job_id))
+        if data is not None:
+            cache._count(True)
+            return json.loads(data)
+    data = cache.read(key)
+    validators = _validators(cache.lookup(key)) if data is not None else {}
+    kwargs['headers'] = dict(validators, **(kwargs.get('headers') or {}))
+    kwargs['stream'] = True
+    try:
+        response = client.get_workspace_template_state(w_id, t_id, **kwargs)
+    except ApiException as e:
+        if e.status_code in (404, 410):
+            cache.forget(key)
+        if e.status_code != 304 or data is None:
+            raise
+        cache._count(True)
+    else:
+        cache._count(False)
+        with contextlib.closing(response.get_result()) as result:
+            data = result.content
+            headers = result.headers
+        cache.store(key, data, etag=headers.get('ETag'), last_modified=headers.get('Last-Modified'))
+    if job_id:
+        cache.store(state_key(w_id=w_id, t_id=t_id, job_id=job_id), data)
+    return json.loads(data)
+
+
+def get_workspace_states(
+    client: SchematicsV1,
+    w_id: str,
+    *,
+    cache: StateCache,
+    job_id: Optional[str] = None,
+    **kwargs,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Return the content of the Terraform statefiles of every template of a
+    workspace, reading them from the cache when they did not change.
+
+    The templates are listed with `get_workspace_state`, and each statefile is
+    read with `get_template_state`.
+
+    :param SchematicsV1 client: The service client.
+    :param str w_id: The ID of the workspace.
+    :param StateCache cache: The cache.
+    :param str job_id: (optional) The ID of the last finished job of the
+           workspace.
+    :param dict headers: (optional) A `dict` containing the request headers.
+    :return: The statefiles, as `dict`s representing a `TemplateStateStore`, by
+             template ID.
+    :rtype: dict
+    """
+    state_stores = client.get_workspace_state(w_id, **kwargs).get_result()
+    return {
+        record['id']: get_template_state(client, w_id, record['id'], cache=cache, job_id=job_id, **kwargs)
+        for record in (state_stores or {}).get('runtime_data') or []
+        if record.get('id')
+    }
+
+
+def get_job_state(client: SchematicsV1, job_id: str, *, cache: StateCache, **kwargs) -> Dict[str, Any]:
+    """
+    Return the content of the Terraform statefile of a finished job, downloading
+    it only when it is not in the cache.
+
+    The statefile of a job does not change once the job has finished, so it is
+    never requested again while it stays in the cache.
+
+    :param SchematicsV1 client: The service client.
+    :param str job_id: The ID of a finished job.
+    :param StateCache cache: The cache.
+    :param dict headers: (optional) A `dict` containing the request headers.
+    :return: The statefile.
+    :rtype: dict
+    """
+    key = state_key(job_id=job_id)
+    data = cache.read(key)
+    if data is not None:
+        cache._count(True)
+        return json.loads(data)
+    cache._count(False)
+    result = client.get_job_files(job_id, 'state_file', **kwargs).get_result() or {}
+    if result.get('file_content') is None:
+        raise ValueError('The response of job {0} has no state_file content'.format(job_id))
+    data = result['file_content'].encode('utf-8')
+    cache.store(key, data)
+    return json.loads(data)
@@ -0,0 +1,498 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Helpers that upload Terraform templates to workspaces and actions.
+
+`upload_template_tar` uploads a template only when its content changed since the
+previous upload to the same workspace template or action. The digests of the
+uploaded templates are kept in a `DigestStore`, a small JSON file on the local
+disk:
+
+    upload_template_tar(schematics_service, 'template.tar', w_id=w_id, t_id=t_id)
+
+`upload_template_dir` uploads a template directly from a directory, streaming a
+tar archive of it into the request without writing it to disk or holding it in
+memory.
+"""
+
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+import fnmatch
+import hashlib
+import io
+import json
+import logging
+import os
+import stat
+import tarfile
+import tempfile
+import threading
+import uuid
+
+from ibm_cloud_sdk_core import DetailedResponse
+
+from .common import get_sdk_headers
+from .schematics_v1 import SchematicsV1
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_PATH = os.path.join(os.path.expanduser('~'), '.ibm_schematics', 'template_digests.json')
+# The files and directories left out of the templates uploaded from a directory by default.
+DEFAULT_EXCLUDES = ('.terraform/', '.git/')
+_CHUNK_SIZE = 1024 * 1024
+
+
+def file_digest(file: BinaryIO) -> str:
+    """
+    Return the SHA-256 digest of the rest of a binary file, reading it in chunks.
+
+    The position of the file is restored afterwards.
+
+    :param BinaryIO file: The file.
+    :return: The hexadecimal digest.
+    :rtype: str
+    """
+    position = file.tell()
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: file.read(_CHUNK_SIZE), b''):
+        digest.update(chunk)
+    file.seek(position)
+    return digest.hexdigest()
+
+
+def _matches(relative_path: str, patterns: Iterable[str], is_dir: bool) -> bool:
+    """
+    Return whether a path matches one of the glob patterns, by its relative path or
+    its name. Patterns ending with a slash only match directories.
+    """
+    name = relative_path.rsplit('/', 1)[-1]
+    for pattern in patterns:
+        if pattern.endswith('/'):
+            if not is_dir:
+                continue
+            pattern = pattern[:-1]
+        if fnmatch.fnmatchcase(relative_path, pattern) or fnmatch.fnmatchcase(name, pattern):
+            return True
+    return False
+
+
+def _template_entries(
+    path: str, include: Optional[Sequence[str]], exclude: Sequence[str]
+) -> List[Tuple[str, str, os.stat_result]]:
+    """
+    Return the relative path, full path and status of the files and symbolic links
+    of a directory, sorted by relative path.
+    """
+    if not os.path.isdir(path):
+        raise ValueError('{0} is not a directory'.format(path))
+    entries = []
+    for root, dirs, files in os.walk(path):
+        relative_root = os.path.relpath(root, path).replace(os.sep, '/')
+        relative_root = '' if relative_root == '.' else relative_root + '/'
+        dirs[:] = [d for d in dirs if not _matches(relative_root + d, exclude, True)]
+        for name in files + [d for d in dirs if os.path.islink(os.path.join(root, d))]:
+            relative_path = relative_root + name
+            if _matches(relative_path, exclude, False):
+                continue
+            if include is not None and not _matches(relative_path, include, False):
+                continue
+            full_path = os.path.join(root, name)
+            entries.append((relative_path, full_path, os.lstat(full_path)))
+    entries.sort(key=lambda entry: entry[0])
+    return entries
+
+
+def directory_digest(path: str, *, include: Optional[Sequence[str]] = None, exclude: Sequence[str] = ()) -> str:
+    """
+    Return a SHA-256 digest of the content of a directory.
+
+    The digest covers the relative path, the executable bit and the content of
+    every file, and the target of every symbolic link, so that it does not depend
+    on timestamps, ownership or the order of the entries on disk.
+
+    :param str path: The directory.
+    :param list include: (optional) Glob patterns of the files to include, for
+           example `['*.tf']`. By default every file is included.
+    :param list exclude: (optional) Glob patterns of the files and directories to
+           leave out, for example `['.terraform/']`.
+    :return: The hexadecimal digest.
+    :rtype: str
+    """
+    digest = hashlib.sha256()
+    for relative_path, full_path, status in _template_entries(path, include, exclude):
+        if stat.S_ISLNK(status.st_mode):
+            entry = 'l {0} {1}'.format(relative_path, os.readlink(full_path))
+        else:
+            with open(full_path, 'rb') as file:
+                entry = 'f {0} {1:d} {2}'.format(relative_path, bool(status.st_mode & stat.S_IXUSR), file_digest(file))
+        digest.update(entry.encode('utf-8', 'surrogateescape') + b'\n')
+    return digest.hexdigest()
+
+
+def iter_template_tar(
+    path: str,
+    *,
+    include: Optional[Sequence[str]] = None,
+    exclude: Sequence[str] = DEFAULT_EXCLUDES,
+    chunk_size: int = _CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """
+    Generate a tar archive of a directory, in chunks.
+
+    The archive is deterministic: the entries are sorted by path and have no
+    timestamps or owners, and files have mode 644, or 755 when executable. Only
+    files and symbolic links are archived. No more than `chunk_size` bytes of a
+    file are held in memory at a time.
+
+    :param str path: The directory.
+    :param list include: (optional) Glob patterns of the files to include, for
+           example `['*.tf']`. By default every file is included.
+    :param list exclude: (optional) Glob patterns of the files and directories to
+           leave out. Defaults to `DEFAULT_EXCLUDES`.
+    :param int chunk_size: (optional) The largest number of bytes read from a file
+           at a time.
+    :return: The chunks of the archive.
+    :rtype: Iterator[bytes]
+    """
+    written = 0
+    for relative_path, full_path, status in _template_entries(path, include, exclude):
+        info = tarfile.TarInfo(relative_path)
+        info.mtime = 0
+        if stat.S_ISLNK(status.st_mode):
+            info.type = tarfile.SYMTYPE
+            info.linkname = os.readlink(full_path)
+            info.mode = 0o777
+        else:
+            info.size = status.st_size
+            info.mode = 0o755 if status.st_mode & stat.S_IXUSR else 0o644
+        header = info.tobuf(tarfile.PAX_FORMAT, 'utf-8', 'surrogateescape')
+        written += len(header)
+        yield header
+        if info.type == tarfile.SYMTYPE:
+            continue
+        remaining = info.size
+        with open(full_path, 'rb') as file:
+            while remaining > 0:
+                chunk = file.read(min(chunk_size, remaining))
+                if not chunk:
+                    # The file shrank while it was archived; keep the size of the header.
+                    chunk = bytes(min(chunk_size, remaining))
+                remaining -= len(chunk)
+                yield chunk
+        padding = -info.size % tarfile.BLOCKSIZE
+        written += info.size + padding
+        if padding:
+            yield bytes(padding)
+    end = 2 * tarfile.BLOCKSIZE
+    yield bytes(end + (-(written + end) % tarfile.RECORDSIZE))
+
+
+class DigestStore:
+    """
+    The digests of the last templates uploaded, kept in a JSON file.
+
+    The file is read on first use and rewritten atomically after every change, so
+    that it can be shared by the steps of a CI pipeline. A store can be shared
+    between threads.
+
+    :param str path: (optional) The path of the JSON file. Defaults to
+           `DEFAULT_STORE_PATH`.
+    """
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH) -> None:
+        self.path = path
+        self._digests: Optional[Dict[str, str]] = None
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the digest stored for a key, or None."""
+        with self._lock:
+            return self._load().get(key)
+
+    def set(self, key: str, digest: str) -> None:
+        """Store the digest for a key."""
+        with self._lock:
+            self._load()[key] = digest
+            self._save()
+
+    def forget(self, key: str) -> None:
+        """Remove the digest stored for a key, if any."""
+        with self._lock:
+            if self._load().pop(key, None) is not None:
+                self._save()
+
+    def _load(self) -> Dict[str, str]:
+        if self._digests is None:
+            try:
+                with open(self.path, encoding='utf-8') as file:
+                    self._digests = json.load(file)
+            except FileNotFoundError:
+                self._digests = {}
+            except ValueError:
+                logger.warning('Ignoring the unreadable template digests in %s', self.path)
+                self._digests = {}
+        return self._digests
+
+    def _save(self) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.template_digests')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                json.dump(self._digests, file, indent=2, sort_keys=True)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+
+def template_key(*, w_id: Optional[str] = None, t_id: Optional[str] = None, action_id: Optional[str] = None) -> str:
+    """
+    Return the key of the template of a workspace or an action in a `DigestStore`.
+
+    :param str w_id: (optional) The ID of the workspace.
+    :param str t_id: (optional) The ID of the template of the workspace.
+    :param str action_id: (optional) The ID of the action.
+    :rtype: str
+    """
+    if action_id:
+        if w_id or t_id:
+            raise ValueError('Either w_id and t_id, or action_id must be provided')
+        return 'action:{0}'.format(action_id)
+    if not w_id or not t_id:
+        raise ValueError('Either w_id and t_id, or action_id must be provided')
+    return 'workspace:{0}:{1}'.format(w_id, t_id)
+
+
+def upload_template_tar(
+    client: SchematicsV1,
+    tar: Union[str, BinaryIO],
+    *,
+    w_id: Optional[str] = None,
+    t_id: Optional[str] = None,
+    action_id: Optional[str] = None,
+    source_dir: Optional[str] = None,
+    store: Optional[DigestStore] = None,
+    force: bool = False,
+    **kwargs,
+) -> Optional[DetailedResponse]:
+    """
+    Upload the template tar file of a workspace or an action, unless the same
+    content was uploaded last time.
+
+    The template is identified by the digest of the tar file or, when
+    `source_dir` is given, of the directory it was built from, which does not
+    change when the tar is rebuilt from the same files. The digest is stored
+    after a successful upload only.
+
+    :param SchematicsV1 client: The service client.
+    :param tar: The path of the tar file, or the tar file opened in binary mode.
+    :param str w_id: (optional) The ID of the workspace.
+    :param str t_id: (optional) The ID of the template of the workspace.
+    :param str action_id: (optional) The ID of the action, instead of `w_id`
+           and `t_id`.
+    :param str source_dir: (optional) The directory the tar file was built from.
+    :param DigestStore store: (optional) The digests of the previous uploads.
+           Defaults to a store in `DEFAULT_STORE_PATH`.
+    :param bool force: (optional) Whether to upload even when the content did not
+           change.
+    :param **kwargs: (optional) Further arguments of `template_repo_upload` or
+           `upload_template_tar_action`, such as `headers`.
+    :return: The response of the upload, or None when it was skipped.
+    :rtype: DetailedResponse
+    """
+    key = template_key(w_id=w_id, t_id=t_id, action_id=action_id)
+    store = store if store is not None else DigestStore()
+    if isinstance(tar, str):
+        with open(tar, 'rb') as file:
+            return upload_template_tar(
+                client,
+                file,
+                w_id=w_id,
+                t_id=t_id,
+                action_id=action_id,
+                source_dir=source_dir,
+                store=store,
+                force=force,
+                **kwargs,
+            )
+
+    digest = directory_digest(source_dir) if source_dir is not None else file_digest(tar)
+    if not force and store.get(key) == digest:
+        logger.debug('Skipping the upload of the unchanged template of %s', key)
+        return None
+    if action_id:
+        response = client.upload_template_tar_action(action_id, file=tar, **kwargs)
+    else:
+        response = client.template_repo_upload(w_id, t_id, file=tar, **kwargs)
+    store.set(key, digest)
+    return response
+
+
+class _ChunkStream(io.RawIOBase):
+    """A read-only binary stream over an iterator of chunks."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        super().__init__()
+        self._chunks = iter(chunks)
+        self._pending = b''
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            self._pending = next(self._chunks, None)
+            if self._pending is None:
+                self._pending = b''
+                return 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+    def __iter__(self):
+        # requests sends an iterable body chunk by chunk; do not split it into lines.
+        if self._pending:
+            yield self._pending
+            self._pending = b''
+        yield from self._chunks
+
+
+def _multipart_file(boundary: str, filename: str, chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Generate a multipart/form-data body with a single `file` part."""
+    yield (
+        '--{0}\r\nContent-Disposition: form-data; name="file"; filename="{1}"\r\n'
+        'Content-Type: application/x-tar\r\n\r\n'.format(boundary, filename)
+    ).encode('utf-8')
+    yield from chunks
+    yield '\r\n--{0}--\r\n'.format(boundary).encode('utf-8')
+
+
+def _upload_dir(
+    client: SchematicsV1,
+    key: str,
+    operation_id: str,
+    url: str,
+    path: str,
+    include: Optional[Sequence[str]],
+    exclude: Sequence[str],
+    store: Optional[DigestStore],
+    force: bool,
+    kwargs: dict,
+) -> Optional[DetailedResponse]:
+    if not os.path.isdir(path):
+        raise ValueError('{0} is not a directory'.format(path))
+    digest = None
+    if store is not None:
+        digest = directory_digest(path, include=include, exclude=exclude)
+        if not force and store.get(key) == digest:
+            logger.debug('Skipping the upload of the unchanged template of %s', key)
+            return None
+
+    boundary = uuid.uuid4().hex
+    filename = (os.path.basename(os.path.abspath(path)) or 'template') + '.tar'
+    headers = get_sdk_headers(service_name=client.DEFAULT_SERVICE_NAME, service_version='V1', operation_id=operation_id)
+    headers.update(kwargs.pop('headers', None) or {})
+    headers['Accept'] = 'application/json'
+    headers['Content-Type'] = 'multipart/form-data; boundary={0}'.format(boundary)
+    body = _multipart_file(boundary, filename, iter_template_tar(path, include=include, exclude=exclude))
+    request = client.prepare_request(method='PUT', url=url, headers=headers, data=_ChunkStream(body))
+    response = client.send(request, **kwargs)
+    if store is not None:
+        store.set(key, digest)
+    return response
+
+
+def upload_template_dir(
+    client: SchematicsV1,
+    w_id: str,
+    t_id: str,
+    path: str,
+    *,
+    include: Optional[Sequence[str]] = None,
+    exclude: Sequence[str] = DEFAULT_EXCLUDES,
+    store: Optional[DigestStore] = None,
+    force: bool = False,
+    **kwargs,
+) -> Optional[DetailedResponse]:
+    """
+    Upload the template of a workspace from a directory.
+
+    Like `template_repo_upload`, but the tar archive is built from the directory
+    while it is sent, see `iter_template_tar`, and the request body is streamed
+    with chunked transfer encoding.
+
+    :param SchematicsV1 client: The service client.
+    :param str w_id: The ID of the workspace.
+    :param str t_id: The ID of the template of the workspace.
+    :param str path: The directory of the template.
+    :param list include: (optional) Glob patterns of the files to include, for
+           example `['*.tf', 'scripts/*']`. By default every file is included.
+    :param list exclude: (optional) Glob patterns of the files and directories to
+           leave out. Defaults to `DEFAULT_EXCLUDES`.
+    :param DigestStore store: (optional) When given, the upload is skipped if the
+           included files did not change since the previous upload.
+    :param bool force: (optional) Whether to upload even when the files did not
+           change.
+    :param dict headers: (optional) A `dict` containing the request headers.
+    :return: The response of the upload, or None when it was skipped.
+    :rtype: DetailedResponse
+    """
+    if not w_id:
+        raise ValueError('w_id must be provided')
+    if not t_id:
+        raise ValueError('t_id must be provided')
+    url = '/v1/workspaces/{0}/template_data/{1}/template_repo_upload'.format(*client.encode_path_vars(w_id, t_id))
+    key = template_key(w_id=w_id, t_id=t_id)
+    return _upload_dir(client, key, 'template_repo_upload', url, path, include, exclude, store, force, kwargs)
+
+
+def upload_template_dir_action(
+    client: SchematicsV1,
+    action_id: str,
+    path: str,
+    *,
+    include: Optional[Sequence[str]] = None,
+    exclude: Sequence[str] = DEFAULT_EXCLUDES,
+    store: Optional[DigestStore] = None,
+    force: bool = False,
+    **kwargs,
+) -> Optional[DetailedResponse]:
+    """
+    Upload the template of an action from a directory.
+
+    Like `upload_template_dir`, for `upload_template_tar_action`.
+
+    :param SchematicsV1 client: The service client.
+    :param str action_id: The ID of the action.
+    :param str path: The directory of the template.
+    :param list include: (optional) Glob patterns of the files to include.
+    :param list exclude: (optional) Glob patterns of the files and directories to
+           leave out. Defaults to `DEFAULT_EXCLUDES`.
+    :param DigestStore store: (optional) When given, the upload is skipped if the
+           included files did not change since the previous upload.
+    :param bool force: (optional) Whether to upload even when the files did not
+           change.
+    :param dict headers: (optional) A `dict` containing the request headers.
+    :return: The response of the upload, or None when it was skipped.
+    :rtype: DetailedResponse
+    """
+    if not action_id:
+        raise ValueError('action_id must be provided')
+    url = '/v2/actions/{0}/template_repo_upload'.format(*client.encode_path_vars(action_id))
+    key = template_key(action_id=action_id)
+    return _upload_dir(client, key, 'upload_template_tar_action', url, path, include, exclude, store, force, kwargs)
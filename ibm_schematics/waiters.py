@@ -0,0 +1,478 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Helpers that wait for Schematics jobs, workspaces and workspace activities to reach a
+given state.
+
+The waiters poll with an exponential backoff: the first check happens after
+`initial_interval` seconds and the interval grows by `multiplier` up to
+`max_interval`, with random jitter so that many waiters do not poll in lockstep.
+A waiter returns as soon as the object reaches a terminal state and raises
+`TimeoutError` when `timeout` seconds elapse first.
+
+`JobWatcher` follows many jobs at once and batches their status checks into
+`list_jobs` calls.
+"""
+
+from concurrent.futures import Future
+from typing import Callable, Dict, Iterable, Optional, Tuple, TypeVar
+import logging
+import random
+import threading
+import time
+
+from ibm_cloud_sdk_core import ApiException
+
+from .schematics_v1 import (
+    Job,
+    JobLite,
+    JobsPager,
+    JobStatusWorkspace,
+    SchematicsV1,
+    WorkspaceActivity,
+    WorkspaceResponse,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+DEFAULT_TIMEOUT = 3600.0
+DEFAULT_INITIAL_INTERVAL = 1.0
+DEFAULT_MAX_INTERVAL = 30.0
+DEFAULT_MULTIPLIER = 2.0
+
+JOB_TERMINAL_STATUSES = frozenset(
+    {
+        JobStatusWorkspace.StatusCodeEnum.JOB_FINISHED.value,
+        JobStatusWorkspace.StatusCodeEnum.JOB_FAILED.value,
+        JobStatusWorkspace.StatusCodeEnum.JOB_CANCELLED.value,
+        JobStatusWorkspace.StatusCodeEnum.JOB_STOPPED.value,
+    }
+)
+WORKSPACE_FAILURE_STATUSES = frozenset({'FAILED', 'TEMPLATE ERROR', 'STOPPED'})
+WORKSPACE_ACTIVITY_TERMINAL_STATUSES = frozenset({'COMPLETED', 'FAILED', 'STOPPED'})
+
+
+class Backoff:
+    """
+    Exponential backoff with jitter.
+
+    Each call to `next_interval()` returns a delay drawn uniformly from the upper half
+    of the current interval, then grows the interval by `multiplier` up to
+    `max_interval`. `reset()` starts over from `initial_interval`.
+
+    :param float initial_interval: The first interval, in seconds.
+    :param float max_interval: The largest interval, in seconds.
+    :param float multiplier: The factor applied to the interval after each call.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_interval: float = DEFAULT_INITIAL_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        multiplier: float = DEFAULT_MULTIPLIER,
+    ) -> None:
+        if initial_interval <= 0 or max_interval < initial_interval:
+            raise ValueError('initial_interval must be positive and not greater than max_interval')
+        if multiplier < 1:
+            raise ValueError('multiplier must be at least 1')
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.multiplier = multiplier
+        self._interval = initial_interval
+
+    def next_interval(self) -> float:
+        """Return the next delay, in seconds."""
+        interval = self._interval
+        self._interval = min(self._interval * self.multiplier, self.max_interval)
+        return random.uniform(interval / 2, interval)
+
+    def reset(self) -> None:
+        """Restart the backoff from the initial interval."""
+        self._interval = self.initial_interval
+
+
+def poll_until(
+    fetch: Callable[[], T],
+    is_done: Callable[[T], bool],
+    *,
+    timeout: Optional[float] = DEFAULT_TIMEOUT,
+    backoff: Optional[Backoff] = None,
+    description: str = 'the operation',
+) -> T:
+    """
+    Call `fetch` until `is_done` accepts its result, sleeping between calls.
+
+    :param fetch: Retrieves the current state.
+    :param is_done: Returns true when the state is final.
+    :param float timeout: (optional) The number of seconds to wait before giving up;
+           None waits forever.
+    :param Backoff backoff: (optional) The backoff policy between two calls.
+    :param str description: (optional) Names what is awaited in the timeout message.
+    :return: The first state accepted by `is_done`.
+    :raises TimeoutError: when the timeout elapses first.
+    """
+    backoff = backoff or Backoff()
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        state = fetch()
+        if is_done(state):
+            return state
+        delay = backoff.next_interval()
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError('Timed out after {0} seconds waiting for {1}'.format(timeout, description))
+            delay = min(delay, remaining)
+        logger.debug('Waiting %.1f seconds before polling %s again', delay, description)
+        time.sleep(delay)
+
+
+def job_status_code(job: Job) -> Optional[str]:
+    """
+    Return the status code of a job, whatever the kind of object it runs against.
+
+    :param Job job: The job, as returned by `get_job`, or a `JobLite` from
+           `list_jobs`.
+    :return: The `job_*` status code, or None when the job has no status yet.
+    :rtype: str
+    """
+    status = job.status
+    if status is None:
+        return None
+    if status.workspace_job_status is not None and status.workspace_job_status.status_code is not None:
+        return status.workspace_job_status.status_code
+    if status.action_job_status is not None and status.action_job_status.status_code is not None:
+        return status.action_job_status.status_code
+    if status.system_job_status is not None and status.system_job_status.system_status_code is not None:
+        return status.system_job_status.system_status_code
+    if status.flow_job_status is not None:
+        return status.flow_job_status.status_code
+    return None
+
+
+def wait_for_job(
+    client: SchematicsV1,
+    job_id: str,
+    *,
+    timeout: Optional[float] = DEFAULT_TIMEOUT,
+    initial_interval: float = DEFAULT_INITIAL_INTERVAL,
+    max_interval: float = DEFAULT_MAX_INTERVAL,
+    multiplier: float = DEFAULT_MULTIPLIER,
+    **kwargs,
+) -> Job:
+    """
+    Wait for a job to finish, fail, or be cancelled or stopped.
+
+    :param SchematicsV1 client: The service client.
+    :param str job_id: Job Id. Use `GET /v2/jobs` API to look up the Job Ids in
+           your IBM Cloud account.
+    :param float timeout: (optional) The number of seconds to wait before giving up;
+           None waits forever.
+    :param float initial_interval: (optional) The first polling interval, in seconds.
+    :param float max_interval: (optional) The largest polling interval, in seconds.
+    :param float multiplier: (optional) The growth factor of the polling interval.
+    :param kwargs: (optional) Additional arguments passed to `get_job`, such as
+           `headers`.
+    :return: The job in its terminal state; use `job_status_code` to tell success
+           from failure.
+    :rtype: Job
+    :raises TimeoutError: when the job is still running after `timeout` seconds.
+    """
+    return poll_until(
+        lambda: Job.from_dict(client.get_job(job_id=job_id, **kwargs).get_result()),
+        lambda job: job_status_code(job) in JOB_TERMINAL_STATUSES,
+        timeout=timeout,
+        backoff=Backoff(initial_interval=initial_interval, max_interval=max_interval, multiplier=multiplier),
+        description='job {0}'.format(job_id),
+    )
+
+
+def wait_for_workspace_status(
+    client: SchematicsV1,
+    w_id: str,
+    statuses: Iterable[str],
+    *,
+    failure_statuses: Iterable[str] = WORKSPACE_FAILURE_STATUSES,
+    timeout: Optional[float] = DEFAULT_TIMEOUT,
+    initial_interval: float = DEFAULT_INITIAL_INTERVAL,
+    max_interval: float = DEFAULT_MAX_INTERVAL,
+    multiplier: float = DEFAULT_MULTIPLIER,
+    **kwargs,
+) -> WorkspaceResponse:
+    """
+    Wait for a workspace to reach one of the given statuses.
+
+    Statuses are compared case-insensitively. The wait also ends when the workspace
+    reaches one of the `failure_statuses`, since it would otherwise last until the
+    timeout.
+
+    :param SchematicsV1 client: The service client.
+    :param str w_id: The ID of the workspace.
+    :param Iterable[str] statuses: The awaited workspace statuses, for example
+           `['ACTIVE']` or `['INACTIVE', 'DRAFT']`.
+    :param Iterable[str] failure_statuses: (optional) Statuses that end the wait
+           although they were not requested.
+    :param float timeout: (optional) The number of seconds to wait before giving up;
+           None waits forever.
+    :param float initial_interval: (optional) The first polling interval, in seconds.
+    :param float max_interval: (optional) The largest polling interval, in seconds.
+    :param float multiplier: (optional) The growth factor of the polling interval.
+    :param kwargs: (optional) Additional arguments passed to `get_workspace`, such
+           as `headers`.
+    :return: The workspace in the status that ended the wait.
+    :rtype: WorkspaceResponse
+    :raises TimeoutError: when no such status was reached after `timeout` seconds.
+    """
+    final_statuses = {s.upper() for s in statuses} | {s.upper() for s in failure_statuses}
+    return poll_until(
+        lambda: WorkspaceResponse.from_dict(client.get_workspace(w_id=w_id, **kwargs).get_result()),
+        lambda workspace: (workspace.status or '').upper() in final_statuses,
+        timeout=timeout,
+        backoff=Backoff(initial_interval=initial_interval, max_interval=max_interval, multiplier=multiplier),
+        description='workspace {0}'.format(w_id),
+    )
+
+
+def wait_for_workspace_activity(
+    client: SchematicsV1,
+    w_id: str,
+    activity_id: str,
+    *,
+    timeout: Optional[float] = DEFAULT_TIMEOUT,
+    initial_interval: float = DEFAULT_INITIAL_INTERVAL,
+    max_interval: float = DEFAULT_MAX_INTERVAL,
+    multiplier: float = DEFAULT_MULTIPLIER,
+    **kwargs,
+) -> WorkspaceActivity:
+    """
+    Wait for a workspace activity to complete, fail or be stopped.
+
+    :param SchematicsV1 client: The service client.
+    :param str w_id: The ID of the workspace.
+    :param str activity_id: The ID of the activity or job, for which you want to
+           retrieve details.
+    :param float timeout: (optional) The number of seconds to wait before giving up;
+           None waits forever.
+    :param float initial_interval: (optional) The first polling interval, in seconds.
+    :param float max_interval: (optional) The largest polling interval, in seconds.
+    :param float multiplier: (optional) The growth factor of the polling interval.
+    :param kwargs: (optional) Additional arguments passed to
+           `get_workspace_activity`, such as `headers`.
+    :return: The activity in its terminal state.
+    :rtype: WorkspaceActivity
+    :raises TimeoutError: when the activity is still running after `timeout` seconds.
+    """
+    return poll_until(
+        lambda: WorkspaceActivity.from_dict(
+            client.get_workspace_activity(w_id=w_id, activity_id=activity_id, **kwargs).get_result()
+        ),
+        lambda activity: (activity.status or '').upper() in WORKSPACE_ACTIVITY_TERMINAL_STATUSES,
+        timeout=timeout,
+        backoff=Backoff(initial_interval=initial_interval, max_interval=max_interval, multiplier=multiplier),
+        description='activity {0} of workspace {1}'.format(activity_id, w_id),
+    )
+
+
+class JobWatcher:
+    """
+    Watch many jobs at once and resolve a future for each of them when it ends.
+
+    Jobs registered with a `resource`, `workspace_id` or `action_id` are grouped by
+    that filter and each group is refreshed with a single paged `list_jobs` call per
+    poll, so watching N jobs of the same workspace or action costs one request per
+    interval rather than N. Jobs without a filter, and jobs that do not show up in
+    the first `max_pages` pages of their group, are refreshed with `get_job`.
+
+    Drive the watcher either with `run_until_complete()`, or in the background with
+    `start()` and `stop()`:
+
+        watcher = JobWatcher(client, interval=10)
+        futures = [watcher.watch(job_id, workspace_id=w_id) for job_id in job_ids]
+        watcher.run_until_complete(timeout=3600)
+        for future in futures:
+            print(job_status_code(future.result()))
+
+    :param SchematicsV1 client: The service client.
+    :param float interval: (optional) The number of seconds between two polls.
+    :param int page_limit: (optional) The `limit` used for the `list_jobs` pages.
+    :param int max_pages: (optional) The maximum number of `list_jobs` pages read for
+           a group in one poll.
+    """
+
+    def __init__(
+        self,
+        client: SchematicsV1,
+        *,
+        interval: float = 10.0,
+        page_limit: int = 100,
+        max_pages: int = 5,
+    ) -> None:
+        if interval <= 0:
+            raise ValueError('interval must be positive')
+        self._client = client
+        self._interval = interval
+        self._page_limit = page_limit
+        self._max_pages = max_pages
+        self._lock = threading.Lock()
+        self._pending: Dict[Tuple, Dict[str, Future]] = {}
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def watch(
+        self,
+        job_id: str,
+        *,
+        resource: Optional[str] = None,
+        workspace_id: Optional[str] = None,
+        action_id: Optional[str] = None,
+    ) -> Future:
+        """
+        Start watching a job.
+
+        :param str job_id: The ID of the job.
+        :param str resource: (optional) Name of the resource the job runs against
+               (workspaces, actions, environment or controls).
+        :param str workspace_id: (optional) The ID of the workspace the job runs
+               against.
+        :param str action_id: (optional) The ID of the action the job runs against.
+        :return: A future whose result is the job, as a `JobLite`, once the job is
+                 in a terminal state. Use `add_done_callback` to be notified.
+        :rtype: concurrent.futures.Future
+        """
+        key = (resource, workspace_id, action_id)
+        with self._lock:
+            for group in self._pending.values():
+                if job_id in group:
+                    return group[job_id]
+            future = Future()
+            future.set_running_or_notify_cancel()
+            self._pending.setdefault(key, {})[job_id] = future
+        return future
+
+    def pending_count(self) -> int:
+        """Return the number of jobs that have not ended yet."""
+        with self._lock:
+            return sum(len(group) for group in self._pending.values())
+
+    def poll(self) -> int:
+        """
+        Refresh the status of every pending job once.
+
+        :return: The number of jobs still pending after this poll.
+        :rtype: int
+        """
+        with self._lock:
+            groups = {key: dict(group) for key, group in self._pending.items() if group}
+        for key, group in groups.items():
+            unseen = dict(group)
+            if key != (None, None, None):
+                try:
+                    self._poll_group(key, unseen)
+                except ApiException as err:
+                    logger.warning('Could not list the jobs of %s: %s', key, err)
+                    continue
+            for job_id in list(unseen):
+                self._poll_job(key, job_id)
+        return self.pending_count()
+
+    def run_until_complete(self, *, timeout: Optional[float] = None) -> None:
+        """
+        Poll until every watched job has ended.
+
+        :param float timeout: (optional) The number of seconds to wait before giving
+               up; None waits forever.
+        :raises TimeoutError: when some jobs are still running after `timeout`
+                seconds.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.poll():
+            delay = self._interval
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        'Timed out after {0} seconds with {1} jobs still running'.format(timeout, self.pending_count())
+                    )
+                delay = min(delay, remaining)
+            time.sleep(delay)
+
+    def start(self) -> None:
+        """Poll in a background thread until `stop()` is called."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='schematics-job-watcher', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread started by `start()`."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self.poll()
+            except Exception:  # pylint: disable=broad-except
+                logger.exception('Unexpected error while polling the watched jobs')
+            self._stop_event.wait(self._interval)
+
+    def _poll_group(self, key: Tuple, unseen: Dict[str, Future]) -> None:
+        resource, workspace_id, action_id = key
+        pager = JobsPager(
+            client=self._client,
+            limit=self._page_limit,
+            resource=resource,
+            workspace_id=workspace_id,
+            action_id=action_id,
+        )
+        pages = 0
+        while unseen and pager.has_next() and pages < self._max_pages:
+            pages += 1
+            for job in pager.get_next():
+                if unseen.pop(job.id, None) is not None:
+                    self._update(key, job.id, job)
+
+    def _poll_job(self, key: Tuple, job_id: str) -> None:
+        try:
+            result = self._client.get_job(job_id=job_id).get_result()
+        except ApiException as err:
+            if err.status_code == 404:
+                self._finish(key, job_id, exception=err)
+            else:
+                logger.warning('Could not get job %s: %s', job_id, err)
+            return
+        self._update(key, job_id, JobLite.from_dict(result))
+
+    def _update(self, key: Tuple, job_id: str, job: JobLite) -> None:
+        if job_status_code(job) in JOB_TERMINAL_STATUSES:
+            self._finish(key, job_id, result=job)
+
+    def _finish(self, key: Tuple, job_id: str, *, result: JobLite = None, exception: Exception = None) -> None:
+        with self._lock:
+            future = self._pending.get(key, {}).pop(job_id, None)
+        if future is None:
+            return
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
@@ -22,6 +22,7 @@ import pytest
 import time
 from ibm_cloud_sdk_core import *
 from ibm_schematics.schematics_v1 import *
+from ibm_schematics.waiters import wait_for_workspace_activity, wait_for_workspace_status
 from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
 
 # Config file name
@@ -129,20 +130,13 @@ class TestSchematicsV1:
         return workspace_response
 
     def waitForWorkspaceStatus(self, wid, status):
-        workspaceStatus = ""
-
-        while workspaceStatus != status:
-            workspaceStatus = self.getWorkspaceById(wid)['status']
-            print(workspaceStatus)
-            time.sleep(2)
+        workspace = wait_for_workspace_status(self.schematics_service, wid, [status], failure_statuses=())
+        print(workspace.status)
 
     def waitForWorkspaceActivityStatus(self, wid, activityid, status):
-        workspaceActivityStatus = ""
-
-        while workspaceActivityStatus != status:
-            workspaceActivityStatus = self.getWorkspaceActivityById(wid, activityid)['status']
-            print(workspaceActivityStatus)
-            time.sleep(2)
+        activity = wait_for_workspace_activity(self.schematics_service, wid, activityid)
+        print(activity.status)
+        assert activity.status == status
 
     def deleteWorkspaceById(self, wid):
 
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the asyncio clients
+"""
+
+import asyncio
+import io
+import json
+import pytest
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+httpx = pytest.importorskip('httpx')
+
+from ibm_schematics.aio import AsyncSchematicsV1, AsyncSchematics20ApiV2
+
+_base_url = 'https://schematics.cloud.ibm.com'
+
+
+def new_service(handler, service_class=AsyncSchematicsV1):
+    """
+    Returns an async service whose requests are answered by the specified handler.
+    """
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    service = service_class(authenticator=NoAuthAuthenticator(), http_client=http_client)
+    service.set_service_url(_base_url)
+    return service
+
+
+class TestAsyncSchematicsV1:
+    """
+    Test Class for AsyncSchematicsV1
+    """
+
+    def test_get_job(self):
+        """
+        get_job()
+        """
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={'id': 'job-1', 'name': 'name'})
+
+        async def run():
+            service = new_service(handler)
+            return await service.get_job(job_id='job-1', profile='summary', headers={'X-Test': 'yes'})
+
+        response = asyncio.run(run())
+        assert response.get_status_code() == 200
+        assert response.get_result() == {'id': 'job-1', 'name': 'name'}
+        assert len(requests) == 1
+        assert requests[0].method == 'GET'
+        assert requests[0].url.path == '/v2/jobs/job-1'
+        assert requests[0].url.params['profile'] == 'summary'
+        assert requests[0].headers['X-Test'] == 'yes'
+        assert requests[0].headers['Accept'] == 'application/json'
+        assert 'schematics-python-sdk' in requests[0].headers['User-Agent']
+
+    def test_concurrent_calls_share_the_client(self):
+        """
+        Concurrent operations are sent over the same http client.
+        """
+
+        def handler(request):
+            w_id = request.url.path.rsplit('/', 1)[1]
+            return httpx.Response(200, json={'id': w_id})
+
+        async def run():
+            service = new_service(handler)
+            responses = await asyncio.gather(*(service.get_workspace(w_id='w{}'.format(i)) for i in range(50)))
+            return service, [r.get_result()['id'] for r in responses]
+
+        service, ids = asyncio.run(run())
+        assert ids == ['w{}'.format(i) for i in range(50)]
+        assert service.get_async_http_client() is service.get_async_http_client()
+
+    def test_create_workspace_sends_json_body(self):
+        """
+        create_workspace()
+        """
+        bodies = []
+
+        def handler(request):
+            bodies.append(json.loads(request.content))
+            return httpx.Response(201, json={'id': 'w1'})
+
+        async def run():
+            return await new_service(handler).create_workspace(name='myworkspace', tags=['a'])
+
+        response = asyncio.run(run())
+        assert response.get_status_code() == 201
+        assert bodies == [{'name': 'myworkspace', 'tags': ['a']}]
+
+    def test_template_repo_upload_sends_multipart_body(self):
+        """
+        template_repo_upload()
+        """
+        bodies = []
+
+        def handler(request):
+            bodies.append((request.headers['Content-Type'], request.read()))
+            return httpx.Response(200, json={'file_value': 'file_value'})
+
+        async def run():
+            return await new_service(handler).template_repo_upload(
+                w_id='w1', t_id='t1', file=io.BytesIO(b'tar contents'), file_content_type='application/x-tar'
+            )
+
+        response = asyncio.run(run())
+        assert response.get_result() == {'file_value': 'file_value'}
+        content_type, body = bodies[0]
+        assert content_type.startswith('multipart/form-data')
+        assert b'tar contents' in body
+
+    def test_error_response_raises_api_exception(self):
+        """
+        An error status raises an ApiException carrying the service message.
+        """
+
+        def handler(_request):
+            return httpx.Response(404, json={'message': 'workspace not found'})
+
+        async def run():
+            await new_service(handler).get_workspace(w_id='missing')
+
+        with pytest.raises(ApiException) as err:
+            asyncio.run(run())
+        assert err.value.status_code == 404
+        assert err.value.message == 'workspace not found'
+
+    def test_enable_retries_retries_rate_limited_requests(self):
+        """
+        429 responses are retried when retries are enabled.
+        """
+        statuses = [429, 503, 200]
+
+        def handler(_request):
+            status = statuses.pop(0)
+            if status == 200:
+                return httpx.Response(200, json={'version_info': {}})
+            return httpx.Response(status, headers={'Retry-After': '0'}, json={'message': 'slow down'})
+
+        async def run():
+            service = new_service(handler)
+            service.enable_retries(max_retries=3, retry_interval=0.01)
+            return await service.get_schematics_version()
+
+        response = asyncio.run(run())
+        assert response.get_status_code() == 200
+        assert not statuses
+
+    def test_aclose_keeps_a_shared_client_open(self):
+        """
+        aclose() only closes a client created by the service itself.
+        """
+
+        async def run():
+            shared = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(204)))
+            async with AsyncSchematicsV1(authenticator=NoAuthAuthenticator(), http_client=shared):
+                pass
+            owned = AsyncSchematicsV1(authenticator=NoAuthAuthenticator())
+            owned_client = owned.get_async_http_client()
+            await owned.aclose()
+            closed = shared.is_closed, owned_client.is_closed
+            await shared.aclose()
+            return closed
+
+        assert asyncio.run(run()) == (False, True)
+
+
+class TestAsyncSchematics20ApiV2:
+    """
+    Test Class for AsyncSchematics20ApiV2
+    """
+
+    def test_get_schematics_info(self):
+        """
+        get_schematics_info()
+        """
+
+        def handler(request):
+            assert request.url.path == '/v2/info'
+            return httpx.Response(200, json={'schematics_version': '2.0'})
+
+        async def run():
+            return await new_service(handler, AsyncSchematics20ApiV2).get_schematics_info()
+
+        response = asyncio.run(run())
+        assert response.get_result() == {'schematics_version': '2.0'}
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the bulk module
+"""
+
+import re
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import pytest
+import responses
+from ibm_schematics import ratelimit
+from ibm_schematics.bulk import BulkExecutor, BulkReport, BulkResult, workspace_region
+from ibm_schematics.schematics_v1 import SchematicsV1
+
+_service = SchematicsV1(authenticator=NoAuthAuthenticator())
+
+_base_url = 'https://schematics.cloud.ibm.com'
+_service.set_service_url(_base_url)
+
+_workspace_ids = ['us-south.workspace.a.1', 'us-south.workspace.b.2', 'eu-de.workspace.c.3']
+
+
+@pytest.fixture(name='sleeps')
+def fixture_sleeps(monkeypatch):
+    """
+    Replaces time.sleep in the ratelimit module and records the requested delays.
+    """
+    delays = []
+    monkeypatch.setattr(ratelimit.time, 'sleep', delays.append)
+    monkeypatch.setattr(ratelimit.time, 'monotonic', lambda: 1000.0)
+    return delays
+
+
+_methods = {'apply': responses.PUT, 'plan': responses.POST, 'refresh': responses.PUT}
+
+
+def mock_command(command, failing=()):
+    """
+    Registers responses for a workspace command that return an activity ID named after the workspace,
+    or a conflict for the workspaces in `failing`.
+    """
+
+    def callback(request):
+        w_id = request.url.split('/')[-2]
+        if w_id in failing:
+            return (409, {'Content-Type': 'application/json'}, '{"errors": []}')
+        return (200, {'Content-Type': 'application/json'}, '{{"activityid": "act-{0}"}}'.format(w_id))
+
+    responses.add_callback(
+        _methods[command], re.compile(_base_url + '/v1/workspaces/[^/]+/' + command), callback=callback
+    )
+
+
+def test_workspace_region():
+    """
+    The region is the first part of the workspace ID.
+    """
+    assert workspace_region('us-south.workspace.a.1') == 'us-south'
+    assert workspace_region('workspace') == ''
+
+
+class TestBulkExecutor:
+    """
+    Test Class for BulkExecutor
+    """
+
+    @responses.activate
+    def test_run_collects_activity_ids(self):
+        """
+        Every workspace gets the command once, with its refresh token, and the report has the activity IDs.
+        """
+        mock_command('apply')
+        executor = BulkExecutor(_service, max_workers=2)
+
+        report = executor.run('apply', _workspace_ids + _workspace_ids[:1], lambda w_id: 'token-' + w_id)
+
+        assert len(responses.calls) == 3
+        for call in responses.calls:
+            assert call.request.headers['refresh_token'] == 'token-' + call.request.url.split('/')[-2]
+        assert [result.w_id for result in report.results] == _workspace_ids
+        assert report.activity_ids == {w_id: 'act-' + w_id for w_id in _workspace_ids}
+        assert not report.failed
+        assert str(report) == 'apply: 3 started, 0 failed'
+        assert sorted(report.by_region()) == ['eu-de', 'us-south']
+
+    @responses.activate
+    def test_failures_are_reported(self):
+        """
+        A failed command is recorded in the report and does not stop the others.
+        """
+        mock_command('refresh', failing=['us-south.workspace.a.1'])
+
+        report = BulkExecutor(_service).run('refresh', _workspace_ids, 'token', delegated_token='delegated')
+
+        assert [result.w_id for result in report.failed] == ['us-south.workspace.a.1']
+        assert isinstance(report.failed[0].error, ApiException)
+        assert len(report.succeeded) == 2
+        assert all(call.request.headers['delegated_token'] == 'delegated' for call in responses.calls)
+
+    @responses.activate
+    def test_rate_limits_per_region(self, sleeps):
+        """
+        The commands of each region are paced by the rate of that region.
+        """
+        mock_command('plan')
+        executor = BulkExecutor(_service, max_workers=1, rate_limits={'us-south': 0.5}, default_rate=4)
+
+        executor.run('plan', _workspace_ids, 'token')
+
+        assert sleeps == [2.0]
+
+    @responses.activate
+    def test_unlimited_regions_do_not_wait(self, sleeps):
+        """
+        Without rate limits, commands are sent right away.
+        """
+        mock_command('plan')
+        BulkExecutor(_service, rate_limits={'eu-de': 1}).run('plan', _workspace_ids * 2, 'token')
+        assert not sleeps
+
+    def test_empty_run(self):
+        """
+        A run without workspaces returns an empty report.
+        """
+        report = BulkExecutor(_service).run('apply', [], 'token')
+        assert report.results == [] and report.activity_ids == {}
+
+    def test_invalid_parameters(self):
+        """
+        Invalid pool sizes, rates and commands are rejected.
+        """
+        with pytest.raises(ValueError):
+            BulkExecutor(_service, max_workers=0)
+        with pytest.raises(ValueError):
+            BulkExecutor(_service, default_rate=0)
+        with pytest.raises(ValueError):
+            BulkExecutor(_service).run('destroy', _workspace_ids, 'token')
+
+
+def test_result_and_report():
+    """
+    Results without errors are successes.
+    """
+    report = BulkReport('plan', [BulkResult('w', ''), BulkResult('x', '', error=ValueError())])
+    assert [result.w_id for result in report.succeeded] == ['w']
+    assert report.activity_ids == {'w': None}
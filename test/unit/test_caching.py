@@ -0,0 +1,538 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the caching module
+"""
+
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators import BearerTokenAuthenticator
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+import pytest
+import responses
+from ibm_schematics import caching
+from ibm_schematics.caching import ConditionalCache, ResponseCache, SingleFlight
+from ibm_schematics.schematics_v1 import SchematicsV1
+
+_base_url = 'https://schematics.cloud.ibm.com'
+
+
+@pytest.fixture(name='service')
+def fixture_service():
+    """
+    Returns a new service instance, so that caches attached in one test do not leak into others.
+    """
+    service = SchematicsV1(authenticator=NoAuthAuthenticator())
+    service.set_service_url(_base_url)
+    return service
+
+
+@pytest.fixture(name='clock')
+def fixture_clock(monkeypatch):
+    """
+    Replaces time.monotonic in the caching module with a clock the test moves forward.
+    """
+    now = [1000.0]
+    monkeypatch.setattr(caching.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def two_clients():
+    """
+    Returns service instances of two regions and accounts.
+    """
+    us = SchematicsV1(authenticator=BearerTokenAuthenticator('token-a'))
+    us.set_service_url('https://us.schematics.cloud.ibm.com')
+    eu = SchematicsV1(authenticator=BearerTokenAuthenticator('token-b'))
+    eu.set_service_url('https://eu-de.schematics.cloud.ibm.com')
+    return us, eu
+
+
+def mock_locations(body=None, status=200):
+    """
+    Registers a response for list_locations.
+    """
+    responses.add(responses.GET, _base_url + '/v2/locations', json=body or {'locations': []}, status=status)
+
+
+class TestResponseCache:
+    """
+    Test Class for ResponseCache
+    """
+
+    @responses.activate
+    def test_repeated_calls_are_answered_from_the_cache(self, service):
+        """
+        Only the first call is sent; later calls return equal results with the same status and headers.
+        """
+        mock_locations({'locations': [{'region': 'us-south'}]})
+        cache = ResponseCache()
+        cache.attach(service)
+
+        first = service.list_locations()
+        second = service.list_locations()
+
+        assert len(responses.calls) == 1
+        assert second.get_result() == first.get_result() == {'locations': [{'region': 'us-south'}]}
+        assert second.get_status_code() == 200
+        assert second.get_headers()['Content-Type'] == 'application/json'
+        assert cache.info() == caching.CacheInfo(hits=1, misses=1, size=1, maxsize=caching.DEFAULT_MAXSIZE)
+
+    @responses.activate
+    def test_results_are_copies(self, service):
+        """
+        Changing a returned result does not change the cached one.
+        """
+        mock_locations({'locations': [{'region': 'us-south'}]})
+        ResponseCache().attach(service)
+
+        service.list_locations().get_result()['locations'].clear()
+
+        assert service.list_locations().get_result() == {'locations': [{'region': 'us-south'}]}
+
+    @responses.activate
+    def test_entries_expire(self, service, clock):
+        """
+        A call after the time to live of its operation is sent again.
+        """
+        mock_locations()
+        ResponseCache(ttls={'list_locations': 60}).attach(service)
+
+        service.list_locations()
+        clock[0] += 59
+        service.list_locations()
+        assert len(responses.calls) == 1
+        clock[0] += 1
+        service.list_locations()
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_entries_are_keyed_on_parameters(self, service):
+        """
+        Calls with different parameters, positional or not, have their own entries.
+        """
+        responses.add(responses.GET, _base_url + '/v2/settings/kms', json={'location': 'US'})
+        cache = ResponseCache()
+        cache.attach(service)
+
+        service.get_kms_settings('US')
+        service.get_kms_settings(location='US')
+        service.get_kms_settings(location='EU')
+        service.get_kms_settings(location='US', headers={'X-Test': '1'})
+
+        assert len(responses.calls) == 3
+        assert [call.request.params['location'] for call in responses.calls] == ['US', 'EU', 'US']
+        assert cache.info().size == 3
+
+    @responses.activate
+    def test_clients_do_not_share_entries(self):
+        """
+        Service instances of other regions or accounts sharing a cache get their own results.
+        """
+        us, eu = two_clients()
+        responses.add(responses.GET, 'https://us.schematics.cloud.ibm.com/v1/resource_groups', json=[{'name': 'us'}])
+        responses.add(responses.GET, 'https://eu-de.schematics.cloud.ibm.com/v1/resource_groups', json=[{'name': 'eu'}])
+        cache = ResponseCache()
+        cache.attach(us)
+        cache.attach(eu)
+
+        assert us.list_resource_group().get_result() == [{'name': 'us'}]
+        assert eu.list_resource_group().get_result() == [{'name': 'eu'}]
+        assert us.list_resource_group().get_result() == [{'name': 'us'}]
+        assert len(responses.calls) == 2
+        assert [call.request.headers['Authorization'] for call in responses.calls] == [
+            'Bearer token-a',
+            'Bearer token-b',
+        ]
+
+        eu.set_service_url('https://us.schematics.cloud.ibm.com')
+        eu.list_resource_group()
+        assert len(responses.calls) == 3
+        assert cache.info().size == 3
+
+    @responses.activate
+    def test_least_recently_used_entries_are_evicted(self, service):
+        """
+        The entry used least recently is dropped when the cache is full.
+        """
+        responses.add(responses.GET, _base_url + '/v2/settings/kms', json={})
+        cache = ResponseCache(maxsize=2)
+        cache.attach(service)
+
+        service.get_kms_settings(location='US')
+        service.get_kms_settings(location='EU')
+        service.get_kms_settings(location='US')
+        service.get_kms_settings(location='JP')
+        assert len(responses.calls) == 3
+
+        service.get_kms_settings(location='US')
+        assert len(responses.calls) == 3
+        service.get_kms_settings(location='EU')
+        assert len(responses.calls) == 4
+
+    @responses.activate
+    def test_invalidate(self, service):
+        """
+        Entries can be removed per call, per operation or all at once.
+        """
+        responses.add(responses.GET, _base_url + '/v2/settings/kms', json={})
+        responses.add(responses.GET, _base_url + '/v1/version', json={'commitsha': 'abc'})
+        cache = ResponseCache()
+        cache.attach(service)
+        for location in ['US', 'EU']:
+            service.get_kms_settings(location=location)
+        service.get_schematics_version()
+
+        assert cache.invalidate('get_kms_settings', location='US') == 1
+        assert cache.invalidate('get_kms_settings', location='US') == 0
+        assert cache.invalidate('get_kms_settings') == 1
+        assert cache.info().size == 1
+        assert cache.invalidate() == 1
+
+        service.get_schematics_version()
+        assert len(responses.calls) == 4
+
+    @responses.activate
+    def test_errors_are_not_cached(self, service):
+        """
+        A failed call raises as usual and the next call is sent again.
+        """
+        mock_locations({'errors': []}, status=500)
+        mock_locations()
+        ResponseCache().attach(service)
+
+        with pytest.raises(ApiException):
+            service.list_locations()
+        service.list_locations()
+        service.list_locations()
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_only_configured_operations_are_cached(self, service):
+        """
+        Operations without a time to live are not changed.
+        """
+        mock_locations()
+        responses.add(responses.GET, _base_url + '/v1/version', json={})
+        ResponseCache(ttls={'get_schematics_version': 10}).attach(service)
+
+        service.list_locations()
+        service.list_locations()
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_detach_and_clear(self, service):
+        """
+        detach restores the operations of the service, and clear empties the cache.
+        """
+        mock_locations()
+        cache = ResponseCache()
+        cache.attach(service)
+        service.list_locations()
+        cache.detach(service)
+        service.list_locations()
+        assert len(responses.calls) == 2
+        assert 'list_locations' not in vars(service)
+
+        cache.clear()
+        assert cache.info() == caching.CacheInfo(hits=0, misses=0, size=0, maxsize=caching.DEFAULT_MAXSIZE)
+
+    def test_invalid_parameters(self, service):
+        """
+        Invalid sizes, times to live and operation names are rejected.
+        """
+        with pytest.raises(ValueError):
+            ResponseCache(maxsize=0)
+        with pytest.raises(ValueError):
+            ResponseCache(ttls={'list_locations': 0})
+        with pytest.raises(ValueError):
+            ResponseCache(ttls={'no_such_operation': 10}).attach(service)
+
+    @pytest.mark.parametrize('wrapper', [ResponseCache, ConditionalCache, SingleFlight])
+    def test_asyncio_clients_are_rejected(self, wrapper):
+        """
+        Caches cannot be attached to asyncio service instances, whose operations return coroutines.
+        """
+        pytest.importorskip('httpx')
+        from ibm_schematics.aio import AsyncSchematicsV1  # pylint: disable=import-outside-toplevel
+
+        client = AsyncSchematicsV1(authenticator=NoAuthAuthenticator())
+        with pytest.raises(ValueError, match='synchronous'):
+            wrapper().attach(client)
+        assert 'get_workspace' not in vars(client)
+
+
+def mock_workspace(status=200, body=None, headers=None):
+    """
+    Registers a response for get_workspace.
+    """
+    responses.add(
+        responses.GET,
+        _base_url + '/v1/workspaces/ws-1',
+        json=body if status == 200 else None,
+        status=status,
+        headers=headers or {},
+    )
+
+
+class TestConditionalCache:
+    """
+    Test Class for ConditionalCache
+    """
+
+    @responses.activate
+    def test_unchanged_resources_are_not_downloaded_again(self, service):
+        """
+        The second call sends the validators of the first response and a 304 returns the stored result.
+        """
+        mock_workspace(body={'id': 'ws-1'}, headers={'ETag': '"v1"', 'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'})
+        mock_workspace(status=304, headers={'ETag': '"v1"'})
+        cache = ConditionalCache()
+        cache.attach(service)
+
+        first = service.get_workspace('ws-1')
+        second = service.get_workspace(w_id='ws-1')
+
+        assert 'If-None-Match' not in responses.calls[0].request.headers
+        assert responses.calls[1].request.headers['If-None-Match'] == '"v1"'
+        assert responses.calls[1].request.headers['If-Modified-Since'] == 'Mon, 01 Jan 2024 00:00:00 GMT'
+        assert second.get_result() == first.get_result() == {'id': 'ws-1'}
+        assert second.get_status_code() == 200
+        assert second.get_headers()['etag'] == '"v1"'
+        assert cache.info().hits == 1
+        assert cache.info().misses == 1
+
+    @responses.activate
+    def test_changed_resources_replace_the_entry(self, service):
+        """
+        A full response replaces the stored result and validators.
+        """
+        mock_workspace(body={'id': 'ws-1', 'name': 'a'}, headers={'ETag': '"v1"'})
+        mock_workspace(body={'id': 'ws-1', 'name': 'b'}, headers={'ETag': '"v2"'})
+        mock_workspace(status=304)
+        ConditionalCache().attach(service)
+
+        service.get_workspace('ws-1')
+        assert service.get_workspace('ws-1').get_result()['name'] == 'b'
+        assert service.get_workspace('ws-1').get_result()['name'] == 'b'
+        assert responses.calls[2].request.headers['If-None-Match'] == '"v2"'
+
+    @responses.activate
+    def test_custom_headers_are_kept(self, service):
+        """
+        Headers passed by the caller are sent along with the validators, and take precedence.
+        """
+        mock_workspace(body={'id': 'ws-1'}, headers={'ETag': '"v1"'})
+        mock_workspace(status=304)
+        ConditionalCache().attach(service)
+
+        service.get_workspace('ws-1', headers={'X-Test': '1'})
+        service.get_workspace('ws-1', headers={'X-Test': '1'})
+
+        assert responses.calls[1].request.headers['X-Test'] == '1'
+        assert responses.calls[1].request.headers['If-None-Match'] == '"v1"'
+
+    @responses.activate
+    def test_responses_without_validators_are_not_stored(self, service):
+        """
+        Nothing is stored, and no validators are sent, when the service returns neither header.
+        """
+        mock_workspace(body={'id': 'ws-1'})
+        cache = ConditionalCache()
+        cache.attach(service)
+
+        service.get_workspace('ws-1')
+        service.get_workspace('ws-1')
+
+        assert 'If-None-Match' not in responses.calls[1].request.headers
+        assert cache.info().size == 0
+
+    @responses.activate
+    def test_deleted_resources_are_forgotten(self, service):
+        """
+        A 404 is raised and removes the stored result.
+        """
+        mock_workspace(body={'id': 'ws-1'}, headers={'ETag': '"v1"'})
+        mock_workspace(status=404)
+        cache = ConditionalCache()
+        cache.attach(service)
+
+        service.get_workspace('ws-1')
+        with pytest.raises(ApiException):
+            service.get_workspace('ws-1')
+        assert cache.info().size == 0
+
+    @responses.activate
+    def test_not_modified_without_an_entry_is_raised(self, service):
+        """
+        A 304 to a call the cache did not make conditional is raised as usual.
+        """
+        mock_workspace(status=304)
+        ConditionalCache().attach(service)
+
+        with pytest.raises(ApiException) as exc_info:
+            service.get_workspace('ws-1', headers={'If-None-Match': '"v0"'})
+        assert exc_info.value.status_code == 304
+
+    def test_default_operations(self, service):
+        """
+        All the default operations exist on the service.
+        """
+        ConditionalCache().attach(service)
+        for operation in caching.DEFAULT_CONDITIONAL_OPERATIONS:
+            assert vars(service)[operation].__wrapped_by__ is not None
+
+    @responses.activate
+    def test_clients_do_not_share_entries(self):
+        """
+        A service instance is not sent the stored result of another instance sharing the cache.
+        """
+        us, eu = two_clients()
+
+        def callback(request):
+            if 'If-None-Match' in request.headers:
+                return (304, {'ETag': '"v1"'}, '')
+            owner = request.headers['Authorization'][-1]
+            return (200, {'Content-Type': 'application/json', 'ETag': '"v1"'}, '{{"owner": "{0}"}}'.format(owner))
+
+        for client in (us, eu):
+            responses.add_callback(responses.GET, client.service_url + '/v1/workspaces/ws-1', callback=callback)
+        cache = ConditionalCache()
+        cache.attach(us)
+        cache.attach(eu)
+
+        assert us.get_workspace('ws-1').get_result() == {'owner': 'a'}
+        assert eu.get_workspace('ws-1').get_result() == {'owner': 'b'}
+        assert 'If-None-Match' not in responses.calls[1].request.headers
+        assert us.get_workspace('ws-1').get_result() == {'owner': 'a'}
+        assert eu.get_workspace('ws-1').get_result() == {'owner': 'b'}
+        assert [call.response.status_code for call in responses.calls] == [200, 200, 304, 304]
+
+
+def wait_for(condition, timeout=5.0):
+    """
+    Waits until the condition is true, and fails the test when it does not become true in time.
+    """
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, 'timed out'
+        time.sleep(0.001)
+
+
+class TestSingleFlight:
+    """
+    Test Class for SingleFlight
+    """
+
+    @responses.activate
+    def test_concurrent_calls_share_one_request(self, service):
+        """
+        Callers that arrive while a call is in progress get its response without sending a request.
+        """
+        single_flight = SingleFlight()
+        single_flight.attach(service)
+
+        def callback(request):  # pylint: disable=unused-argument
+            wait_for(lambda: single_flight.shared == 7)
+            return (200, {'Content-Type': 'application/json'}, '{"id": "job-1"}')
+
+        responses.add_callback(responses.GET, _base_url + '/v2/jobs/job-1', callback=callback)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: service.get_job(job_id='job-1').get_result(), range(8)))
+
+        assert len(responses.calls) == 1
+        assert results == [{'id': 'job-1'}] * 8
+        assert all(result is results[0] for result in results)
+
+    @responses.activate
+    def test_errors_are_shared(self, service):
+        """
+        Every waiting caller raises the error of the call in progress.
+        """
+        single_flight = SingleFlight()
+        single_flight.attach(service)
+
+        def callback(request):  # pylint: disable=unused-argument
+            wait_for(lambda: single_flight.shared == 2)
+            return (404, {'Content-Type': 'application/json'}, '{"errors": []}')
+
+        responses.add_callback(responses.GET, _base_url + '/v1/workspaces/ws-1', callback=callback)
+
+        def call(_):
+            with pytest.raises(ApiException) as exc_info:
+                service.get_workspace('ws-1')
+            return exc_info.value
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            errors = list(executor.map(call, range(3)))
+
+        assert len(responses.calls) == 1
+        assert all(error is errors[0] for error in errors)
+
+    @responses.activate
+    def test_clients_are_not_coalesced(self):
+        """
+        Identical concurrent calls of service instances of other regions or accounts send their own requests.
+        """
+        us, eu = two_clients()
+        started = threading.Barrier(2)
+
+        def callback(request):
+            started.wait(timeout=5)
+            owner = request.headers['Authorization'][-1]
+            return (200, {'Content-Type': 'application/json'}, '{{"owner": "{0}"}}'.format(owner))
+
+        for client in (us, eu):
+            responses.add_callback(responses.GET, client.service_url + '/v2/jobs/job-1', callback=callback)
+        single_flight = SingleFlight()
+        single_flight.attach(us)
+        single_flight.attach(eu)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(lambda client: client.get_job(job_id='job-1').get_result(), [us, eu]))
+
+        assert results == [{'owner': 'a'}, {'owner': 'b'}]
+        assert len(responses.calls) == 2
+        assert single_flight.shared == 0
+
+    @responses.activate
+    def test_different_calls_are_not_coalesced(self, service):
+        """
+        Calls with other parameters, and calls made after the previous one completed, send their own requests.
+        """
+        started = threading.Barrier(2)
+
+        def callback(request):
+            started.wait(timeout=5)
+            return (200, {'Content-Type': 'application/json'}, '{{"id": "{0}"}}'.format(request.url[-5:]))
+
+        responses.add_callback(responses.GET, _base_url + '/v2/jobs/job-1', callback=callback)
+        responses.add_callback(responses.GET, _base_url + '/v2/jobs/job-2', callback=callback)
+        single_flight = SingleFlight()
+        single_flight.attach(service)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(lambda job_id: service.get_job(job_id=job_id).get_result(), ['job-1', 'job-2']))
+
+        assert results == [{'id': 'job-1'}, {'id': 'job-2'}]
+        started.reset()
+        threading.Thread(target=started.wait, kwargs={'timeout': 5}).start()
+        service.get_job(job_id='job-1')
+        assert len(responses.calls) == 3
+        assert single_flight.shared == 0
@@ -19,7 +19,25 @@ Test methods in the common module
 """
 
 import unittest
+from ibm_cloud_sdk_core import utils
 from ibm_schematics import common
+from ibm_schematics.schematics_v1 import Job
+
+TIMESTAMPS = [
+    '2024-03-05T14:21:07.123Z',
+    '2024-03-05T14:21:07Z',
+    '2024-03-05T14:21:07.1234567Z',
+    '2024-03-05T14:21:07.123z',
+    '2024-03-05T14:21:07,5Z',
+    '2024-03-05T14:21:07+02:00',
+    '2024-03-05T14:21:07.123456-0530',
+    '2024-03-05 14:21:07',
+    ' 2024-03-05T14:21:07Z ',
+    '20240305T142107Z',
+    '2024-03-05T14:21',
+    '2024-03-05',
+    'March 5, 2024 2:21 PM',
+]
 
 
 class TestCommon(unittest.TestCase):
@@ -46,3 +64,33 @@ class TestCommon(unittest.TestCase):
         self.assertIn('arch=', system_info)
         self.assertIn('os=', system_info)
         self.assertIn('python.version=', system_info)
+
+    def test_string_to_datetime(self):
+        """
+        Test that the string_to_datetime method returns what the SDK core does
+        """
+        for timestamp in TIMESTAMPS:
+            value, expected = common.string_to_datetime(timestamp), utils.string_to_datetime(timestamp)
+            self.assertEqual(value, expected, timestamp)
+            self.assertEqual(value.utcoffset(), expected.utcoffset(), timestamp)
+            self.assertEqual(utils.datetime_to_string(value), utils.datetime_to_string(expected), timestamp)
+
+    def test_string_to_datetime_errors(self):
+        """
+        Test that the string_to_datetime method rejects what the SDK core does
+        """
+        for timestamp in ('2024-W10-2', '2024-03-05T24:00:00Z', 'not a timestamp', ''):
+            with self.assertRaises(ValueError):
+                utils.string_to_datetime(timestamp)
+            with self.assertRaises(ValueError):
+                common.string_to_datetime(timestamp)
+
+    def test_string_to_datetime_cache(self):
+        """
+        Test that the string_to_datetime method remembers the timestamps it parsed
+        """
+        common.string_to_datetime.cache_clear()
+        jobs = [Job.from_dict({'submitted_at': '2024-03-05T14:21:07.123Z'}) for _ in range(3)]
+        self.assertIs(jobs[0].submitted_at, jobs[2].submitted_at)
+        info = common.string_to_datetime.cache_info()
+        self.assertEqual((info.hits, info.misses, info.maxsize), (2, 1, common.TIMESTAMP_CACHE_SIZE))
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the compact module
+"""
+
+import inspect
+import pickle
+import pytest
+from ibm_schematics import schematics_2_0_api_v2, schematics_v1, schematics_v1_models
+from ibm_schematics.compact import compact_class, compact_from_dict, is_compact
+from ibm_schematics.schematics_v1 import InventoryResourceRecord, JobList, WorkspaceResponse
+
+workspace_json = {
+    'id': 'us-south.workspace.vpc.1a2b3c4d',
+    'name': 'vpc',
+    'created_at': '2024-03-05T14:21:07.123Z',
+    'status': 'ACTIVE',
+    'tags': ['env:dev'],
+    'template_data': [{'folder': '.', 'id': 'vpc-template', 'type': 'terraform_v1.5'}],
+    'template_repo': {'branch': 'main', 'url': 'https://github.com/IBM-Cloud/terraform-provider-ibm'},
+    'workspace_status': {'frozen': False, 'locked': True, 'locked_time': '2024-03-05T14:22:00Z'},
+    'settings': [{'name': 'region', 'value': 'us-south', 'metadata': {'type': 'string', 'secure': False}}],
+}
+
+inventory_json = {
+    'name': 'web-servers',
+    'id': 'us-south.INVENTORY.web-servers.5e6f7a8b',
+    'created_at': '2024-03-05T14:21:07Z',
+    'inventories_ini': '[web]\n10.240.0.4\n',
+    'resource_queries': ['us-south.RESOURCEQUERY.web.9c8d7e6f'],
+}
+
+
+class TestCompactClass:
+    """
+    Test the compact model variants.
+    """
+
+    def test_same_properties_as_the_model(self):
+        workspace = compact_from_dict(WorkspaceResponse, workspace_json)
+        regular = WorkspaceResponse.from_dict(workspace_json)
+        assert is_compact(workspace)
+        assert not is_compact(regular)
+        assert not hasattr(workspace, '__dict__')
+        for name in vars(regular):
+            if name not in ('template_data', 'template_repo', 'workspace_status', 'settings'):
+                assert getattr(workspace, name) == getattr(regular, name)
+        assert is_compact(workspace.template_repo)
+        assert workspace.template_repo.branch == 'main'
+        assert is_compact(workspace.settings[0].metadata)
+        assert workspace.workspace_status.locked_time == regular.workspace_status.locked_time
+
+    def test_to_dict_and_str(self):
+        workspace = compact_from_dict(WorkspaceResponse, workspace_json)
+        regular = WorkspaceResponse.from_dict(workspace_json)
+        assert workspace.to_dict() == regular.to_dict()
+        assert str(workspace) == str(regular)
+        assert compact_class(WorkspaceResponse).from_dict(workspace.to_dict()) == workspace
+
+    def test_constructor_and_enums(self):
+        cls = compact_class(InventoryResourceRecord)
+        assert cls is compact_class(InventoryResourceRecord)
+        assert cls.__name__ == 'InventoryResourceRecord'
+        inventory = cls(name='web-servers', id='inv-1')
+        assert inventory.to_dict() == {'name': 'web-servers', 'id': 'inv-1'}
+        assert inventory != cls(name='web-servers', id='inv-2')
+        assert compact_class(WorkspaceResponse).__init__.__doc__ == WorkspaceResponse.__init__.__doc__
+        job_list = compact_class(JobList)(100, 0)
+        assert (job_list.limit, job_list.offset) == (100, 0)
+        assert compact_class(schematics_v1.Job).LocationEnum is schematics_v1.Job.LocationEnum
+
+    def test_required_properties(self):
+        with pytest.raises(ValueError, match='Required property \'limit\' not present in JobList JSON'):
+            compact_from_dict(JobList, {'offset': 0})
+
+    def test_additional_properties_of_v2_models(self):
+        action_list_json = {'limit': 10, 'offset': 0, 'actions': [{'name': 'a1', 'extra': 1}], 'extra': 'value'}
+        action_list = compact_from_dict(schematics_2_0_api_v2.ActionList, action_list_json)
+        assert action_list.extra == 'value'
+        assert action_list.actions[0].extra == 1
+        assert action_list.to_dict() == schematics_2_0_api_v2.ActionList.from_dict(action_list_json).to_dict()
+        action_list.more = 'set later'
+        assert action_list.to_dict()['more'] == 'set later'
+        with pytest.raises(AttributeError):
+            action_list.missing  # pylint: disable=pointless-statement
+        assert compact_class(schematics_2_0_api_v2.ActionList)(10, 0, extra='value').extra == 'value'
+
+    def test_pickle(self):
+        inventory = compact_from_dict(InventoryResourceRecord, inventory_json)
+        assert pickle.loads(pickle.dumps(inventory)) == inventory
+
+    @pytest.mark.parametrize('module', [schematics_v1_models, schematics_2_0_api_v2])
+    def test_every_model_has_a_compact_class(self, module):
+        for cls in vars(module).values():
+            if isinstance(cls, type) and cls.__module__ == module.__name__ and hasattr(cls, 'from_dict'):
+                parameters = inspect.signature(cls.__init__).parameters
+                compact_parameters = inspect.signature(compact_class(cls).__init__).parameters
+                assert set(compact_parameters) == set(parameters)
+                positional = [name for name, p in parameters.items() if p.kind == p.POSITIONAL_OR_KEYWORD]
+                assert [
+                    name for name, p in compact_parameters.items() if p.kind == p.POSITIONAL_OR_KEYWORD
+                ] == positional
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the downloads module
+"""
+
+import base64
+import gzip
+import io
+import json
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import pytest
+import responses
+from ibm_schematics.downloads import download_job_file
+from ibm_schematics.schematics_v1 import SchematicsV1
+
+_service = SchematicsV1(authenticator=NoAuthAuthenticator())
+
+_base_url = 'https://schematics.cloud.ibm.com'
+_service.set_service_url(_base_url)
+
+_files_url = _base_url + '/v2/jobs/job-1/files'
+
+_STATE = '{\n  "version": 4,\n  "resources": ["café", "\U0001f680", "tab\\there", "quote \\"q\\""]\n}\n'
+
+
+def job_file_data(file_content, ensure_ascii=True):
+    """
+    Returns the JSON body of a JobFileData, with other properties around the file content.
+    """
+    return json.dumps(
+        {
+            'job_id': 'job-1',
+            'summary': [{'name': 'file_content', 'value': '{"file_content": "decoy"}'}],
+            'additional_files': [{'file_name': 'child', 'file_content': 'decoy'}],
+            'file_type': 'state_file',
+            'file_content': file_content,
+            'updated_at': '2024-01-01T00:00:00Z',
+        },
+        ensure_ascii=ensure_ascii,
+    )
+
+
+def mock_files(body, status=200):
+    """
+    Registers a response for get_job_files.
+    """
+    responses.add(responses.GET, _files_url, body=body, status=status, content_type='application/json')
+
+
+class TestDownloadJobFile:
+    """
+    Test Class for download_job_file
+    """
+
+    @pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 4096])
+    @pytest.mark.parametrize('ensure_ascii', [True, False])
+    @responses.activate
+    def test_download_to_a_file(self, tmp_path, chunk_size, ensure_ascii):
+        """
+        The file content is decoded across any chunk boundary and written as UTF-8.
+        """
+        mock_files(job_file_data(_STATE, ensure_ascii))
+        dest = tmp_path / 'terraform.tfstate'
+
+        written = download_job_file(_service, 'job-1', 'state_file', str(dest), chunk_size=chunk_size)
+
+        assert dest.read_bytes() == _STATE.encode('utf-8')
+        assert written == len(_STATE.encode('utf-8'))
+        assert responses.calls[0].request.params == {'file_type': 'state_file'}
+
+    @responses.activate
+    def test_download_to_a_buffer(self):
+        """
+        A writable buffer receives the content; an empty file writes nothing.
+        """
+        mock_files(job_file_data(''))
+        buffer = io.BytesIO()
+        assert download_job_file(_service, 'job-1', 'state_file', buffer) == 0
+        assert buffer.getvalue() == b''
+
+    @pytest.mark.parametrize('chunk_size', [5, 4096])
+    @responses.activate
+    def test_decompress(self, chunk_size):
+        """
+        Base64 encoded, compressed content is decoded and decompressed on the fly.
+        """
+        content = _STATE.encode('utf-8') * 100
+        mock_files(job_file_data(base64.encodebytes(gzip.compress(content)).decode('ascii')))
+        buffer = io.BytesIO()
+
+        written = download_job_file(
+            _service, 'job-1', 'state_file', buffer, base64_content=True, decompress=True, chunk_size=chunk_size
+        )
+
+        assert buffer.getvalue() == content
+        assert written == len(content)
+
+    @responses.activate
+    def test_missing_content(self, tmp_path):
+        """
+        A response without file content raises and leaves no file behind.
+        """
+        mock_files(json.dumps({'job_id': 'job-1', 'file_content': None}))
+        dest = tmp_path / 'plan.json'
+        with pytest.raises(ValueError):
+            download_job_file(_service, 'job-1', 'plan_json', str(dest))
+        assert not dest.exists()
+
+    @responses.activate
+    def test_truncated_response(self):
+        """
+        A truncated response raises.
+        """
+        mock_files(job_file_data(_STATE)[:-20])
+        with pytest.raises(ValueError):
+            download_job_file(_service, 'job-1', 'state_file', io.BytesIO())
+
+    @responses.activate
+    def test_errors(self, tmp_path):
+        """
+        Errors of the service are raised and leave no file behind.
+        """
+        mock_files('{"errors": [{"message": "not found"}]}', status=404)
+        dest = tmp_path / 'terraform.tfstate'
+        with pytest.raises(ApiException):
+            download_job_file(_service, 'job-1', 'state_file', str(dest))
+        assert not dest.exists()
+        with pytest.raises(ValueError):
+            download_job_file(_service, 'job-1', 'state_file', str(dest), chunk_size=0)
@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the instrumentation module
+"""
+
+import asyncio
+import json
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import pytest
+import responses
+from ibm_schematics.instrumentation import CallRecord, Histogram, Instrumentation, MetricsRegistry
+from ibm_schematics.ratelimit import RateLimiter
+from ibm_schematics.schematics_v1 import SchematicsV1
+from ibm_schematics.schematics_2_0_api_v2 import Schematics20ApiV2
+
+_base_url = 'https://schematics.cloud.ibm.com'
+
+
+@pytest.fixture(name='service')
+def fixture_service():
+    """
+    Returns a new service instance.
+    """
+    service = SchematicsV1(authenticator=NoAuthAuthenticator())
+    service.set_service_url(_base_url)
+    return service
+
+
+class _Span:
+    def __init__(self, name, attributes):
+        self.name = name
+        self.attributes = dict(attributes)
+        self.exceptions = []
+        self.ended = False
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def record_exception(self, exception):
+        self.exceptions.append(exception)
+
+    def end(self):
+        self.ended = True
+
+
+class _Tracer:
+    def __init__(self):
+        self.spans = []
+
+    def start_span(self, name, attributes=None, **kwargs):  # pylint: disable=unused-argument
+        span = _Span(name, attributes or {})
+        self.spans.append(span)
+        return span
+
+
+class TestHistogram:
+    """
+    Test Class for Histogram
+    """
+
+    def test_observe(self):
+        """
+        Values are counted in their bucket.
+        """
+        histogram = Histogram((1, 10))
+        for value in (0.5, 1, 5, 50):
+            histogram.observe(value)
+        assert histogram.counts == [2, 1, 1]
+        assert histogram.count == 4
+        assert histogram.sum == 56.5
+        assert histogram.mean == 14.125
+        assert (histogram.min, histogram.max) == (0.5, 50)
+
+    def test_quantile(self):
+        """
+        Quantiles are interpolated within their bucket and bounded by the values.
+        """
+        histogram = Histogram((1, 2, 4))
+        assert histogram.quantile(0.5) is None
+        for value in (0.5, 1.5, 1.5, 3):
+            histogram.observe(value)
+        assert histogram.quantile(0) == 0.5
+        assert histogram.quantile(0.5) == 1.5
+        assert histogram.quantile(1) == 3
+        with pytest.raises(ValueError):
+            histogram.quantile(2)
+
+    def test_invalid_buckets(self):
+        """
+        Buckets must increase.
+        """
+        with pytest.raises(ValueError):
+            Histogram(())
+        with pytest.raises(ValueError):
+            Histogram((2, 1))
+
+
+class TestMetricsRegistry:
+    """
+    Test Class for MetricsRegistry
+    """
+
+    def test_summary(self):
+        """
+        Operations are summarized by decreasing total latency.
+        """
+        registry = MetricsRegistry()
+        registry.record(CallRecord('get_job', 'SchematicsV1', 0.2, 200, 0, 100))
+        registry.record(CallRecord('get_job', 'SchematicsV1', 0.3, 404, 0, 10, error='ApiException'))
+        registry(CallRecord('list_workspaces', 'SchematicsV1', 1.0, 200, 0, 5000, retries=2))
+
+        first, second = registry.summary()
+        assert first.operation == 'list_workspaces'
+        assert (first.calls, first.retries, first.response_bytes) == (1, 2, 5000)
+        assert second.operation == 'get_job'
+        assert (second.calls, second.errors, second.status_codes) == (2, 1, {200: 1, 404: 1})
+        assert second.total_latency == pytest.approx(0.5)
+        assert 'get_job: 2 calls, 1 errors' in str(second)
+        assert registry.operations == ['get_job', 'list_workspaces']
+        assert registry.histogram('get_job', 'response_bytes').sum == 110
+        assert registry.histogram('get_workspace') is None
+        with pytest.raises(ValueError):
+            registry.histogram('get_job', 'size')
+
+        registry.reset()
+        assert not registry.summary()
+
+
+class TestInstrumentation:
+    """
+    Test Class for Instrumentation
+    """
+
+    @responses.activate
+    def test_records(self, service):
+        """
+        Each call is recorded with its status and sizes.
+        """
+        responses.add(responses.GET, _base_url + '/v1/workspaces/ws-1', json={'id': 'ws-1'})
+        responses.add(responses.POST, _base_url + '/v2/jobs', json={'id': 'job-1'}, status=201)
+        records = []
+        instrumentation = Instrumentation(listeners=[records.append])
+        instrumentation.attach(service)
+
+        service.get_workspace(w_id='ws-1')
+        service.create_job(refresh_token='token', command_object='workspace')
+
+        get, create = records
+        assert (get.operation, get.service, get.status_code, get.error) == ('get_workspace', 'SchematicsV1', 200, None)
+        assert get.request_bytes == 0
+        assert get.response_bytes == len(json.dumps({'id': 'ws-1'}))
+        assert get.latency > 0
+        assert create.status_code == 201
+        assert create.request_bytes == len(responses.calls[1].request.body)
+        assert instrumentation.registry.histogram('create_job').count == 1
+
+    @responses.activate
+    def test_errors(self, service):
+        """
+        Failed calls are recorded with their status and error.
+        """
+        responses.add(responses.GET, _base_url + '/v2/jobs/job-1', status=404, json={'error': 'not found'})
+        instrumentation = Instrumentation()
+        instrumentation.attach(service)
+
+        with pytest.raises(ApiException):
+            service.get_job(job_id='job-1')
+        with pytest.raises(ValueError):
+            service.get_job(job_id=None)
+
+        (summary,) = instrumentation.registry.summary()
+        assert (summary.calls, summary.errors, summary.status_codes) == (2, 2, {404: 1})
+
+    @responses.activate
+    def test_retries(self, service, monkeypatch):
+        """
+        Requests sent again by a rate limiter are counted as retries.
+        """
+        monkeypatch.setattr('ibm_schematics.ratelimit.time.sleep', lambda delay: None)
+        responses.add(responses.GET, _base_url + '/v2/jobs/job-1', status=429, json={}, headers={'Retry-After': '0'})
+        responses.add(responses.GET, _base_url + '/v2/jobs/job-1', json={'id': 'job-1'})
+        records = []
+        RateLimiter().attach(service)
+        Instrumentation(listeners=[records.append]).attach(service)
+
+        service.get_job(job_id='job-1')
+
+        assert records[0].retries == 1
+        assert records[0].status_code == 200
+
+    @responses.activate
+    def test_spans(self, service):
+        """
+        Each call is recorded as a span with its measurements.
+        """
+        responses.add(responses.GET, _base_url + '/v2/jobs/job-1', json={'id': 'job-1'})
+        responses.add(responses.GET, _base_url + '/v2/jobs/job-2', status=500, json={'error': 'failed'})
+        tracer = _Tracer()
+        Instrumentation(tracer=tracer).attach(service)
+
+        service.get_job(job_id='job-1')
+        with pytest.raises(ApiException):
+            service.get_job(job_id='job-2')
+
+        ok, failed = tracer.spans
+        assert ok.name == 'schematics.get_job'
+        assert ok.attributes['rpc.method'] == 'get_job'
+        assert ok.attributes['http.response.status_code'] == 200
+        assert ok.ended and not ok.exceptions
+        assert failed.attributes['http.response.status_code'] == 500
+        assert isinstance(failed.exceptions[0], ApiException)
+
+    @responses.activate
+    def test_failing_listener(self, service):
+        """
+        The errors of listeners do not fail the call.
+        """
+        responses.add(responses.GET, _base_url + '/v2/jobs/job-1', json={'id': 'job-1'})
+
+        def listener(record):
+            raise RuntimeError(record)
+
+        Instrumentation(listeners=[listener]).attach(service)
+        assert service.get_job(job_id='job-1').get_status_code() == 200
+
+    @responses.activate
+    def test_operations_and_detach(self, service):
+        """
+        Only the configured operations are measured, until detached.
+        """
+        responses.add(responses.GET, _base_url + '/v2/jobs/job-1', json={'id': 'job-1'})
+        instrumentation = Instrumentation(operations=('get_job',))
+        instrumentation.attach(service)
+        assert 'get_workspace' not in vars(service)
+
+        instrumentation.detach(service)
+        service.get_job(job_id='job-1')
+        assert 'get_job' not in vars(service)
+        assert not instrumentation.registry.summary()
+
+        with pytest.raises(ValueError):
+            Instrumentation(operations=('get_nothing',)).attach(service)
+
+    def test_every_operation(self):
+        """
+        Every operation of a service is measured by default.
+        """
+        service = Schematics20ApiV2(authenticator=NoAuthAuthenticator())
+        Instrumentation().attach(service)
+        assert 'list_workspaces' in vars(service)
+        assert 'new_instance' not in vars(service)
+        assert 'send' not in vars(service)
+
+    def test_async_service(self):
+        """
+        Calls of asyncio services are measured too.
+        """
+        httpx = pytest.importorskip('httpx')
+        from ibm_schematics.aio import AsyncSchematicsV1  # pylint: disable=import-outside-toplevel
+
+        def handler(request):  # pylint: disable=unused-argument
+            return httpx.Response(200, json={'id': 'job-1'})
+
+        records = []
+
+        async def run():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            service = AsyncSchematicsV1(authenticator=NoAuthAuthenticator(), http_client=http_client)
+            service.set_service_url(_base_url)
+            Instrumentation(listeners=[records.append]).attach(service)
+            return await service.get_job(job_id='job-1')
+
+        assert asyncio.run(run()).get_status_code() == 200
+        assert (records[0].operation, records[0].status_code) == ('get_job', 200)
+        assert records[0].response_bytes == len(json.dumps({'id': 'job-1'}).replace(' ', ''))
@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the json_codec module
+"""
+
+import json
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import pytest
+import requests
+import responses
+from ibm_schematics.json_codec import JsonCodec, available_codecs, get_codec
+from ibm_schematics.schematics_v1 import SchematicsV1
+from ibm_schematics.schematics_2_0_api_v2 import Schematics20ApiV2
+
+_base_url = 'https://schematics.cloud.ibm.com'
+
+_JOB = {
+    'id': 'us-south.JOB.job-1.1a2b3c4d',
+    'command_object': 'workspace',
+    'command_name': 'workspace_plan',
+    'submitted_at': '2024-03-05T14:21:07.123Z',
+    'duration': '3.5s',
+    'status': {'workspace_job_status': {'status_code': 'job_finished', 'flow_status': []}},
+    'data': {'job_type': 'repo_download_job', 'inputs': [{'name': 'count', 'value': '3', 'metadata': {}}]},
+    'tags': ['env:dev', 'ünïcode ✓', ''],
+    'ratio': 0.1,
+    'count': 9007199254740993,
+    'nothing': None,
+}
+
+
+@pytest.fixture(name='service')
+def fixture_service():
+    """
+    Returns a new service instance.
+    """
+    service = SchematicsV1(authenticator=NoAuthAuthenticator())
+    service.set_service_url(_base_url)
+    return service
+
+
+@pytest.fixture(name='codec', params=['orjson', 'ujson', 'json'])
+def fixture_codec(request):
+    """
+    Returns each codec, skipping those that are not installed.
+    """
+    if request.param != 'json':
+        pytest.importorskip(request.param)
+    return get_codec(request.param)
+
+
+##############################################################################
+# region
+# Test Class for get_codec
+##############################################################################
+
+
+class TestGetCodec:
+    """
+    Test Class for get_codec
+    """
+
+    def test_auto_picks_the_first_available(self):
+        """
+        get_codec('auto') returns the preferred codec that is installed.
+        """
+        assert available_codecs()[-1] == 'json'
+        assert get_codec().name == available_codecs()[0]
+
+    def test_unknown_name(self):
+        """
+        get_codec() rejects unknown names.
+        """
+        with pytest.raises(ValueError, match='name must be one of'):
+            get_codec('simplejson')
+
+    def test_missing_codec(self, monkeypatch):
+        """
+        get_codec() raises ImportError when the codec is not installed.
+        """
+        monkeypatch.setitem(__import__('sys').modules, 'ujson', None)
+        with pytest.raises(ImportError):
+            get_codec('ujson')
+        assert 'ujson' not in available_codecs()
+
+
+##############################################################################
+# endregion
+##############################################################################
+
+##############################################################################
+# region
+# Test Class for JsonCodec
+##############################################################################
+
+
+class TestJsonCodec:
+    """
+    Test Class for JsonCodec
+    """
+
+    @responses.activate
+    def test_responses_are_identical(self, service, codec):
+        """
+        Responses parse to the same values as without a codec.
+        """
+        body = json.dumps(_JOB)
+        responses.add(responses.GET, _base_url + '/v2/jobs/job-1', body=body, content_type='application/json')
+        expected = service.get_job(job_id='job-1')
+        codec.attach(service)
+        response = service.get_job(job_id='job-1')
+        assert response.get_result() == expected.get_result()
+        assert type(response.get_result()['count']) is int  # pylint: disable=unidiomatic-typecheck
+        assert response.get_status_code() == 200
+        assert response.get_headers()['Content-Type'] == 'application/json'
+
+    @pytest.mark.parametrize(
+        'body',
+        [
+            '{"count": 18446744073709551616, "negative": -9223372036854775809}',
+            '{"description": "line\tbreak\nhere"}',
+            '{"ratio": NaN, "big": Infinity}',
+            '{"text": "\\ud800"}',
+        ],
+    )
+    @responses.activate
+    def test_documents_the_codec_cannot_parse_exactly(self, service, codec, body):
+        """
+        Documents the codec does not parse like the standard library are parsed by the standard library.
+        """
+        responses.add(responses.GET, _base_url + '/v2/jobs/job-1', body=body, content_type='application/json')
+        expected = json.dumps(service.get_job(job_id='job-1').get_result())
+        codec.attach(service)
+        assert json.dumps(service.get_job(job_id='job-1').get_result()) == expected
+
+    @responses.activate
+    def test_invalid_json(self, service, codec):
+        """
+        A response that is not JSON raises the same error as without a codec.
+        """
+        responses.add(responses.GET, _base_url + '/v2/jobs/job-1', body='{"id": ', content_type='application/json')
+        with pytest.raises(ApiException) as expected:
+            service.get_job(job_id='job-1')
+        codec.attach(service)
+        with pytest.raises(ApiException) as raised:
+            service.get_job(job_id='job-1')
+        assert raised.value.message == expected.value.message == 'Error processing the HTTP response'
+        assert raised.value.status_code == 200
+
+    @responses.activate
+    def test_responses_that_are_not_json(self, service, codec):
+        """
+        Empty and non-JSON responses are returned as without a codec.
+        """
+        codec.attach(service)
+        responses.add(responses.DELETE, _base_url + '/v2/jobs/job-1', status=204)
+        responses.add(
+            responses.GET,
+            _base_url + '/v1/workspaces/ws-1/runtime_data/t-1/log_store',
+            body='plain text',
+            content_type='text/plain',
+        )
+        responses.add(responses.GET, _base_url + '/v2/jobs/job-2', body='', content_type='application/json')
+        assert service.delete_job(job_id='job-1', refresh_token='token').get_result() is None
+        result = service.get_template_logs(w_id='ws-1', t_id='t-1').get_result()
+        assert isinstance(result, requests.Response)
+        assert result.text == 'plain text'
+        assert service.get_job(job_id='job-2').get_result() is None
+
+    @responses.activate
+    def test_errors(self, service, codec):
+        """
+        Error responses raise ApiException as without a codec.
+        """
+        codec.attach(service)
+        responses.add(
+            responses.GET,
+            _base_url + '/v2/jobs/job-1',
+            json={'errors': [{'message': 'not found'}]},
+            status=404,
+        )
+        with pytest.raises(ApiException) as raised:
+            service.get_job(job_id='job-1')
+        assert raised.value.status_code == 404
+        assert raised.value.message == 'not found'
+
+    @responses.activate
+    def test_streamed_responses(self, service, codec):
+        """
+        Streamed responses are left to the caller.
+        """
+        codec.attach(service)
+        responses.add(responses.GET, _base_url + '/v2/jobs/job-1', json=_JOB)
+        request = service.prepare_request(method='GET', url='/v2/jobs/job-1')
+        result = service.send(request, stream=True).get_result()
+        assert isinstance(result, requests.Response)
+        assert result.json() == _JOB
+
+    @pytest.mark.parametrize(
+        'call',
+        [
+            lambda service: service.create_workspace(
+                name='ws ✓', location='us-south', tags=['a', 'b'], description='a\tb', resource_group='Default'
+            ),
+            lambda service: service.create_action(name='action', location='us-south', inputs=[], tags=['é']),
+            lambda service: service.create_job(
+                refresh_token='token',
+                command_object='workspace',
+                command_object_id='ws-1',
+                command_name='workspace_plan',
+                command_parameter='-var count=18446744073709551616',
+            ),
+        ],
+        ids=['create_workspace', 'create_action', 'create_job'],
+    )
+    @responses.activate
+    def test_request_bodies_are_identical(self, service, codec, call):
+        """
+        Request bodies carry the same values as without a codec.
+        """
+        for path in ('/v1/workspaces', '/v2/actions', '/v2/jobs'):
+            responses.add(responses.POST, _base_url + path, json=_JOB, status=201)
+        expected = call(service).get_result()
+        codec.attach(service)
+        assert call(service).get_result() == expected
+        first, second = (json.loads(call.request.body) for call in responses.calls)
+        assert first == second
+        assert responses.calls[1].request.headers['Content-Type'] == 'application/json'
+
+    def test_dumps_falls_back_to_the_standard_library(self, codec):
+        """
+        Values the codec cannot serialize are serialized by the standard library.
+        """
+        value = {1: 'key', 'big': 2**70, 'nested': [{'a': None}]}
+        assert json.loads(codec.dumps(value)) == json.loads(json.dumps(value))
+
+    def test_v2_service(self, codec):
+        """
+        Codecs attach to Schematics20ApiV2 instances too.
+        """
+        service = Schematics20ApiV2(authenticator=NoAuthAuthenticator())
+        codec.attach(service)
+        assert service.json_dumps.__json_codec__ is codec
+        assert service.send.__json_codec__ is codec
+
+    def test_detach(self, service, codec):
+        """
+        detach() restores the standard library.
+        """
+        codec.attach(service)
+        get_codec('json').attach(service)
+        assert service.send.__json_codec__.name == 'json'
+        codec.detach(service)
+        assert 'send' not in vars(service)
+        assert 'json_dumps' not in vars(service)
+        assert service.json_dumps is json.dumps
+
+    def test_async_service(self, codec):
+        """
+        Codecs cannot be attached to asyncio service instances.
+        """
+        pytest.importorskip('httpx')
+        from ibm_schematics.aio import AsyncSchematicsV1  # pylint: disable=import-outside-toplevel
+
+        with pytest.raises(ValueError, match='synchronous'):
+            codec.attach(AsyncSchematicsV1(authenticator=NoAuthAuthenticator()))
+
+    def test_repr(self):
+        """
+        JsonCodec has a readable repr.
+        """
+        assert repr(JsonCodec('json', json.loads, json.dumps)) == "JsonCodec('json')"
+
+
+##############################################################################
+# endregion
+##############################################################################
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the lazy imports of the package and the models
+"""
+
+import json
+import subprocess
+import sys
+import pytest
+import ibm_schematics
+from ibm_schematics import schematics_v1, schematics_v1_models
+
+
+def loaded_modules(statements: str) -> dict:
+    """Run statements in a new interpreter and return which SDK modules they loaded."""
+    script = '\n'.join(
+        [
+            'import json, sys',
+            statements,
+            'names = ["ibm_cloud_sdk_core", "ibm_schematics.schematics_v1", "ibm_schematics.schematics_v1_models"]',
+            'print(json.dumps({name: name in sys.modules for name in names}))',
+        ]
+    )
+    output = subprocess.run([sys.executable, '-c', script], check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+class TestLazyImports:
+    """
+    Test that importing the package and the service does not load what is not used.
+    """
+
+    def test_import_package(self):
+        assert loaded_modules('import ibm_schematics') == {
+            'ibm_cloud_sdk_core': False,
+            'ibm_schematics.schematics_v1': False,
+            'ibm_schematics.schematics_v1_models': False,
+        }
+
+    def test_service_without_models(self):
+        modules = loaded_modules(
+            '\n'.join(
+                [
+                    'from ibm_cloud_sdk_core.authenticators import NoAuthAuthenticator',
+                    'from ibm_schematics import SchematicsV1',
+                    'SchematicsV1(authenticator=NoAuthAuthenticator())',
+                ]
+            )
+        )
+        assert modules == {
+            'ibm_cloud_sdk_core': True,
+            'ibm_schematics.schematics_v1': True,
+            'ibm_schematics.schematics_v1_models': False,
+        }
+
+    def test_models_load_on_first_access(self):
+        assert loaded_modules('from ibm_schematics.schematics_v1 import Job')['ibm_schematics.schematics_v1_models']
+
+    def test_package_attributes(self):
+        assert ibm_schematics.SchematicsV1 is schematics_v1.SchematicsV1
+        assert ibm_schematics.ApiException.__module__.startswith('ibm_cloud_sdk_core')
+        assert 'SchematicsV1' in dir(ibm_schematics)
+        with pytest.raises(AttributeError):
+            ibm_schematics.NoSuchAttribute  # pylint: disable=pointless-statement
+
+    def test_star_import(self):
+        namespace = {}
+        exec('from ibm_schematics import *', namespace)  # pylint: disable=exec-used
+        assert namespace['SchematicsV1'] is schematics_v1.SchematicsV1
+        assert set(ibm_schematics.__all__) <= set(namespace)
+        assert loaded_modules('from ibm_schematics import *')['ibm_schematics.schematics_v1']
+
+    def test_module_attributes(self):
+        assert schematics_v1.Job is schematics_v1_models.Job
+        assert 'Job' in dir(schematics_v1)
+        assert set(schematics_v1_models.__all__) <= set(schematics_v1.__all__)
+        assert 'SchematicsV1' in schematics_v1.__all__
+        with pytest.raises(AttributeError):
+            schematics_v1.NoSuchModel  # pylint: disable=pointless-statement
+        with pytest.raises(AttributeError):
+            schematics_v1.json_dumps  # pylint: disable=pointless-statement
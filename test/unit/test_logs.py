@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the logs module
+"""
+
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import base64
+import pytest
+import responses
+from ibm_schematics import logs
+from ibm_schematics.logs import tail_job_logs
+from ibm_schematics.schematics_v1 import SchematicsV1
+
+_service = SchematicsV1(authenticator=NoAuthAuthenticator())
+
+_base_url = 'https://schematics.cloud.ibm.com'
+_service.set_service_url(_base_url)
+
+
+@pytest.fixture(name='sleeps')
+def fixture_sleeps(monkeypatch):
+    """
+    Replaces time.sleep in the logs module and records the requested delays.
+    """
+    delays = []
+    monkeypatch.setattr(logs.time, 'sleep', delays.append)
+    return delays
+
+
+def add_job(status_code):
+    """
+    Registers a get_job mock response with the specified status code.
+    """
+    body = {'id': 'j1', 'status': {'workspace_job_status': {'status_code': status_code}}}
+    responses.add(responses.GET, _base_url + '/v2/jobs/j1', json=body, status=200)
+
+
+def add_log(text):
+    """
+    Registers a list_job_logs mock response holding the specified log text.
+    """
+    body = {'job_id': 'j1', 'details': base64.b64encode(text.encode('utf-8')).decode('ascii')}
+    responses.add(responses.GET, _base_url + '/v2/jobs/j1/logs', json=body, status=200)
+
+
+class TestTailJobLogs:
+    """
+    Test Class for tail_job_logs
+    """
+
+    @responses.activate
+    def test_tail_job_logs_yields_new_lines_only(self, sleeps):
+        """
+        Each line is yielded once, incomplete lines wait for their newline.
+        """
+        add_job('job_in_progress')
+        add_log('Initializing\nTerraform pl')
+        add_job('job_in_progress')
+        add_log('Initializing\nTerraform plan\n')
+        add_job('job_in_progress')
+        add_log('Initializing\nTerraform plan\n')
+        add_job('job_finished')
+        add_log('Initializing\nTerraform plan\nApply complé\nDone')
+
+        lines = list(tail_job_logs(_service, 'j1', initial_interval=1, max_interval=4))
+
+        assert lines == ['Initializing', 'Terraform plan', 'Apply complé', 'Done']
+        assert len(sleeps) == 3
+        # The interval only backs off while the log is idle.
+        assert sleeps[1] <= 1 < sleeps[2]
+
+    @responses.activate
+    def test_tail_job_logs_without_follow(self, sleeps):
+        """
+        With follow=False the current log is yielded once, without checking the job.
+        """
+        add_log('line 1\r\nline 2')
+
+        assert list(tail_job_logs(_service, 'j1', follow=False)) == ['line 1', 'line 2']
+        assert len(responses.calls) == 1
+        assert not sleeps
+
+    @responses.activate
+    def test_tail_job_logs_restarts_after_truncation(self, sleeps):
+        """
+        A log that shrinks is read again from the start.
+        """
+        add_job('job_in_progress')
+        add_log('old line one\nold line two\n')
+        add_job('job_finished')
+        add_log('new\n')
+
+        assert list(tail_job_logs(_service, 'j1')) == ['old line one', 'old line two', 'new']
+
+    @responses.activate
+    def test_tail_job_logs_timeout(self, sleeps, monkeypatch):
+        """
+        tail_job_logs() raises TimeoutError while the job is still running.
+        """
+        add_job('job_in_progress')
+        add_log('working\n')
+        clock = iter([0, 10])
+        monkeypatch.setattr(logs.time, 'monotonic', lambda: next(clock))
+
+        lines = tail_job_logs(_service, 'j1', timeout=5)
+        assert next(lines) == 'working'
+        with pytest.raises(TimeoutError):
+            next(lines)
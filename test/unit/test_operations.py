@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the operations module
+"""
+
+import io
+from ibm_cloud_sdk_core.authenticators import BearerTokenAuthenticator
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import pytest
+import responses
+from ibm_schematics.common import get_sdk_headers
+from ibm_schematics.operations import HeaderTemplate, header_template, prepare_operation
+from ibm_schematics.schematics_v1 import SchematicsV1
+from ibm_schematics.schematics_2_0_api_v2 import Schematics20ApiV2
+
+_base_url = 'https://schematics.cloud.ibm.com'
+
+
+@pytest.fixture(name='service')
+def fixture_service():
+    """
+    Returns a new service instance.
+    """
+    service = SchematicsV1(authenticator=NoAuthAuthenticator())
+    service.set_service_url(_base_url)
+    return service
+
+
+def _generic_request(service, operation_id, *, content_type=None, accept=None, parameters=None, caller=None, **kwargs):
+    """Build a request the way the operations did before prepare_operation."""
+    headers = dict(parameters or {})
+    headers.update(get_sdk_headers(service_name='schematics', service_version='V1', operation_id=operation_id))
+    if content_type is not None:
+        headers['content-type'] = content_type
+    if caller is not None:
+        headers.update(caller)
+    if accept is not None:
+        headers['Accept'] = accept
+    return service.prepare_request(headers=headers, **kwargs)
+
+
+def _normalized(request):
+    return dict(request, headers=dict(request['headers']))
+
+
+##############################################################################
+# region
+# Test Class for HeaderTemplate
+##############################################################################
+
+
+class TestHeaderTemplate:
+    """
+    Test Class for HeaderTemplate
+    """
+
+    def test_build(self):
+        """
+        build() applies the headers in order of precedence.
+        """
+        template = HeaderTemplate({'User-Agent': 'sdk'}, content_type='application/json', accept='application/json')
+        assert template.build() == {
+            'User-Agent': 'sdk',
+            'content-type': 'application/json',
+            'Accept': 'application/json',
+        }
+        built = template.build(
+            {'refresh_token': 'token', 'User-Agent': 'parameter'},
+            {'User-Agent': 'caller', 'content-type': 'text/plain', 'Accept': 'text/plain'},
+        )
+        assert built == {
+            'refresh_token': 'token',
+            'User-Agent': 'caller',
+            'content-type': 'text/plain',
+            'Accept': 'application/json',
+        }
+
+    def test_build_returns_copies(self):
+        """
+        build() returns a new dict on every call.
+        """
+        template = HeaderTemplate({'User-Agent': 'sdk'})
+        template.build()['User-Agent'] = 'changed'
+        assert template.build() == {'User-Agent': 'sdk'}
+
+    def test_immutable(self):
+        """
+        Header templates cannot be changed.
+        """
+        template = HeaderTemplate({'User-Agent': 'sdk'}, accept='application/json')
+        with pytest.raises(TypeError):
+            template.headers['Accept'] = 'text/plain'
+        with pytest.raises(AttributeError):
+            template.accept = 'text/plain'
+        assert repr(template) == "HeaderTemplate({'User-Agent': 'sdk', 'Accept': 'application/json'})"
+
+    def test_header_template_is_computed_once(self):
+        """
+        header_template() returns the same template for every call of an operation.
+        """
+        first = header_template('schematics', 'V1', 'get_job', None, 'application/json')
+        assert header_template('schematics', 'V1', 'get_job', None, 'application/json') is first
+        assert header_template('schematics', 'V1', 'get_job', None, None) is not first
+
+
+##############################################################################
+# endregion
+##############################################################################
+
+##############################################################################
+# region
+# Test Class for prepare_operation
+##############################################################################
+
+
+class TestPrepareOperation:
+    """
+    Test Class for prepare_operation
+    """
+
+    @pytest.mark.parametrize(
+        'arguments',
+        [
+            {},
+            {'accept': 'application/json'},
+            {'accept': 'application/json', 'params': {'limit': 10, 'offset': None, 'profile': True}},
+            {'parameters': {'refresh_token': 'token', 'X-Github-token': None, 'force': False}},
+            {'caller': {'X-Request-Id': 'abc', 'Accept': 'text/plain', 'User-Agent': 'mine'}},
+            {'content_type': 'application/json', 'accept': 'application/json', 'data': '{"name": "ws ✓"}'},
+            {'content_type': 'application/json', 'data': b'{"name": "ws"}'},
+            {'data': {'name': 'ws', 'description': None}},
+            {'files': {'file': ('file.tar', io.BytesIO(b'tar'), 'application/octet-stream'), 'other': None}},
+        ],
+    )
+    def test_same_request_as_prepare_request(self, service, arguments):
+        """
+        prepare_operation() builds the request that prepare_request() does.
+        """
+        content_type = arguments.get('content_type')
+        accept = arguments.get('accept')
+        parameters = arguments.get('parameters')
+        caller = arguments.get('caller')
+        extra = {key: arguments[key] for key in ('params', 'data', 'files') if key in arguments}
+        expected = _generic_request(
+            service,
+            'create_job',
+            content_type=content_type,
+            accept=accept,
+            parameters=parameters,
+            caller=caller,
+            method='POST',
+            url='/v2/jobs',
+            **extra,
+        )
+        kwargs = {'headers': caller} if caller is not None else {}
+        request = prepare_operation(
+            service,
+            'V1',
+            'create_job',
+            kwargs,
+            method='POST',
+            url='/v2/jobs',
+            content_type=content_type,
+            accept=accept,
+            headers=parameters,
+            **extra,
+        )
+        assert _normalized(request) == _normalized(expected)
+        assert not kwargs
+
+    @pytest.mark.parametrize('data', [None, 'body'])
+    def test_service_configuration(self, service, data):
+        """
+        prepare_operation() applies the default headers and authenticator of the service.
+        """
+        service.authenticator = BearerTokenAuthenticator('token')
+        service.set_default_headers({'X-Default': 'yes', 'Accept': 'text/plain'})
+        expected = _generic_request(
+            service, 'update_job', accept='application/json', method='PUT', url='/v2/jobs/1', data=data
+        )
+        request = prepare_operation(
+            service, 'V1', 'update_job', {}, method='PUT', url='/v2/jobs/1', accept='application/json', data=data
+        )
+        assert _normalized(request) == _normalized(expected)
+        assert request['headers']['Authorization'] == 'Bearer token'
+        assert request['headers']['X-Default'] == 'yes'
+
+    def test_compression(self, service):
+        """
+        prepare_operation() compresses request bodies when the service does.
+        """
+        service.set_enable_gzip_compression(True)
+        request = prepare_operation(service, 'V1', 'create_job', {}, method='POST', url='/v2/jobs', data='body')
+        assert request['headers']['content-encoding'] == 'gzip'
+        assert request['data'] != b'body'
+
+    def test_service_url_is_required(self):
+        """
+        prepare_operation() requires the service URL.
+        """
+        service = SchematicsV1(authenticator=NoAuthAuthenticator())
+        service.service_url = None
+        with pytest.raises(ValueError, match='service_url'):
+            prepare_operation(service, 'V1', 'get_job', {}, method='GET', url='/v2/jobs/1')
+
+    @responses.activate
+    def test_operations(self, service):
+        """
+        Operations of both services send the headers they used to.
+        """
+        responses.add(responses.GET, _base_url + '/v1/version', json={})
+        responses.add(responses.POST, _base_url + '/v2/jobs', json={}, status=201)
+        service.get_schematics_version(headers={'X-Request-Id': 'abc', 'Accept': 'text/plain'})
+        service.create_job(refresh_token='token', command_object='workspace', headers={'content-type': 'text/json'})
+        v2_service = Schematics20ApiV2(authenticator=NoAuthAuthenticator())
+        v2_service.set_service_url(_base_url)
+        responses.add(responses.GET, _base_url + '/v2/info', json={})
+        v2_service.get_schematics_info(headers={'X-Request-Id': 'def'})
+
+        version, job, info = (call.request.headers for call in responses.calls)
+        assert version['X-Request-Id'] == 'abc'
+        assert version['Accept'] == 'application/json'
+        assert version['User-Agent'].startswith('schematics-python-sdk.git/')
+        assert job['refresh_token'] == 'token'
+        assert job['Content-Type'] == 'text/json'
+        assert info['X-Request-Id'] == 'def'
+        assert info['Accept'] == 'application/json'
+
+
+##############################################################################
+# endregion
+##############################################################################
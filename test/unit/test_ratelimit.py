@@ -0,0 +1,306 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the ratelimit module
+"""
+
+import asyncio
+import io
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import pytest
+import responses
+from ibm_schematics import ratelimit
+from ibm_schematics.ratelimit import RateLimiter, TokenBucket, endpoint_family, retry_after
+from ibm_schematics.schematics_v1 import SchematicsV1
+
+_base_url = 'https://schematics.cloud.ibm.com'
+
+
+def new_service():
+    """
+    Returns a new service instance, so that limiters attached in one test do not leak into others.
+    """
+    service = SchematicsV1(authenticator=NoAuthAuthenticator())
+    service.set_service_url(_base_url)
+    return service
+
+
+@pytest.fixture(name='clock')
+def fixture_clock(monkeypatch):
+    """
+    Replaces time.monotonic and time.sleep in the ratelimit module with a clock that
+    only moves when sleeping, and records the requested delays.
+    """
+
+    class Clock:
+        """A fake clock."""
+
+        def __init__(self):
+            self.now = 1000.0
+            self.sleeps = []
+
+        def monotonic(self):
+            """Return the current time."""
+            return self.now
+
+        def sleep(self, delay):
+            """Record the delay and move the clock forward."""
+            self.sleeps.append(delay)
+            self.now += delay
+
+    clock = Clock()
+    monkeypatch.setattr(ratelimit.time, 'monotonic', clock.monotonic)
+    monkeypatch.setattr(ratelimit.time, 'sleep', clock.sleep)
+    return clock
+
+
+class TestTokenBucket:
+    """
+    Test Class for TokenBucket
+    """
+
+    def test_bursts_up_to_the_capacity(self, clock):
+        """
+        A full bucket lets `capacity` requests through without waiting.
+        """
+        bucket = TokenBucket(rate=2, capacity=3)
+        assert [bucket.acquire() for _ in range(3)] == [0, 0, 0]
+        assert not clock.sleeps
+
+    def test_waits_for_the_rate(self, clock):
+        """
+        Once empty, the bucket lets one request through every 1 / rate seconds.
+        """
+        bucket = TokenBucket(rate=2, capacity=1)
+        for _ in range(4):
+            bucket.acquire()
+        assert clock.sleeps == [0.5, 0.5, 0.5]
+
+    def test_reservations_queue_up(self, clock):
+        """
+        Each reservation waits behind the previous ones.
+        """
+        bucket = TokenBucket(rate=4, capacity=1)
+        assert [bucket.reserve() for _ in range(3)] == [0, 0.25, 0.5]
+
+    def test_tokens_refill_over_time(self, clock):
+        """
+        Tokens accumulate while the bucket is idle, up to the capacity.
+        """
+        bucket = TokenBucket(rate=1, capacity=2)
+        bucket.acquire()
+        bucket.acquire()
+        clock.now += 10
+        assert [bucket.reserve() for _ in range(3)] == [0, 0, 1]
+
+    def test_invalid_parameters(self):
+        """
+        Invalid rates, capacities and token counts are rejected.
+        """
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+        with pytest.raises(ValueError):
+            TokenBucket(rate=1, capacity=0.5)
+        with pytest.raises(ValueError):
+            TokenBucket(rate=1).acquire(2)
+
+
+def test_endpoint_family():
+    """
+    The family is the API version and the first resource of the path.
+    """
+    assert endpoint_family(_base_url + '/v1/workspaces/ws-1/apply') == '/v1/workspaces'
+    assert endpoint_family(_base_url + '/v2/jobs') == '/v2/jobs'
+    assert endpoint_family('https://proxy.example.com/schematics/v2/agents/a-1?profile=summary') == '/v2/agents'
+    assert endpoint_family(_base_url + '/status') == '/status'
+
+
+def test_retry_after():
+    """
+    Retry-After is read in seconds or as an HTTP date.
+    """
+    assert retry_after('3') == 3
+    assert retry_after('Mon, 01 Jan 2001 00:00:00 GMT') == 0
+    assert 0 < retry_after('Fri, 01 Jan 2100 00:00:00 GMT')
+    assert retry_after('soon') is None
+    assert retry_after(None) is None
+
+
+class TestRateLimiter:
+    """
+    Test Class for RateLimiter
+    """
+
+    @responses.activate
+    def test_requests_are_paced_per_family(self, clock):
+        """
+        Each family is paced by its own bucket; other families are not paced without a default rate.
+        """
+        responses.add(responses.GET, _base_url + '/v2/jobs/job-1', json={})
+        responses.add(responses.GET, _base_url + '/v1/workspaces/ws-1', json={})
+        service = RateLimiter({'/v2/jobs': 1}).attach(new_service())
+
+        for _ in range(3):
+            service.get_job(job_id='job-1')
+            service.get_workspace(w_id='ws-1')
+
+        assert clock.sleeps == [1, 1]
+        assert len(responses.calls) == 6
+
+    @responses.activate
+    def test_default_rate(self, clock):
+        """
+        Families without a rate get a bucket of their own with the default rate.
+        """
+        responses.add(responses.GET, _base_url + '/v2/jobs/job-1', json={})
+        responses.add(responses.GET, _base_url + '/v2/actions/action-1', json={})
+        service = RateLimiter(default_rate=0.5).attach(new_service())
+
+        service.get_job(job_id='job-1')
+        service.get_action(action_id='action-1')
+        service.get_job(job_id='job-1')
+
+        assert clock.sleeps == [2]
+
+    @responses.activate
+    def test_throttled_requests_honor_retry_after(self, clock):
+        """
+        A 429 pauses the family for the Retry-After delay, then the request is retried.
+        """
+        responses.add(responses.GET, _base_url + '/v2/jobs/job-1', status=429, headers={'Retry-After': '3'})
+        responses.add(responses.GET, _base_url + '/v2/jobs/job-1', json={'id': 'job-1'})
+        service = RateLimiter().attach(new_service())
+
+        assert service.get_job(job_id='job-1').get_result() == {'id': 'job-1'}
+        assert clock.sleeps == [3]
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_backoff_without_retry_after(self, clock):
+        """
+        Without Retry-After the delays grow exponentially with jitter, and the last 429 is raised.
+        """
+        responses.add(responses.GET, _base_url + '/v2/jobs/job-1', status=429)
+        service = RateLimiter(max_retries=3, initial_interval=1, max_interval=3).attach(new_service())
+
+        with pytest.raises(ApiException) as exc_info:
+            service.get_job(job_id='job-1')
+
+        assert exc_info.value.status_code == 429
+        assert len(responses.calls) == 4
+        for delay, interval in zip(clock.sleeps, [1, 2, 3]):
+            assert interval / 2 <= delay <= interval
+
+    @responses.activate
+    def test_pause_is_shared(self, clock):
+        """
+        A 429 received by one service instance holds back the requests of the others.
+        """
+        responses.add(responses.GET, _base_url + '/v2/jobs/job-1', status=429, headers={'Retry-After': '5'})
+        limiter = RateLimiter(max_retries=0)
+        first = limiter.attach(new_service())
+        second = limiter.attach(new_service())
+
+        with pytest.raises(ApiException):
+            first.get_job(job_id='job-1')
+        clock.now += 2
+        with pytest.raises(ApiException):
+            second.get_job(job_id='job-1')
+
+        assert clock.sleeps == [3]
+
+    @responses.activate
+    def test_other_errors_are_raised(self, clock):
+        """
+        Errors other than 429 are neither retried nor delayed.
+        """
+        responses.add(responses.GET, _base_url + '/v2/jobs/job-1', status=503)
+        service = RateLimiter().attach(new_service())
+
+        with pytest.raises(ApiException):
+            service.get_job(job_id='job-1')
+        assert len(responses.calls) == 1
+        assert not clock.sleeps
+
+    @responses.activate
+    def test_uploads_are_not_retried(self, clock):
+        """
+        A request whose body is a file is not sent twice.
+        """
+        responses.add(
+            responses.PUT,
+            _base_url + '/v2/actions/action-1/template_repo_upload',
+            status=429,
+            headers={'Retry-After': '1'},
+        )
+        service = RateLimiter().attach(new_service())
+
+        with pytest.raises(ApiException):
+            service.upload_template_tar_action('action-1', file=io.BytesIO(b'tar'))
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_detach(self):
+        """
+        detach restores the send method of the service.
+        """
+        limiter = RateLimiter()
+        service = limiter.attach(new_service())
+        limiter.detach(service)
+        assert 'send' not in vars(service)
+
+    def test_async_service(self, clock, monkeypatch):
+        """
+        Requests of asyncio services are paced with asyncio.sleep.
+        """
+        httpx = pytest.importorskip('httpx')
+        from ibm_schematics.aio import AsyncSchematicsV1  # pylint: disable=import-outside-toplevel
+
+        statuses = [429, 200]
+        delays = []
+
+        async def sleep(delay):
+            delays.append(delay)
+
+        monkeypatch.setattr(ratelimit.asyncio, 'sleep', sleep)
+
+        def handler(request):  # pylint: disable=unused-argument
+            return httpx.Response(statuses.pop(0), json={}, headers={'Retry-After': '2'})
+
+        async def run():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            service = AsyncSchematicsV1(authenticator=NoAuthAuthenticator(), http_client=http_client)
+            service.set_service_url(_base_url)
+            RateLimiter().attach(service)
+            return await service.get_job(job_id='job-1')
+
+        assert asyncio.run(run()).get_status_code() == 200
+        assert delays == [2]
+        assert not clock.sleeps
+
+    def test_invalid_parameters(self):
+        """
+        Invalid rates, retries and intervals are rejected.
+        """
+        with pytest.raises(ValueError):
+            RateLimiter(default_rate=0)
+        with pytest.raises(ValueError):
+            RateLimiter({'/v2/jobs': -1})
+        with pytest.raises(ValueError):
+            RateLimiter(max_retries=-1)
+        with pytest.raises(ValueError):
+            RateLimiter(initial_interval=5, max_interval=1)
@@ -631,6 +631,150 @@ class TestListWorkspaces:
         _service.disable_retries()
         self.test_list_workspaces_required_params()
 
+    @responses.activate
+    def test_list_workspaces_with_pager_get_next(self):
+        """
+        test_list_workspaces_with_pager_get_next()
+        """
+        # Set up a two-page mock response
+        url = preprocess_url('/v1/workspaces')
+        mock_response1 = '{"count":2,"limit":1,"offset":0,"workspaces":[{"id":"w1"}]}'
+        mock_response2 = '{"count":2,"limit":1,"offset":1,"workspaces":[{"id":"w2"}]}'
+        responses.add(responses.GET, url, body=mock_response1, content_type='application/json', status=200)
+        responses.add(responses.GET, url, body=mock_response2, content_type='application/json', status=200)
+
+        # Exercise the pager class for this operation
+        all_results = []
+        pager = WorkspacesPager(
+            client=_service,
+            limit=1,
+            profile='ids',
+            resource_group='testString',
+        )
+        while pager.has_next():
+            next_page = pager.get_next()
+            assert next_page is not None
+            all_results.extend(next_page)
+        assert len(all_results) == 2
+        assert isinstance(all_results[0], WorkspaceResponse)
+        assert [w.id for w in all_results] == ['w1', 'w2']
+        assert len(responses.calls) == 2
+        query_string = urllib.parse.unquote_plus(responses.calls[1].request.url.split('?', 1)[1])
+        assert 'offset=1' in query_string
+        assert 'limit=1' in query_string
+
+    @responses.activate
+    def test_list_workspaces_with_pager_get_all(self):
+        """
+        test_list_workspaces_with_pager_get_all()
+        """
+        # Set up a two-page mock response
+        url = preprocess_url('/v1/workspaces')
+        mock_response1 = '{"count":2,"limit":1,"offset":0,"workspaces":[{"id":"w1"}]}'
+        mock_response2 = '{"count":2,"limit":1,"offset":1,"workspaces":[{"id":"w2"}]}'
+        responses.add(responses.GET, url, body=mock_response1, content_type='application/json', status=200)
+        responses.add(responses.GET, url, body=mock_response2, content_type='application/json', status=200)
+
+        # Exercise the pager class for this operation
+        pager = WorkspacesPager(
+            client=_service,
+            limit=1,
+            profile='ids',
+            resource_group='testString',
+        )
+        all_results = pager.get_all()
+        assert all_results is not None
+        assert len(all_results) == 2
+        assert not pager.has_next()
+        with pytest.raises(StopIteration):
+            pager.get_next()
+
+    @responses.activate
+    def test_list_workspaces_with_pager_prefetch(self):
+        """
+        test_list_workspaces_with_pager_prefetch()
+        """
+        # Set up a four-page mock response, one page per offset window
+        url = preprocess_url('/v1/workspaces')
+        for offset in range(0, 7, 2):
+            ids = ['"w{}"'.format(i) for i in range(offset, min(offset + 2, 7))]
+            body = '{{"count":7,"limit":2,"offset":{},"workspaces":[{}]}}'.format(
+                offset, ','.join('{{"id":{}}}'.format(i) for i in ids)
+            )
+            responses.add(
+                responses.GET,
+                url,
+                body=body,
+                content_type='application/json',
+                status=200,
+                match=[responses.matchers.query_param_matcher({'offset': str(offset), 'limit': '2'})],
+            )
+
+        # Exercise the pager class for this operation
+        pager = WorkspacesPager(client=_service, limit=2)
+        all_results = list(pager.prefetch(max_workers=3))
+        assert [w.id for w in all_results] == ['w{}'.format(i) for i in range(7)]
+        assert len(responses.calls) == 4
+        assert not pager.has_next()
+
+    @responses.activate
+    def test_list_workspaces_with_pager_prefetch_capped_pages(self):
+        """
+        test_list_workspaces_with_pager_prefetch_capped_pages()
+        """
+        # The server returns at most 2 records per page, whatever the limit
+        url = preprocess_url('/v1/workspaces')
+
+        def capped(request):
+            offset = int(request.params['offset'])
+            page = [{'id': 'w{}'.format(i)} for i in range(offset, min(offset + 2, 7))]
+            return (200, {}, json.dumps({'count': 7, 'limit': 2, 'offset': offset, 'workspaces': page}))
+
+        responses.add_callback(responses.GET, url, callback=capped, content_type='application/json')
+
+        pager = WorkspacesPager(client=_service, limit=5)
+        assert [w.id for w in pager.prefetch(max_workers=3)] == ['w{}'.format(i) for i in range(7)]
+        assert len(responses.calls) == 4
+        assert not pager.has_next()
+
+    @responses.activate
+    def test_list_workspaces_with_pager_prefetch_short_page(self):
+        """
+        test_list_workspaces_with_pager_prefetch_short_page()
+        """
+        # A page shorter than the first one leaves the rest to be fetched serially
+        url = preprocess_url('/v1/workspaces')
+
+        def shortened(request):
+            offset = int(request.params['offset'])
+            size = 1 if offset == 3 else 3
+            page = [{'id': 'w{}'.format(i)} for i in range(offset, min(offset + size, 9))]
+            return (200, {}, json.dumps({'count': 9, 'limit': 3, 'offset': offset, 'workspaces': page}))
+
+        responses.add_callback(responses.GET, url, callback=shortened, content_type='application/json')
+
+        pager = WorkspacesPager(client=_service, limit=3)
+        assert [w.id for w in pager.prefetch(max_workers=2)] == ['w{}'.format(i) for i in range(9)]
+        assert not pager.has_next()
+
+    @responses.activate
+    def test_list_workspaces_with_pager_prefetch_without_count(self):
+        """
+        test_list_workspaces_with_pager_prefetch_without_count()
+        """
+        # Without a count the remaining pages are fetched serially
+        url = preprocess_url('/v1/workspaces')
+        mock_response1 = '{"limit":2,"offset":0,"workspaces":[{"id":"w1"},{"id":"w2"}]}'
+        mock_response2 = '{"limit":2,"offset":2,"workspaces":[{"id":"w3"}]}'
+        responses.add(responses.GET, url, body=mock_response1, content_type='application/json', status=200)
+        responses.add(responses.GET, url, body=mock_response2, content_type='application/json', status=200)
+
+        pager = WorkspacesPager(client=_service, limit=2)
+        assert [w.id for w in pager.prefetch()] == ['w1', 'w2', 'w3']
+        assert len(responses.calls) == 2
+        with pytest.raises(ValueError):
+            next(WorkspacesPager(client=_service).prefetch(max_workers=0))
+
 
 class TestCreateWorkspace:
     """
@@ -6333,6 +6477,39 @@ class TestListJobs:
         _service.disable_retries()
         self.test_list_jobs_required_params()
 
+    @responses.activate
+    def test_list_jobs_with_pager_iter(self):
+        """
+        test_list_jobs_with_pager_iter()
+        """
+        # Set up a three-page mock response; the pager stops on total_count
+        url = preprocess_url('/v2/jobs')
+        mock_response1 = '{"total_count":5,"limit":2,"offset":0,"jobs":[{"id":"j1"},{"id":"j2"}]}'
+        mock_response2 = '{"total_count":5,"limit":2,"offset":2,"jobs":[{"id":"j3"},{"id":"j4"}]}'
+        mock_response3 = '{"total_count":5,"limit":2,"offset":4,"jobs":[{"id":"j5"}]}'
+        responses.add(responses.GET, url, body=mock_response1, content_type='application/json', status=200)
+        responses.add(responses.GET, url, body=mock_response2, content_type='application/json', status=200)
+        responses.add(responses.GET, url, body=mock_response3, content_type='application/json', status=200)
+
+        # Exercise the pager class for this operation
+        pager = JobsPager(
+            client=_service,
+            limit=2,
+            resource='workspaces',
+            workspace_id='testString',
+        )
+        iterator = iter(pager)
+        first = next(iterator)
+        assert isinstance(first, JobLite)
+        assert first.id == 'j1'
+        # Only the first page has been requested so far
+        assert len(responses.calls) == 1
+        assert [j.id for j in iterator] == ['j2', 'j3', 'j4', 'j5']
+        assert len(responses.calls) == 3
+        query_string = urllib.parse.unquote_plus(responses.calls[2].request.url.split('?', 1)[1])
+        assert 'offset=4' in query_string
+        assert 'workspace_id=testString' in query_string
+
 
 class TestCreateJob:
     """
@@ -10125,6 +10302,27 @@ class TestListAgentData:
         _service.disable_retries()
         self.test_list_agent_data_required_params()
 
+    @responses.activate
+    def test_list_agent_data_with_pager_get_all(self):
+        """
+        test_list_agent_data_with_pager_get_all()
+        """
+        # Set up a two-page mock response without a total count
+        url = preprocess_url('/v2/agents')
+        mock_response1 = '{"limit":2,"offset":0,"agents":[{"name":"a1"},{"name":"a2"}]}'
+        mock_response2 = '{"limit":2,"offset":2,"agents":[{"name":"a3"}]}'
+        responses.add(responses.GET, url, body=mock_response1, content_type='application/json', status=200)
+        responses.add(responses.GET, url, body=mock_response2, content_type='application/json', status=200)
+
+        # Exercise the pager class for this operation; a short page ends the listing
+        pager = AgentDataPager(
+            client=_service,
+            limit=2,
+        )
+        all_results = pager.get_all()
+        assert [a.name for a in all_results] == ['a1', 'a2', 'a3']
+        assert len(responses.calls) == 2
+
 
 class TestCreateAgentData:
     """
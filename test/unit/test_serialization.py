@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the serialization module
+"""
+
+import copy
+import datetime
+import pickle
+import pytest
+from ibm_schematics import schematics_2_0_api_v2, schematics_v1, schematics_v1_models
+from ibm_schematics.schematics_v1 import Job, JobList, JobLite, JobStatus, VariableData
+from ibm_schematics.serialization import (
+    BYTES,
+    DATETIME,
+    MODEL,
+    MODEL_LIST,
+    PLAIN,
+    fast_from_dict,
+    fast_to_dict,
+    field_specs,
+    hydrate,
+    is_lazy,
+    lazy_from_dict,
+)
+
+job_json = {
+    'command_object': 'workspace',
+    'command_object_id': 'us-south.workspace.myworkspace.1234',
+    'command_name': 'workspace_apply',
+    'inputs': [{'name': 'region', 'value': 'us-south', 'metadata': {'type': 'string', 'secure': False}}],
+    'id': 'us-south.JOB.myworkspace.5678',
+    'submitted_at': '2024-01-30T10:00:00Z',
+    'start_at': '2024-01-30T10:00:05Z',
+    'status': {
+        'workspace_job_status': {
+            'workspace_name': 'myworkspace',
+            'status_code': 'job_finished',
+            'updated_at': '2024-01-30T10:05:00Z',
+        }
+    },
+    'data': {'job_type': 'workspace', 'workspace_job_data': {'workspace_name': 'myworkspace'}},
+    'log_summary': {'job_id': 'us-south.JOB.myworkspace.5678', 'elapsed_time': 12.5},
+    'updated_at': '2024-01-30T10:05:00Z',
+}
+
+job_list_json = {
+    'total_count': 2,
+    'offset': 0,
+    'limit': 100,
+    'jobs': [
+        {'id': 'job-1', 'submitted_at': '2024-01-30T10:00:00Z', 'status': job_json['status']},
+        {'id': 'job-2', 'submitted_at': '2024-01-30T11:00:00Z'},
+    ],
+}
+
+
+def model_classes(module):
+    """Return the model classes defined in a service module."""
+    return [
+        cls
+        for cls in vars(module).values()
+        if isinstance(cls, type) and cls.__module__ == module.__name__ and hasattr(cls, 'from_dict')
+    ]
+
+
+class TestFieldSpecs:
+    """
+    Test the field specifications derived from the models.
+    """
+
+    def test_job_field_specs(self):
+        specs = {spec.name: spec for spec in field_specs(Job)}
+        assert specs['id'].kind == PLAIN
+        assert specs['submitted_at'].kind == DATETIME
+        assert specs['status'].kind == MODEL and specs['status'].model is JobStatus
+        assert specs['inputs'].kind == MODEL_LIST and specs['inputs'].model is VariableData
+        assert not any(spec.required for spec in specs.values())
+        assert field_specs(Job) is field_specs(Job)
+
+    def test_required_and_bytes_fields(self):
+        specs = {spec.name: spec for spec in field_specs(JobList)}
+        assert specs['limit'].required and specs['offset'].required
+        assert not specs['jobs'].required
+        kinds = {spec.kind for cls in model_classes(schematics_v1_models) for spec in field_specs(cls)}
+        assert kinds == {PLAIN, DATETIME, BYTES, MODEL, MODEL_LIST}
+
+    @pytest.mark.parametrize('module', [schematics_v1_models, schematics_2_0_api_v2])
+    def test_every_model_has_a_spec(self, module):
+        for cls in model_classes(module):
+            specs = field_specs(cls)
+            assert specs
+            assert all(spec.model.__module__ == module.__name__ for spec in specs if spec.model is not None)
+            if not any(spec.required for spec in specs):
+                assert fast_to_dict(fast_from_dict(cls, {})) == cls.from_dict({}).to_dict()
+
+
+class TestLazyFromDict:
+    """
+    Test lazily hydrated models.
+    """
+
+    def test_conversions_are_deferred(self):
+        job = lazy_from_dict(Job, job_json)
+        assert isinstance(job, Job)
+        assert is_lazy(job)
+        assert job.id == 'us-south.JOB.myworkspace.5678'
+        assert 'status' not in job.__dict__
+        assert 'submitted_at' not in job.__dict__
+        assert job.end_at is None
+
+        status = job.status
+        assert is_lazy(status)
+        assert job.status is status
+        assert status.workspace_job_status.status_code == 'job_finished'
+        assert job.submitted_at == datetime.datetime(2024, 1, 30, 10, 0, tzinfo=datetime.timezone.utc)
+
+    def test_same_as_from_dict(self):
+        lazy_job = lazy_from_dict(Job, job_json)
+        job = Job.from_dict(job_json)
+        assert lazy_job.to_dict() == job.to_dict() == Job.from_dict(job.to_dict()).to_dict()
+        assert lazy_job == job
+        assert job == lazy_from_dict(Job, job_json)
+        assert str(lazy_from_dict(Job, job_json)) == str(job)
+        assert lazy_job != Job.from_dict(dict(job_json, id='other'))
+
+    def test_list_items_are_lazy(self):
+        job_list = lazy_from_dict(JobList, job_list_json)
+        assert [job.id for job in job_list.jobs] == ['job-1', 'job-2']
+        assert all(isinstance(job, JobLite) and is_lazy(job) for job in job_list.jobs)
+        assert 'status' not in job_list.jobs[0].__dict__
+        assert job_list == JobList.from_dict(job_list_json)
+
+    def test_required_properties(self):
+        with pytest.raises(ValueError, match='Required property \'limit\' not present in JobList JSON'):
+            lazy_from_dict(JobList, {'offset': 0})
+
+    def test_additional_properties_of_v2_models(self):
+        action_list_json = {'limit': 10, 'offset': 0, 'actions': [{'name': 'a1'}], 'extra': 'value'}
+        action_list = lazy_from_dict(schematics_2_0_api_v2.ActionList, action_list_json)
+        assert action_list.extra == 'value'
+        assert action_list.to_dict() == schematics_2_0_api_v2.ActionList.from_dict(action_list_json).to_dict()
+        assert action_list == schematics_2_0_api_v2.ActionList.from_dict(action_list_json)
+
+    def test_hydrate(self):
+        job_list = hydrate(lazy_from_dict(JobList, job_list_json))
+        assert 'jobs' in job_list.__dict__
+        assert 'status' in job_list.jobs[0].__dict__
+        assert 'workspace_job_status' in job_list.jobs[0].status.__dict__
+        job = Job.from_dict(job_json)
+        assert hydrate(job) is job
+
+    def test_copy_and_pickle_produce_eager_models(self):
+        job = lazy_from_dict(Job, job_json)
+        for other in (copy.deepcopy(job), pickle.loads(pickle.dumps(job))):
+            assert type(other) is Job
+            assert not is_lazy(other)
+            assert other == Job.from_dict(job_json)
+
+
+class TestFastFromDictToDict:
+    """
+    Test the generated conversions.
+    """
+
+    def test_same_as_from_dict_and_to_dict(self):
+        job = fast_from_dict(Job, job_json)
+        assert type(job) is Job
+        assert job == Job.from_dict(job_json)
+        assert list(vars(job)) == list(vars(Job.from_dict(job_json)))
+        assert type(job.status.workspace_job_status) is schematics_v1.JobStatusWorkspace
+        assert fast_to_dict(job) == job.to_dict()
+        assert list(fast_to_dict(job)) == list(job.to_dict())
+        assert fast_from_dict(JobList, job_list_json) == JobList.from_dict(job_list_json)
+
+    def test_to_dict_of_other_models(self):
+        lazy_job = lazy_from_dict(Job, job_json)
+        assert fast_to_dict(lazy_job) == Job.from_dict(job_json).to_dict()
+        job = Job.from_dict(job_json)
+        job.status = job.status.to_dict()
+        del job.inputs
+        assert fast_to_dict(job) == job.to_dict()
+        assert 'inputs' not in fast_to_dict(job)
+
+    def test_required_properties(self):
+        with pytest.raises(ValueError, match='Required property \'limit\' not present in JobList JSON'):
+            fast_from_dict(JobList, {'offset': 0, 'limit': None})
+        with pytest.raises(ValueError, match='Required property \'offset\' not present in ActionList JSON'):
+            fast_from_dict(schematics_2_0_api_v2.ActionList, {'limit': 10})
+
+    def test_additional_properties_of_v2_models(self):
+        action_list_json = {'limit': 10, 'offset': 0, 'actions': [{'name': 'a1', 'extra': 1}], 'extra': 'value'}
+        action_list = fast_from_dict(schematics_2_0_api_v2.ActionList, action_list_json)
+        assert action_list == schematics_2_0_api_v2.ActionList.from_dict(action_list_json)
+        assert action_list.actions[0].extra == 1
+        assert fast_to_dict(action_list) == action_list_json
+
+    def test_bytes(self):
+        job_log_json = {'job_id': 'job-1', 'details': 'bG9nIGxpbmUK'}
+        job_log = fast_from_dict(schematics_v1.JobLog, job_log_json)
+        assert job_log.details == b'log line\n'
+        assert fast_to_dict(job_log) == schematics_v1.JobLog.from_dict(job_log_json).to_dict() == job_log_json
@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the statecache module
+"""
+
+import hashlib
+import json
+import os
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import pytest
+import responses
+from ibm_schematics.schematics_v1 import SchematicsV1
+from ibm_schematics.statecache import (
+    StateCache,
+    get_job_state,
+    get_template_state,
+    get_workspace_states,
+    state_key,
+)
+
+_service = SchematicsV1(authenticator=NoAuthAuthenticator())
+
+_base_url = 'https://schematics.cloud.ibm.com'
+_service.set_service_url(_base_url)
+
+_state_stores_url = _base_url + '/v1/workspaces/ws-1/state_stores'
+_template_state_url = _base_url + '/v1/workspaces/ws-1/runtime_data/t-1/state_store'
+_job_files_url = _base_url + '/v2/jobs/job-1/files'
+
+_state = {'version': 4, 'terraform_version': '1.5.7', 'serial': 3, 'lineage': 'lineage-1', 'resources': []}
+
+
+@pytest.fixture(name='cache')
+def fixture_cache(tmp_path):
+    """
+    Returns a state cache in a temporary directory.
+    """
+    return StateCache(str(tmp_path / 'cache'))
+
+
+def _objects(cache):
+    return sorted(name for _, _, names in os.walk(os.path.join(cache.path, 'objects')) for name in names)
+
+
+class TestStateKey:
+    """
+    Test Class for state_key
+    """
+
+    def test_keys(self):
+        """
+        The keys of templates, templates at a job and jobs.
+        """
+        assert state_key(w_id='ws-1', t_id='t-1') == 'workspace:ws-1:t-1'
+        assert state_key(w_id='ws-1', t_id='t-1', job_id='job-1') == 'workspace:ws-1:t-1:job-1'
+        assert state_key(job_id='job-1') == 'job:job-1'
+
+    def test_invalid(self):
+        """
+        A template needs both IDs, and some ID is required.
+        """
+        with pytest.raises(ValueError):
+            state_key(w_id='ws-1')
+        with pytest.raises(ValueError):
+            state_key()
+
+
+class TestStateCache:
+    """
+    Test Class for StateCache
+    """
+
+    def test_store_and_read(self, cache):
+        """
+        Statefiles are stored once per content, and survive a new cache instance.
+        """
+        entry = cache.store('a', b'{"serial": 1}', etag='"1"')
+        cache.store('b', b'{"serial": 1}')
+        assert entry.digest == hashlib.sha256(b'{"serial": 1}').hexdigest()
+        assert _objects(cache) == [entry.digest]
+        assert cache.read('a') == b'{"serial": 1}'
+        assert cache.read('missing') is None
+
+        reopened = StateCache(cache.path)
+        assert reopened.lookup('a').etag == '"1"'
+        assert reopened.read('b') == b'{"serial": 1}'
+        assert reopened.info().size == len(b'{"serial": 1}')
+
+    def test_lru_eviction(self, cache):
+        """
+        The least recently used statefiles are evicted beyond max_bytes.
+        """
+        cache = StateCache(cache.path, max_bytes=25)
+        cache.store('a', b'a' * 10)
+        cache.store('b', b'b' * 10)
+        cache.read('a')
+        cache.store('c', b'c' * 10)
+        assert cache.lookup('b') is None
+        assert cache.read('a') == b'a' * 10
+        assert cache.read('c') == b'c' * 10
+        assert len(_objects(cache)) == 2
+        assert cache.store('d', b'd' * 30) is None
+
+    def test_shared_content_kept(self, cache):
+        """
+        Evicting a key keeps the statefile other keys refer to.
+        """
+        cache.store('a', b'same')
+        cache.store('b', b'same')
+        cache.forget('a')
+        assert cache.read('b') == b'same'
+        cache.clear()
+        assert not _objects(cache)
+        assert cache.info().entries == 0
+
+    def test_damaged_object(self, cache):
+        """
+        A statefile whose content no longer matches its digest is dropped.
+        """
+        entry = cache.store('a', b'{}')
+        with open(os.path.join(cache.path, 'objects', entry.digest[:2], entry.digest), 'wb') as file:
+            file.write(b'{"damaged": true}')
+        assert cache.read('a') is None
+        assert cache.lookup('a') is None
+
+    def test_unreadable_index(self, cache):
+        """
+        An unreadable index is ignored.
+        """
+        os.makedirs(cache.path)
+        with open(os.path.join(cache.path, 'index.json'), 'w', encoding='utf-8') as file:
+            file.write('not json')
+        assert cache.read('a') is None
+
+
+class TestGetTemplateState:
+    """
+    Test Class for get_template_state
+    """
+
+    @responses.activate
+    def test_revalidated(self, cache):
+        """
+        A stored statefile is revalidated, and returned from the cache on 304.
+        """
+        responses.add(responses.GET, _template_state_url, json=_state, headers={'ETag': '"v1"'})
+        responses.add(responses.GET, _template_state_url, status=304)
+
+        assert get_template_state(_service, 'ws-1', 't-1', cache=cache) == _state
+        assert get_template_state(_service, 'ws-1', 't-1', cache=cache) == _state
+
+        assert 'If-None-Match' not in responses.calls[0].request.headers
+        assert responses.calls[1].request.headers['If-None-Match'] == '"v1"'
+        assert cache.info()[:2] == (1, 1)
+
+    @responses.activate
+    def test_changed(self, cache):
+        """
+        A changed statefile is downloaded and replaces the stored one.
+        """
+        changed = dict(_state, serial=4)
+        responses.add(responses.GET, _template_state_url, json=_state, headers={'ETag': '"v1"'})
+        responses.add(responses.GET, _template_state_url, json=changed, headers={'ETag': '"v2"'})
+
+        get_template_state(_service, 'ws-1', 't-1', cache=cache)
+        assert get_template_state(_service, 'ws-1', 't-1', cache=cache) == changed
+        assert cache.lookup(state_key(w_id='ws-1', t_id='t-1')).etag == '"v2"'
+        assert len(_objects(cache)) == 1
+
+    @responses.activate
+    def test_job(self, cache):
+        """
+        A statefile stored for a job is returned without a request.
+        """
+        responses.add(responses.GET, _template_state_url, json=_state)
+
+        get_template_state(_service, 'ws-1', 't-1', cache=cache, job_id='job-1')
+        assert get_template_state(_service, 'ws-1', 't-1', cache=cache, job_id='job-1') == _state
+        assert len(responses.calls) == 1
+
+        get_template_state(_service, 'ws-1', 't-1', cache=cache, job_id='job-2')
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_not_found(self, cache):
+        """
+        A statefile that no longer exists is dropped from the cache.
+        """
+        responses.add(responses.GET, _template_state_url, json=_state, headers={'ETag': '"v1"'})
+        responses.add(responses.GET, _template_state_url, status=404, json={'error': 'not found'})
+
+        get_template_state(_service, 'ws-1', 't-1', cache=cache)
+        with pytest.raises(ApiException):
+            get_template_state(_service, 'ws-1', 't-1', cache=cache)
+        assert cache.info().entries == 0
+
+
+class TestGetWorkspaceStates:
+    """
+    Test Class for get_workspace_states
+    """
+
+    @responses.activate
+    def test_workspace_states(self, cache):
+        """
+        The statefiles of every template are returned by template ID.
+        """
+        responses.add(
+            responses.GET, _state_stores_url, json={'runtime_data': [{'id': 't-1', 'engine_name': 'terraform'}]}
+        )
+        responses.add(responses.GET, _template_state_url, json=_state)
+
+        assert get_workspace_states(_service, 'ws-1', cache=cache) == {'t-1': _state}
+
+
+class TestGetJobState:
+    """
+    Test Class for get_job_state
+    """
+
+    @responses.activate
+    def test_job_state(self, cache):
+        """
+        The statefile of a job is downloaded once.
+        """
+        responses.add(
+            responses.GET,
+            _job_files_url,
+            json={'job_id': 'job-1', 'file_type': 'state_file', 'file_content': json.dumps(_state)},
+        )
+
+        assert get_job_state(_service, 'job-1', cache=cache) == _state
+        assert get_job_state(_service, 'job-1', cache=cache) == _state
+        assert len(responses.calls) == 1
+        assert cache.info()[:2] == (1, 1)
+
+    @responses.activate
+    def test_no_content(self, cache):
+        """
+        A response without content is an error.
+        """
+        responses.add(responses.GET, _job_files_url, json={'job_id': 'job-1'})
+
+        with pytest.raises(ValueError):
+            get_job_state(_service, 'job-1', cache=cache)
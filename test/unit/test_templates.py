@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the templates module
+"""
+
+import io
+import os
+import tarfile
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import pytest
+import responses
+from ibm_schematics.schematics_v1 import SchematicsV1
+from ibm_schematics.templates import (
+    DigestStore,
+    directory_digest,
+    file_digest,
+    iter_template_tar,
+    template_key,
+    upload_template_dir,
+    upload_template_dir_action,
+    upload_template_tar,
+)
+
+_service = SchematicsV1(authenticator=NoAuthAuthenticator())
+
+_base_url = 'https://schematics.cloud.ibm.com'
+_service.set_service_url(_base_url)
+
+_workspace_upload_url = _base_url + '/v1/workspaces/ws-1/template_data/t-1/template_repo_upload'
+_action_upload_url = _base_url + '/v2/actions/action-1/template_repo_upload'
+
+
+@pytest.fixture(name='store')
+def fixture_store(tmp_path):
+    """
+    Returns a digest store in a temporary directory.
+    """
+    return DigestStore(str(tmp_path / 'store' / 'digests.json'))
+
+
+@pytest.fixture(name='template_dir')
+def fixture_template_dir(tmp_path):
+    """
+    Returns a directory with a small Terraform template.
+    """
+    template_dir = tmp_path / 'template'
+    (template_dir / 'modules').mkdir(parents=True)
+    (template_dir / 'main.tf').write_text('resource "null_resource" "sleep" {}\n')
+    (template_dir / 'modules' / 'variables.tf').write_text('variable "name" {}\n')
+    (template_dir / '.terraform' / 'providers').mkdir(parents=True)
+    (template_dir / '.terraform' / 'providers' / 'provider.bin').write_bytes(b'binary')
+    (template_dir / 'run.sh').write_text('#!/bin/sh\n')
+    (template_dir / 'run.sh').chmod(0o700)
+    return template_dir
+
+
+def read_tar(data):
+    """
+    Returns the names, modes and contents of the members of a tar archive.
+    """
+    with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+        return [(m.name, m.mode, m.mtime, tar.extractfile(m).read() if m.isfile() else m.linkname) for m in tar]
+
+
+def multipart_tar(request):
+    """
+    Returns the tar archive in the file part of a streamed multipart request.
+    """
+    body = request.body if isinstance(request.body, bytes) else b''.join(request.body)
+    boundary = request.headers['Content-Type'].split('boundary=')[1].encode()
+    part = body.split(b'--' + boundary)[1]
+    headers, _, content = part.partition(b'\r\n\r\n')
+    assert b'name="file"; filename="template.tar"' in headers
+    return content[: -len(b'\r\n')]
+
+
+class TestDigests:
+    """
+    Test Class for the digest functions
+    """
+
+    def test_file_digest_restores_the_position(self):
+        """
+        The digest covers the rest of the file, which is not consumed.
+        """
+        file = io.BytesIO(b'headtemplate')
+        file.seek(4)
+        assert file_digest(file) == file_digest(io.BytesIO(b'template'))
+        assert file.tell() == 4
+
+    def test_directory_digest(self, template_dir):
+        """
+        The digest changes with the content and the names of the files, but not with their timestamps.
+        """
+        digest = directory_digest(str(template_dir))
+        os.utime(template_dir / 'main.tf', (0, 0))
+        assert directory_digest(str(template_dir)) == digest
+
+        (template_dir / 'main.tf').write_text('# changed\n')
+        changed = directory_digest(str(template_dir))
+        assert changed != digest
+
+        (template_dir / 'main.tf').rename(template_dir / 'other.tf')
+        assert directory_digest(str(template_dir)) not in (digest, changed)
+
+        with pytest.raises(ValueError):
+            directory_digest(str(template_dir / 'other.tf'))
+
+
+class TestDigestStore:
+    """
+    Test Class for DigestStore
+    """
+
+    def test_digests_are_persisted(self, store):
+        """
+        Digests are written to the file and read back by another store.
+        """
+        assert store.get('key') is None
+        store.set('key', 'digest')
+        store.set('other', 'digest')
+        store.forget('other')
+        assert DigestStore(store.path).get('key') == 'digest'
+        assert DigestStore(store.path).get('other') is None
+
+    def test_unreadable_store(self, store):
+        """
+        A corrupt file is ignored.
+        """
+        os.makedirs(os.path.dirname(store.path))
+        with open(store.path, 'w', encoding='utf-8') as file:
+            file.write('{')
+        assert store.get('key') is None
+
+
+def test_template_key():
+    """
+    Workspace templates and actions have distinct keys, and exactly one of them must be given.
+    """
+    assert template_key(w_id='ws-1', t_id='t-1') == 'workspace:ws-1:t-1'
+    assert template_key(action_id='action-1') == 'action:action-1'
+    with pytest.raises(ValueError):
+        template_key(w_id='ws-1')
+    with pytest.raises(ValueError):
+        template_key(w_id='ws-1', t_id='t-1', action_id='action-1')
+
+
+class TestUploadTemplateTar:
+    """
+    Test Class for upload_template_tar
+    """
+
+    @responses.activate
+    def test_unchanged_templates_are_skipped(self, store, tmp_path):
+        """
+        The tar is uploaded again only when its content changed.
+        """
+        responses.add(responses.PUT, _workspace_upload_url, json={'id': 't-1'})
+        tar_path = tmp_path / 'template.tar'
+        tar_path.write_bytes(b'tar v1')
+
+        response = upload_template_tar(_service, str(tar_path), w_id='ws-1', t_id='t-1', store=store)
+        assert response.get_result() == {'id': 't-1'}
+        assert b'tar v1' in responses.calls[0].request.body
+        assert upload_template_tar(_service, str(tar_path), w_id='ws-1', t_id='t-1', store=store) is None
+
+        tar_path.write_bytes(b'tar v2')
+        assert upload_template_tar(_service, str(tar_path), w_id='ws-1', t_id='t-1', store=store) is not None
+        assert upload_template_tar(_service, str(tar_path), w_id='ws-1', t_id='t-1', store=store, force=True)
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_actions_and_source_directories(self, store, template_dir):
+        """
+        The digest of the source directory identifies the template, and actions use their own operation.
+        """
+        responses.add(responses.PUT, _action_upload_url, json={'id': 'action-1'})
+
+        for content in [b'built once', b'built again']:
+            upload_template_tar(
+                _service, io.BytesIO(content), action_id='action-1', source_dir=str(template_dir), store=store
+            )
+        assert len(responses.calls) == 1
+        assert store.get('action:action-1') == directory_digest(str(template_dir))
+
+    @responses.activate
+    def test_failed_uploads_are_not_recorded(self, store):
+        """
+        The digest is stored only after a successful upload.
+        """
+        responses.add(responses.PUT, _workspace_upload_url, json={'errors': []}, status=500)
+
+        with pytest.raises(ApiException):
+            upload_template_tar(_service, io.BytesIO(b'tar'), w_id='ws-1', t_id='t-1', store=store)
+        assert store.get('workspace:ws-1:t-1') is None
+
+
+class TestIterTemplateTar:
+    """
+    Test Class for iter_template_tar
+    """
+
+    def test_archive(self, template_dir):
+        """
+        The archive has the files sorted by path, without the default exclusions, timestamps or owners.
+        """
+        data = b''.join(iter_template_tar(str(template_dir)))
+        assert len(data) % tarfile.RECORDSIZE == 0
+        assert read_tar(data) == [
+            ('main.tf', 0o644, 0, b'resource "null_resource" "sleep" {}\n'),
+            ('modules/variables.tf', 0o644, 0, b'variable "name" {}\n'),
+            ('run.sh', 0o755, 0, b'#!/bin/sh\n'),
+        ]
+
+    def test_archive_is_deterministic(self, template_dir):
+        """
+        The same files give the same archive, whatever their timestamps.
+        """
+        data = b''.join(iter_template_tar(str(template_dir)))
+        os.utime(template_dir / 'main.tf', (0, 0))
+        assert b''.join(iter_template_tar(str(template_dir))) == data
+
+    def test_include_and_exclude(self, template_dir):
+        """
+        Only the included files that are not excluded are archived.
+        """
+        names = [m[0] for m in read_tar(b''.join(iter_template_tar(str(template_dir), include=['*.tf'])))]
+        assert names == ['main.tf', 'modules/variables.tf']
+        names = [m[0] for m in read_tar(b''.join(iter_template_tar(str(template_dir), exclude=['modules/', '*.sh'])))]
+        assert names == ['.terraform/providers/provider.bin', 'main.tf']
+
+    def test_large_files_are_chunked(self, tmp_path):
+        """
+        Files are read in chunks of at most chunk_size bytes, and long names are kept.
+        """
+        name = 'd' * 120 + '.tf'
+        (tmp_path / name).write_bytes(b'x' * 10000)
+        (tmp_path / 'link.tf').symlink_to(name)
+        chunks = list(iter_template_tar(str(tmp_path), chunk_size=4096))
+        assert max(len(chunk) for chunk in chunks[:-1]) <= 4096
+        assert read_tar(b''.join(chunks)) == [(name, 0o644, 0, b'x' * 10000), ('link.tf', 0o777, 0, name)]
+
+
+class TestUploadTemplateDir:
+    """
+    Test Class for upload_template_dir and upload_template_dir_action
+    """
+
+    @responses.activate
+    def test_upload_template_dir(self, template_dir):
+        """
+        The archive is streamed in a multipart body with chunked transfer encoding.
+        """
+        responses.add(responses.PUT, _workspace_upload_url, json={'id': 't-1'})
+
+        response = upload_template_dir(_service, 'ws-1', 't-1', str(template_dir), headers={'X-Test': '1'})
+
+        assert response.get_result() == {'id': 't-1'}
+        request = responses.calls[0].request
+        assert request.headers['Transfer-Encoding'] == 'chunked'
+        assert request.headers['X-Test'] == '1'
+        assert 'schematics-python-sdk' in request.headers['User-Agent']
+        assert multipart_tar(request) == b''.join(iter_template_tar(str(template_dir)))
+
+    @responses.activate
+    def test_upload_template_dir_action_skips_unchanged(self, template_dir, store):
+        """
+        With a store, unchanged directories are not uploaded again.
+        """
+        responses.add(responses.PUT, _action_upload_url, json={'id': 'action-1'})
+
+        assert upload_template_dir_action(_service, 'action-1', str(template_dir), store=store) is not None
+        (template_dir / '.terraform' / 'providers' / 'provider.bin').write_bytes(b'changed')
+        assert upload_template_dir_action(_service, 'action-1', str(template_dir), store=store) is None
+        (template_dir / 'main.tf').write_text('# changed\n')
+        assert upload_template_dir_action(_service, 'action-1', str(template_dir), store=store) is not None
+        assert len(responses.calls) == 2
+
+    def test_invalid_parameters(self, template_dir):
+        """
+        Missing IDs and directories are rejected.
+        """
+        with pytest.raises(ValueError):
+            upload_template_dir(_service, 'ws-1', '', str(template_dir))
+        with pytest.raises(ValueError):
+            upload_template_dir_action(_service, '', str(template_dir))
+        with pytest.raises(ValueError):
+            upload_template_dir(_service, 'ws-1', 't-1', str(template_dir / 'main.tf'))
@@ -0,0 +1,332 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the waiters module
+"""
+
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import pytest
+import responses
+import urllib
+from ibm_schematics import waiters
+from ibm_schematics.schematics_v1 import Job, SchematicsV1
+from ibm_schematics.waiters import (
+    Backoff,
+    JobWatcher,
+    job_status_code,
+    wait_for_job,
+    wait_for_workspace_activity,
+    wait_for_workspace_status,
+)
+
+_service = SchematicsV1(authenticator=NoAuthAuthenticator())
+
+_base_url = 'https://schematics.cloud.ibm.com'
+_service.set_service_url(_base_url)
+
+
+@pytest.fixture(name='sleeps')
+def fixture_sleeps(monkeypatch):
+    """
+    Replaces time.sleep in the waiters module and records the requested delays.
+    """
+    delays = []
+    monkeypatch.setattr(waiters.time, 'sleep', delays.append)
+    return delays
+
+
+def workspace_job(status_code):
+    """
+    Returns the JSON body of a workspace job with the specified status code.
+    """
+    return '{{"id": "job-1", "status": {{"workspace_job_status": {{"status_code": "{0}"}}}}}}'.format(status_code)
+
+
+class TestBackoff:
+    """
+    Test Class for Backoff
+    """
+
+    def test_intervals_grow_up_to_the_maximum(self):
+        """
+        The interval doubles until it reaches max_interval; jitter keeps each delay in its upper half.
+        """
+        backoff = Backoff(initial_interval=1, max_interval=5, multiplier=2)
+        delays = [backoff.next_interval() for _ in range(5)]
+        for delay, interval in zip(delays, [1, 2, 4, 5, 5]):
+            assert interval / 2 <= delay <= interval
+        backoff.reset()
+        assert backoff.next_interval() <= 1
+
+    def test_invalid_parameters(self):
+        """
+        Invalid intervals are rejected.
+        """
+        with pytest.raises(ValueError):
+            Backoff(initial_interval=0)
+        with pytest.raises(ValueError):
+            Backoff(initial_interval=10, max_interval=1)
+        with pytest.raises(ValueError):
+            Backoff(multiplier=0.5)
+
+
+class TestWaitForJob:
+    """
+    Test Class for wait_for_job
+    """
+
+    @responses.activate
+    def test_wait_for_job(self, sleeps):
+        """
+        wait_for_job() polls get_job with a growing interval until a terminal status.
+        """
+        url = _base_url + '/v2/jobs/job-1'
+        for status_code in ['job_pending', 'job_in_progress', 'job_in_progress', 'job_finished']:
+            responses.add(
+                responses.GET, url, body=workspace_job(status_code), content_type='application/json', status=200
+            )
+
+        job = wait_for_job(_service, 'job-1', initial_interval=1, max_interval=8)
+
+        assert isinstance(job, Job)
+        assert job_status_code(job) == 'job_finished'
+        assert len(responses.calls) == 4
+        assert len(sleeps) == 3
+        assert sleeps[0] <= 1 < sleeps[2]
+
+    @responses.activate
+    def test_wait_for_job_failure_is_terminal(self, sleeps):
+        """
+        A failed action job ends the wait.
+        """
+        url = _base_url + '/v2/jobs/job-1'
+        body = '{"id": "job-1", "status": {"action_job_status": {"status_code": "job_failed"}}}'
+        responses.add(responses.GET, url, body=body, content_type='application/json', status=200)
+
+        job = wait_for_job(_service, 'job-1')
+
+        assert job_status_code(job) == 'job_failed'
+        assert not sleeps
+
+    @responses.activate
+    def test_wait_for_job_timeout(self, sleeps, monkeypatch):
+        """
+        wait_for_job() raises TimeoutError once the deadline has passed.
+        """
+        url = _base_url + '/v2/jobs/job-1'
+        responses.add(
+            responses.GET, url, body=workspace_job('job_in_progress'), content_type='application/json', status=200
+        )
+        clock = iter([0, 5, 11])
+        monkeypatch.setattr(waiters.time, 'monotonic', lambda: next(clock))
+
+        with pytest.raises(TimeoutError):
+            wait_for_job(_service, 'job-1', timeout=10, initial_interval=10, max_interval=10)
+        assert len(responses.calls) == 2
+        # The sleep never overshoots the deadline.
+        assert sleeps[0] <= 5
+
+
+class TestWaitForWorkspaceStatus:
+    """
+    Test Class for wait_for_workspace_status
+    """
+
+    @responses.activate
+    def test_wait_for_workspace_status(self, sleeps):
+        """
+        wait_for_workspace_status() compares statuses case-insensitively.
+        """
+        url = _base_url + '/v1/workspaces/w1'
+        for status in ['CONNECTING', 'SCANNING', 'INACTIVE']:
+            body = '{{"id": "w1", "status": "{0}"}}'.format(status)
+            responses.add(responses.GET, url, body=body, content_type='application/json', status=200)
+
+        workspace = wait_for_workspace_status(_service, 'w1', ['inactive', 'active'])
+
+        assert workspace.status == 'INACTIVE'
+        assert len(sleeps) == 2
+
+    @responses.activate
+    def test_wait_for_workspace_status_failure(self, sleeps):
+        """
+        A failure status ends the wait unless failure_statuses is overridden.
+        """
+        url = _base_url + '/v1/workspaces/w1'
+        for status in ['FAILED', 'FAILED', 'ACTIVE']:
+            body = '{{"id": "w1", "status": "{0}"}}'.format(status)
+            responses.add(responses.GET, url, body=body, content_type='application/json', status=200)
+
+        assert wait_for_workspace_status(_service, 'w1', ['ACTIVE']).status == 'FAILED'
+        assert wait_for_workspace_status(_service, 'w1', ['ACTIVE'], failure_statuses=()).status == 'ACTIVE'
+        assert len(sleeps) == 1
+
+
+class TestWaitForWorkspaceActivity:
+    """
+    Test Class for wait_for_workspace_activity
+    """
+
+    @responses.activate
+    def test_wait_for_workspace_activity(self, sleeps):
+        """
+        wait_for_workspace_activity() returns the completed activity.
+        """
+        url = _base_url + '/v1/workspaces/w1/actions/a1'
+        for status in ['CREATED', 'INPROGRESS', 'COMPLETED']:
+            body = '{{"action_id": "a1", "status": "{0}"}}'.format(status)
+            responses.add(responses.GET, url, body=body, content_type='application/json', status=200)
+
+        activity = wait_for_workspace_activity(_service, 'w1', 'a1')
+
+        assert activity.status == 'COMPLETED'
+        assert len(sleeps) == 2
+
+
+def job_list(*jobs):
+    """
+    Returns the JSON body of a single page list_jobs response holding the specified (id, status code) pairs.
+    """
+    items = ','.join(
+        '{{"id": "{0}", "status": {{"workspace_job_status": {{"status_code": "{1}"}}}}}}'.format(job_id, status_code)
+        for job_id, status_code in jobs
+    )
+    return '{{"total_count": {0}, "limit": 100, "offset": 0, "jobs": [{1}]}}'.format(len(jobs), items)
+
+
+class TestJobWatcher:
+    """
+    Test Class for JobWatcher
+    """
+
+    @responses.activate
+    def test_jobs_of_a_workspace_share_one_list_call(self, sleeps):
+        """
+        Jobs watched with the same workspace_id are refreshed by a single list_jobs call per poll.
+        """
+        url = _base_url + '/v2/jobs'
+        responses.add(
+            responses.GET,
+            url,
+            body=job_list(('j1', 'job_in_progress'), ('j2', 'job_finished'), ('j3', 'job_pending')),
+            content_type='application/json',
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            url,
+            body=job_list(('j1', 'job_failed'), ('j2', 'job_finished'), ('j3', 'job_finished')),
+            content_type='application/json',
+            status=200,
+        )
+
+        watcher = JobWatcher(_service, interval=5)
+        futures = [watcher.watch(job_id, workspace_id='w1') for job_id in ['j1', 'j2', 'j3']]
+        done = []
+        futures[0].add_done_callback(done.append)
+
+        assert watcher.poll() == 2
+        assert futures[1].done() and not futures[0].done()
+
+        watcher.run_until_complete()
+
+        assert len(responses.calls) == 2
+        query_string = urllib.parse.unquote_plus(responses.calls[0].request.url.split('?', 1)[1])
+        assert 'workspace_id=w1' in query_string
+        assert [job_status_code(f.result()) for f in futures] == ['job_failed', 'job_finished', 'job_finished']
+        assert done == [futures[0]]
+        assert not sleeps
+
+    @responses.activate
+    def test_jobs_without_filter_use_get_job(self, sleeps):
+        """
+        Jobs without a filter, or missing from their group listing, are refreshed with get_job.
+        """
+        responses.add(
+            responses.GET,
+            _base_url + '/v2/jobs',
+            body=job_list(),
+            content_type='application/json',
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            _base_url + '/v2/jobs/j1',
+            body=workspace_job('job_finished'),
+            content_type='application/json',
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            _base_url + '/v2/jobs/j2',
+            body='{"message": "not found"}',
+            content_type='application/json',
+            status=404,
+        )
+
+        watcher = JobWatcher(_service)
+        first = watcher.watch('j1', action_id='a1')
+        second = watcher.watch('j2')
+        assert watcher.watch('j2') is second
+
+        assert watcher.poll() == 0
+        assert job_status_code(first.result()) == 'job_finished'
+        with pytest.raises(ApiException):
+            second.result()
+        assert len(responses.calls) == 3
+        assert not sleeps
+
+    @responses.activate
+    def test_run_until_complete_timeout(self, sleeps):
+        """
+        run_until_complete() raises TimeoutError while jobs are still running.
+        """
+        responses.add(
+            responses.GET,
+            _base_url + '/v2/jobs',
+            body=job_list(('j1', 'job_in_progress')),
+            content_type='application/json',
+            status=200,
+        )
+
+        watcher = JobWatcher(_service, interval=1)
+        future = watcher.watch('j1', resource='workspaces')
+        with pytest.raises(TimeoutError):
+            watcher.run_until_complete(timeout=0)
+        assert not future.done()
+        assert watcher.pending_count() == 1
+
+    @responses.activate
+    def test_start_and_stop(self):
+        """
+        start() polls in a background thread until stop() is called.
+        """
+        responses.add(
+            responses.GET,
+            _base_url + '/v2/jobs/j1',
+            body=workspace_job('job_finished'),
+            content_type='application/json',
+            status=200,
+        )
+
+        watcher = JobWatcher(_service, interval=0.01)
+        future = watcher.watch('j1')
+        watcher.start()
+        try:
+            assert job_status_code(future.result(timeout=5)) == 'job_finished'
+        finally:
+            watcher.stop()